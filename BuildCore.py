@@ -0,0 +1,1229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 
+# Developer : Mohammed Al-Baqer
+
+# Build logic shared by the GUI and the headless `PyToExe.py build` driver.
+# This module must stay free of Qt, matplotlib and other GUI-only imports.
+
+import os
+import re
+import sys
+import ast
+import json
+import time
+import shlex
+import shutil
+import hashlib
+import argparse
+import threading
+import traceback
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import List, Dict, Optional, Any, Callable, Tuple
+
+from ImportAnalyzer import DetectHiddenImports
+
+
+CACHE_DIR = "build_cache"
+PATHSEP = ";" if os.name == "nt" else ":"
+
+def JobName(entry: str) -> str:
+    stem = os.path.splitext(os.path.basename(entry))[0]
+    digest = hashlib.md5(os.path.abspath(entry).encode("utf-8")).hexdigest()[:8]
+    return f"{stem}-{digest}"
+
+def ResolveJobs(jobs: int) -> int:
+    if not jobs or jobs < 1:
+        return os.cpu_count() or 1
+    return jobs
+
+def LocalImports(script_path: str) -> List[str]:
+    base_dir = os.path.dirname(os.path.abspath(script_path))
+
+    def module_files(root: str, dotted: str) -> List[str]:
+        files = []
+        path = root
+        parts = [p for p in dotted.split(".") if p]
+        for i, part in enumerate(parts):
+            path = os.path.join(path, part)
+            init = os.path.join(path, "__init__.py")
+            if os.path.isfile(init):
+                files.append(init)
+            elif i == len(parts) - 1 and os.path.isfile(path + ".py"):
+                files.append(path + ".py")
+            elif not os.path.isdir(path):
+                break
+        return files
+
+    found = []
+    seen = set()
+    pending = [os.path.abspath(script_path)]
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        found.append(path)
+        try:
+            with open(path, "rb") as f:
+                tree = ast.parse(f.read(), filename=path)
+        except Exception:
+            continue
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    pending.extend(module_files(base_dir, alias.name))
+            elif isinstance(node, ast.ImportFrom):
+                root = base_dir
+                if node.level:
+                    root = os.path.dirname(path)
+                    for _ in range(node.level - 1):
+                        root = os.path.dirname(root)
+                module = node.module or ""
+                pending.extend(module_files(root, module))
+                for alias in node.names:
+                    pending.extend(module_files(root, f"{module}.{alias.name}"))
+    return sorted(found)
+
+def SpecInputs(spec_path: str) -> List[str]:
+    # Every existing file or folder named by a string literal in a .spec (entries, datas,
+    # icon, manifest), plus the local modules imported by its entry scripts.
+    try:
+        with open(spec_path, "rb") as f:
+            tree = ast.parse(f.read(), filename=spec_path)
+    except Exception:
+        return []
+    found = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str) and os.path.exists(node.value):
+            found.add(os.path.abspath(node.value))
+            if node.value.endswith(".py"):
+                found.update(LocalImports(node.value))
+    return sorted(found)
+
+def PyInstallerLauncher(python_exec: Optional[str] = None) -> List[str]:
+    # The PyInstaller every build runs and the caches fingerprint: the selected
+    # interpreter's when there is one, otherwise the `pyinstaller` found on PATH.
+    return [python_exec, "-m", "PyInstaller"] if python_exec else ["pyinstaller"]
+
+def PyInstallerPython(python_exec: Optional[str] = None) -> Optional[str]:
+    # Interpreter behind PyInstallerLauncher(), for the warm worker. Without a selected
+    # interpreter it is read from the PATH launcher: pip puts pyinstaller.exe in
+    # <prefix>\Scripts on Windows and writes a shebang elsewhere. None when unknown.
+    if python_exec:
+        return python_exec
+    script = shutil.which("pyinstaller")
+    if not script:
+        return None
+    if os.name == "nt":
+        folder = os.path.dirname(script)
+        return next((p for p in (os.path.join(folder, "python.exe"), os.path.join(os.path.dirname(folder), "python.exe")) if os.path.isfile(p)), None)
+    try:
+        with open(script, "r", encoding="utf-8", errors="replace") as f:
+            first, second = f.readline(), f.readline()
+        if not first.startswith("#!"):
+            return None
+        parts = shlex.split(first[2:])
+        if parts == ["/bin/sh"] and second.startswith("'''exec'"):
+            parts = shlex.split(second)[1:]
+        elif parts and os.path.basename(parts[0]) == "env":
+            parts = [shutil.which(parts[1]) or ""] if len(parts) > 1 else []
+    except (OSError, ValueError):
+        return None
+    return parts[0] if parts and os.path.isfile(parts[0]) else None
+
+_TOOLCHAINS: Dict[tuple, str] = {}
+
+def ToolchainFingerprint(tool: str, python_exec: Optional[str] = None) -> str:
+    launcher = PyInstallerLauncher(python_exec) if tool == "pyinstaller" else [tool]
+    path = launcher[0] if len(launcher) > 1 else shutil.which(tool) or tool
+    key = (path, python_exec)
+    if key not in _TOOLCHAINS:
+        parts = [path]
+        probes = [launcher + ["--version"]]
+        if python_exec:
+            probes.append([python_exec, "--version"])
+        for probe in probes:
+            try:
+                parts.append(subprocess.check_output(probe, stderr=subprocess.STDOUT, text=True, timeout=60).strip())
+            except Exception:
+                parts.append("")
+        _TOOLCHAINS[key] = "|".join(parts)
+    return _TOOLCHAINS[key]
+
+class IncrementalWorkspace:
+    STAMP_FILE = ".pytoexe_stamp"
+
+    def __init__(self, python_exec: Optional[str] = None):
+        self.python_exec = python_exec
+
+    def _stamp_path(self, cmd: List[str]) -> Optional[str]:
+        if "--workpath" not in cmd:
+            return None
+        return os.path.join(cmd[cmd.index("--workpath") + 1], self.STAMP_FILE)
+
+    def Fingerprint(self, cmd: List[str]) -> str:
+        h = hashlib.sha256()
+        h.update(ToolchainFingerprint(cmd[0], self.python_exec).encode("utf-8"))
+        h.update("\0".join(str(a) for a in cmd if a != "--clean").encode("utf-8"))
+        return h.hexdigest()
+
+    def Prepare(self, cmd: List[str]) -> List[str]:
+        cmd = [a for a in cmd if a != "--clean"]
+        stamp = self._stamp_path(cmd)
+        if not stamp:
+            return cmd
+        try:
+            with open(stamp, "r", encoding="utf-8") as f:
+                previous = f.read().strip()
+        except OSError:
+            previous = ""
+        if previous != self.Fingerprint(cmd):
+            cmd.insert(1, "--clean")
+        return cmd
+
+    def Commit(self, cmd: List[str], ok: bool):
+        stamp = self._stamp_path(cmd)
+        if not stamp:
+            return
+        try:
+            if ok:
+                os.makedirs(os.path.dirname(stamp), exist_ok=True)
+                with open(stamp, "w", encoding="utf-8") as f:
+                    f.write(self.Fingerprint(cmd))
+            elif os.path.isfile(stamp):
+                os.remove(stamp)
+        except OSError as e:
+            print(f"[Incremental] Failed to update {stamp}: {e}")
+
+class BuildCache:
+    NEUTRAL_ARGS = {"--clean", "--noconfirm"}
+
+    def __init__(self, cache_dir=CACHE_DIR, max_mb: int = 2048):
+        self.cache_dir = cache_dir
+        self.max_bytes = max(1, max_mb) * 1024 * 1024
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _load_index(self) -> Dict[str, Dict]:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _save_index(self, index: Dict[str, Dict]):
+        tmp = self.index_path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(index, f, ensure_ascii=False, indent=2)
+            os.replace(tmp, self.index_path)
+        except Exception as e:
+            print(f"[Cache] Failed to save index: {e}")
+
+    @staticmethod
+    def _hash_file(h, path: str):
+        try:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    h.update(chunk)
+        except OSError:
+            h.update(b"<unreadable>")
+
+    def _hash_path(self, h, path: str):
+        h.update(os.path.abspath(path).encode("utf-8"))
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for f in sorted(files):
+                    fp = os.path.join(root, f)
+                    h.update(os.path.relpath(fp, path).encode("utf-8"))
+                    self._hash_file(h, fp)
+        elif os.path.isfile(path):
+            self._hash_file(h, path)
+        else:
+            h.update(b"<missing>")
+
+    def Key(self, cmd: List[str], python_exec: Optional[str] = None) -> str:
+        h = hashlib.sha256()
+        h.update(ToolchainFingerprint(cmd[0], python_exec).encode("utf-8"))
+        h.update("\0".join(str(a) for a in cmd if a not in self.NEUTRAL_ARGS).encode("utf-8"))
+        for path in LocalImports(cmd[-1]):
+            self._hash_path(h, path)
+        if cmd[-1].endswith(".spec"):
+            for path in SpecInputs(cmd[-1]):
+                self._hash_path(h, path)
+        for i, arg in enumerate(cmd[:-1]):
+            if arg == "--add-data":
+                self._hash_path(h, cmd[i + 1].rsplit(PATHSEP, 1)[0])
+            elif arg in ("--icon", "--manifest"):
+                self._hash_path(h, cmd[i + 1])
+        return h.hexdigest()
+
+    @staticmethod
+    def Artifact(cmd: List[str], cwd: str = ".") -> str:
+        dist = cmd[cmd.index("--distpath") + 1] if "--distpath" in cmd else "dist"
+        name = cmd[cmd.index("--name") + 1] if "--name" in cmd else os.path.splitext(os.path.basename(cmd[-1]))[0]
+        if "-F" in cmd or "--onefile" in cmd:
+            name += ".exe" if os.name == "nt" else ""
+        return os.path.join(cwd, dist, name)
+
+    @staticmethod
+    def _remove(path: str):
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path, ignore_errors=True)
+        elif os.path.lexists(path):
+            os.remove(path)
+
+    @staticmethod
+    def _size(path: str) -> int:
+        if os.path.isfile(path):
+            return os.path.getsize(path)
+        total = 0
+        for root, dirs, files in os.walk(path):
+            for f in files:
+                try:
+                    total += os.path.getsize(os.path.join(root, f))
+                except OSError:
+                    pass
+        return total
+
+    def Restore(self, key: str, cmd: List[str], cwd: str = ".") -> bool:
+        with self._lock:
+            index = self._load_index()
+            meta = index.get(key)
+            if not meta:
+                return False
+            src = os.path.join(self.cache_dir, key, meta["artifact"])
+            if not os.path.exists(src):
+                index.pop(key, None)
+                self._save_index(index)
+                return False
+            meta["last_used"] = time.time()
+            self._save_index(index)
+        dest = self.Artifact(cmd, cwd)
+        self._remove(dest)
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        if os.path.isdir(src):
+            shutil.copytree(src, dest)
+        else:
+            shutil.copy2(src, dest)
+        return True
+
+    def Store(self, key: str, cmd: List[str], cwd: str = ".") -> bool:
+        artifact = self.Artifact(cmd, cwd)
+        if not os.path.exists(artifact):
+            return False
+        name = os.path.basename(artifact)
+        target = os.path.join(self.cache_dir, key)
+        tmp = f"{target}.{threading.get_ident()}.tmp"
+        self._remove(tmp)
+        if os.path.isdir(artifact):
+            shutil.copytree(artifact, os.path.join(tmp, name))
+        else:
+            os.makedirs(tmp, exist_ok=True)
+            shutil.copy2(artifact, os.path.join(tmp, name))
+        with self._lock:
+            self._remove(target)
+            os.replace(tmp, target)
+            index = self._load_index()
+            index[key] = {
+                "entry": cmd[-1],
+                "artifact": name,
+                "size": self._size(target),
+                "last_used": time.time()
+            }
+            self._evict(index, keep=key)
+            self._save_index(index)
+        return True
+
+    def _evict(self, index: Dict[str, Dict], keep: str = ""):
+        total = sum(meta.get("size", 0) for meta in index.values())
+        for key in sorted(index, key=lambda k: index[k].get("last_used", 0)):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= index[key].get("size", 0)
+            self._remove(os.path.join(self.cache_dir, key))
+            del index[key]
+
+def BuildAddDataArgs(files: List[str], folders: List[str]) -> List[str]:
+    args = []
+    for src in files:
+        dest = os.path.basename(src)
+        args.extend(["--add-data", f"{src}{PATHSEP}{dest}"])
+    for src in folders:
+        dest = os.path.basename(os.path.normpath(src))
+        args.extend(["--add-data", f"{src}{PATHSEP}{dest}"])
+    return args
+
+MERGE_SPEC_TEMPLATE = """# -*- mode: python ; coding: utf-8 -*-
+# Generated by PyToExe for a shared-runtime batch build. Every entry gets its own
+# Analysis and EXE, and a single COLLECT puts all of them into one folder, so
+# common modules and binaries are analysed in one process and shipped once.
+
+import os
+
+hiddenimports = {hiddenimports!r}
+excludes = {excludes!r}
+datas = {datas!r}
+entries = {entries!r}
+
+analyses = []
+for name, script in entries:
+    a = Analysis(
+        [script],
+        pathex=[os.path.dirname(script)],
+        binaries=[],
+        datas=datas,
+        hiddenimports=hiddenimports,
+        hookspath=[],
+        runtime_hooks=[],
+        excludes=excludes,
+        noarchive=False,{optimize}
+    )
+    analyses.append((name, a))
+
+collected = []
+for name, a in analyses:
+    pyz = PYZ(a.pure)
+    exe = EXE(
+        pyz,
+        a.scripts,
+        [],
+        exclude_binaries=True,
+        name=name,
+        debug=False,
+        strip={strip!r},
+        upx=True,
+        console={console!r},
+        icon={icon!r},
+        manifest={manifest!r},
+        uac_admin={uac_admin!r},
+    )
+    collected += [exe, a.binaries, a.datas]
+
+coll = COLLECT(*collected, strip={strip!r}, upx=True, name={suite!r})
+"""
+
+def MergeSpecNames(entries: List[str]) -> List[tuple]:
+    stems = [os.path.splitext(os.path.basename(e))[0] for e in entries]
+    return [(stem if stems.count(stem) == 1 else JobName(e), os.path.abspath(e)) for stem, e in zip(stems, entries)]
+
+def MakeMergeCommand(settings: Dict[str, Any], entries: List[str], cwd: Optional[str] = None) -> List[str]:
+    cwd = cwd or os.getcwd()
+    adv = settings.get("advanced", {})
+    outdir = settings.get("last_output") or os.path.abspath("output")
+    os.makedirs(outdir, exist_ok=True)
+    suite = settings.get("merge_name") or "suite"
+
+    datas = []
+    for src in settings.get("last_files", []):
+        datas.append((os.path.abspath(src), os.path.basename(src)))
+    for src in settings.get("last_folders", []):
+        datas.append((os.path.abspath(src), os.path.basename(os.path.normpath(src))))
+
+    spec_text = MERGE_SPEC_TEMPLATE.format(
+        hiddenimports=list(adv.get("hidden_imports", [])),
+        excludes=list(adv.get("exclude_modules", [])),
+        datas=datas,
+        entries=MergeSpecNames([e for e in entries if os.path.isfile(e)]),
+        optimize="\n        optimize=1," if adv.get("optimize", False) else "",
+        strip=bool(adv.get("strip", False)),
+        console=not settings.get("noconsole", False),
+        icon=os.path.abspath(settings["last_icon"]) if settings.get("last_icon") else None,
+        manifest=os.path.abspath(settings["last_manifest"]) if settings.get("last_manifest") else None,
+        uac_admin=bool(adv.get("uac_admin", False)),
+        suite=suite,
+    )
+    work_dir = os.path.join(cwd, "build", f"merge-{suite}")
+    os.makedirs(work_dir, exist_ok=True)
+    spec_path = os.path.join(work_dir, f"{suite}.spec")
+    try:
+        with open(spec_path, "r", encoding="utf-8") as f:
+            unchanged = f.read() == spec_text
+    except OSError:
+        unchanged = False
+    if not unchanged:
+        with open(spec_path, "w", encoding="utf-8") as f:
+            f.write(spec_text)
+
+    incremental = settings.get("incremental", False)
+    cmd = ["pyinstaller", "--noconfirm", "--distpath", outdir, "--workpath", work_dir]
+    if settings.get("clean", True) and not incremental:
+        cmd.append("--clean")
+    return cmd + [spec_path]
+
+def WithDetectedHiddenImports(settings: Dict[str, Any], entries: List[str], python_exec: Optional[str] = None, emit: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+    # Copy of `settings` with the dynamic imports found in the entries' local modules
+    # appended to advanced.hidden_imports. Each added module is reported through `emit`.
+    scripts = [e for e in entries if e.endswith(".py") and os.path.isfile(e)]
+    try:
+        detected = DetectHiddenImports(scripts, python_exec)
+    except Exception as e:
+        if emit:
+            emit(f"[WARN] Hidden import detection failed: {e}")
+        return settings
+    adv = dict(settings.get("advanced", {}))
+    current = list(adv.get("hidden_imports", []))
+    added = [item for item in detected if item["module"] not in current]
+    if not added:
+        return settings
+    adv["hidden_imports"] = current + [item["module"] for item in added]
+    if emit:
+        for item in added:
+            emit(f"[HIDDEN] {item['module']} ({item['kind']})  <- {' -> '.join(item['chain'])}")
+    return dict(settings, advanced=adv)
+
+def MakeCommands(settings: Dict[str, Any], entries: List[str], generate_spec_only=False, cwd: Optional[str] = None) -> List[List[str]]:
+    cwd = cwd or os.getcwd()
+    # Each script is built once: a script listed twice would share its result and its workpath.
+    unique, seen = [], set()
+    for e in entries:
+        key = os.path.normcase(os.path.abspath(e))
+        if key not in seen and os.path.isfile(e):
+            seen.add(key)
+            unique.append(e)
+    entries = unique
+    if settings.get("merge_batch", False) and not generate_spec_only and len(entries) > 1:
+        return [MakeMergeCommand(settings, entries, cwd)]
+    adv = settings.get("advanced", {})
+    outdir = settings.get("last_output") or os.path.abspath("output")
+    os.makedirs(outdir, exist_ok=True)
+
+    incremental = settings.get("incremental", False) and not generate_spec_only
+    base_args = ["pyinstaller", "--distpath", outdir]
+    if settings.get("clean", True) and not incremental:
+        base_args.append("--clean")
+    if settings.get("onefile", True):
+        base_args.append("-F")
+    if settings.get("noconsole", False):
+        base_args.append("--noconsole")
+
+    icon = settings.get("last_icon", "")
+    if icon:
+        base_args.extend(["--icon", icon])
+
+    manifest = settings.get("last_manifest", "")
+    if manifest:
+        base_args.extend(["--manifest", manifest])
+
+    base_args.extend(BuildAddDataArgs(settings.get("last_files", []), settings.get("last_folders", [])))
+
+    for h in adv.get("hidden_imports", []):
+        base_args.extend(["--hidden-import", h])
+    for e in adv.get("exclude_modules", []):
+        base_args.extend(["--exclude-module", e])
+    if adv.get("uac_admin", False):
+        base_args.append("--uac-admin")
+    key = adv.get("key", "")
+    if key:
+        base_args.extend(["--key", key])
+
+    if adv.get("optimize", False):
+        base_args.append("--optimize")
+    if adv.get("strip", False):
+        base_args.append("--strip")
+    if adv.get("no_prefer_redirect", False):
+        base_args.append("--no-prefer-redirect")
+
+    cmds = []
+    for e in entries:
+        if generate_spec_only:
+            cmd = ["pyi-makespec"] + base_args[1:] + [e]
+        elif len(entries) > 1 or incremental:
+            job_dir = os.path.join(cwd, "build", JobName(e))
+            cmd = base_args + ["--workpath", job_dir, "--specpath", job_dir, e]
+        else:
+            cmd = base_args + [e]
+        cmds.append(cmd)
+    return cmds
+
+def _CurrentRSS() -> int:
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except Exception:
+        pass
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        return 0
+
+def KillProcessTree(pid: int):
+    # Kill the process and every descendant right away, so a build stuck in a quiet
+    # phase (UPX, a hanging hook, a compiler child) cannot outlive a cancel.
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    if psutil is not None:
+        try:
+            parent = psutil.Process(pid)
+            procs = parent.children(recursive=True) + [parent]
+        except psutil.Error:
+            return
+        for proc in procs:
+            try:
+                proc.kill()
+            except psutil.Error:
+                pass
+        return
+    if os.name == "nt":
+        subprocess.run(["taskkill", "/F", "/T", "/PID", str(pid)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    else:
+        try:
+            os.kill(pid, 9)
+        except OSError:
+            pass
+
+def TreeCpuTime(pid: int) -> Optional[float]:
+    try:
+        import psutil
+        parent = psutil.Process(pid)
+        total = 0.0
+        for proc in [parent] + parent.children(recursive=True):
+            try:
+                times = proc.cpu_times()
+                total += times.user + times.system
+            except psutil.Error:
+                pass
+        return total
+    except Exception:
+        return None
+
+def WarmWorkerMain() -> int:
+    # Runs inside the selected interpreter: import PyInstaller once, then serve
+    # one JSON job per stdin line. fd 1/2 are redirected into a pipe so output
+    # from PyInstaller, its logging handlers and its child processes is all
+    # forwarded as {"type": "line"} messages on the original stdout.
+    proto = os.fdopen(os.dup(1), "w", encoding="utf-8", buffering=1)
+    proto_lock = threading.Lock()
+
+    def send(msg: Dict[str, Any]):
+        with proto_lock:
+            proto.write(json.dumps(msg) + "\n")
+            proto.flush()
+
+    try:
+        import PyInstaller
+        import PyInstaller.__main__ as pyi_main
+    except Exception as e:
+        send({"type": "error", "text": f"PyInstaller is not importable: {e}"})
+        return 1
+
+    sentinel = "\x00PYTOEXE-DONE "
+    r, w = os.pipe()
+    os.dup2(w, 1)
+    os.dup2(w, 2)
+    os.close(w)
+    sys.stdout.reconfigure(line_buffering=True)
+
+    def pump():
+        with os.fdopen(r, "r", encoding="utf-8", errors="replace") as pipe:
+            for raw in pipe:
+                text = raw.rstrip("\n")
+                if text.startswith(sentinel):
+                    send({"type": "done", "rc": int(text[len(sentinel):]), "rss": _CurrentRSS()})
+                else:
+                    send({"type": "line", "text": text})
+
+    threading.Thread(target=pump, daemon=True).start()
+    send({"type": "ready", "version": PyInstaller.__version__})
+
+    for raw in sys.stdin:
+        try:
+            job = json.loads(raw)
+            os.chdir(job.get("cwd") or ".")
+            pyi_main.run(job["args"])
+            rc = 0
+        except SystemExit as e:
+            rc = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except BaseException:
+            traceback.print_exc()
+            rc = 1
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.write(1, f"{sentinel}{rc}\n".encode("utf-8"))
+    return 0
+
+class WarmWorkerError(Exception):
+    pass
+
+class WarmWorker:
+    def __init__(self, python_exec: str, max_jobs: int = 20, max_rss_mb: int = 1536):
+        self.python_exec = python_exec
+        self.max_jobs = max(1, max_jobs)
+        self.max_rss = max_rss_mb * 1024 * 1024
+        self.proc: Optional[subprocess.Popen] = None
+        self.jobs_done = 0
+        self.rss = 0
+        self.version = ""
+
+    def _start(self):
+        self.proc = subprocess.Popen(
+            [self.python_exec, "-u", os.path.abspath(__file__), "--warm-worker"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1
+        )
+        self.jobs_done = 0
+        self.rss = 0
+        for raw in self.proc.stdout:
+            msg = self._parse(raw)
+            if msg.get("type") == "ready":
+                self.version = msg.get("version", "")
+                return
+            if msg.get("type") == "error":
+                self.Close()
+                raise WarmWorkerError(msg.get("text", "warm worker failed to start"))
+        self.Close()
+        raise WarmWorkerError("warm worker exited during startup")
+
+    @staticmethod
+    def _parse(raw: str) -> Dict[str, Any]:
+        try:
+            msg = json.loads(raw)
+            if isinstance(msg, dict):
+                return msg
+        except ValueError:
+            pass
+        return {"type": "line", "text": raw.rstrip("\n")}
+
+    def _needs_recycle(self) -> bool:
+        return self.jobs_done >= self.max_jobs or (self.rss and self.rss >= self.max_rss)
+
+    def Run(self, args: List[str], cwd: str, on_line: Callable[[str], None]) -> int:
+        if self.proc is not None and (self.proc.poll() is not None or self._needs_recycle()):
+            on_line(f"[WARM] Recycling worker after {self.jobs_done} jobs ({self.rss / 1024 / 1024:.0f} MB)")
+            self.Close()
+        if self.proc is None:
+            self._start()
+        try:
+            self.proc.stdin.write(json.dumps({"args": args, "cwd": cwd}) + "\n")
+            self.proc.stdin.flush()
+        except OSError as e:
+            self.Close()
+            raise WarmWorkerError(f"warm worker is not accepting jobs: {e}")
+        for raw in self.proc.stdout:
+            msg = self._parse(raw)
+            if msg.get("type") == "done":
+                self.jobs_done += 1
+                self.rss = msg.get("rss", 0)
+                return msg.get("rc", 1)
+            on_line(msg.get("text", ""))
+        self.Close()
+        return -1
+
+    def Kill(self):
+        if self.proc is not None:
+            KillProcessTree(self.proc.pid)
+
+    def Close(self):
+        proc, self.proc = self.proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=5)
+        except Exception:
+            proc.kill()
+            proc.wait()
+
+def WarmWorkerOptions(settings: Dict[str, Any]) -> Dict[str, int]:
+    return {
+        "max_jobs": settings.get("warm_worker_max_jobs", 20),
+        "max_rss_mb": settings.get("warm_worker_max_mb", 1536)
+    }
+
+class PhaseTracker:
+    # Ordered PyInstaller phases: (name, marker in the INFO log, progress when the phase starts).
+    # Phases only move forward, so repeated markers such as "... completed successfully." are ignored.
+    PHASES = [
+        ("Startup", None, 0),
+        ("Analysis", re.compile(r"(Running|Building|checking) Analysis|Initializing module dependency graph|Analyzing base_library"), 5),
+        ("Binaries", re.compile(r"Looking for dynamic libraries|Looking for ctypes DLLs"), 40),
+        ("PYZ", re.compile(r"(Building|checking) PYZ"), 55),
+        ("PKG", re.compile(r"(Building|checking) PKG"), 65),
+        ("EXE", re.compile(r"(Building|checking) EXE"), 80),
+        ("Bootloader", re.compile(r"Copying bootloader|Appending PKG archive|Fixing EXE headers"), 85),
+        ("COLLECT", re.compile(r"(Building|checking) COLLECT"), 90),
+        ("Done", re.compile(r"Build complete!"), 100),
+    ]
+
+    def __init__(self):
+        self.index = 0
+        self.started = time.time()
+        self.timings: List[Tuple[str, float]] = []
+        self.finished = False
+
+    @property
+    def percent(self) -> int:
+        return 100 if self.finished else self.PHASES[self.index][2]
+
+    def Feed(self, text: str) -> bool:
+        if self.finished or "INFO:" not in text:
+            return False
+        for i in range(len(self.PHASES) - 1, self.index, -1):
+            pattern = self.PHASES[i][1]
+            if pattern.search(text):
+                self._close()
+                self.index = i
+                if self.PHASES[i][0] == "Done":
+                    self.finished = True
+                return True
+        return False
+
+    def Finish(self):
+        if not self.finished:
+            self._close()
+            self.finished = True
+
+    def _close(self):
+        now = time.time()
+        self.timings.append((self.PHASES[self.index][0], now - self.started))
+        self.started = now
+
+    def Summary(self) -> str:
+        return " | ".join(f"{name} {seconds:.2f}s" for name, seconds in self.timings if name != "Done")
+
+class _Job:
+    # Activity of one running build, watched by BuildRunner's stall watchdog.
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+        self.proc: Optional[subprocess.Popen] = None
+        self.worker: Optional[WarmWorker] = None
+        self.last_activity = time.time()
+        self.cpu: Optional[float] = None
+        self.flagged = False
+        self.stalled = False
+
+    @property
+    def pid(self) -> Optional[int]:
+        if self.proc is not None:
+            return self.proc.pid
+        if self.worker is not None and self.worker.proc is not None:
+            return self.worker.proc.pid
+        return None
+
+    def Touch(self):
+        self.last_activity = time.time()
+        self.flagged = False
+
+class BuildRunner:
+    def __init__(self, commands: List[List[str]], cwd: str, python_exec: Optional[str] = None, jobs: int = 1,
+                 cache: Optional[BuildCache] = None, incremental: bool = False, on_line: Callable[[str], None] = print,
+                 warm: Optional[Dict[str, int]] = None, on_progress: Optional[Callable[[int], None]] = None,
+                 stall_timeout: int = 0, stall_action: str = "abort"):
+        self.commands = commands
+        self.cwd = cwd
+        self._stopped = False
+        self.python_exec = python_exec
+        self.jobs = max(1, min(ResolveJobs(jobs), len(commands) or 1))
+        self.cache = cache
+        self.workspace = IncrementalWorkspace(python_exec) if incremental else None
+        self.on_line = on_line
+        self.results: Dict[str, bool] = {}
+        self.on_progress = on_progress
+        self.phases: Dict[str, PhaseTracker] = {}
+        self._last_progress = -1
+        self.stall_timeout = max(0, int(stall_timeout or 0))
+        self.stall_action = stall_action
+        self._jobs: List[_Job] = []
+        self._watchdog_stop = threading.Event()
+        self._procs = set()
+        self._futures = []
+        self._lock = threading.Lock()
+        self.warm = warm
+        self._warm_idle: List[WarmWorker] = []
+        self._warm_all: List[WarmWorker] = []
+        # The warm worker must import the PyInstaller the cold path runs, or a cached
+        # artifact could be keyed to a toolchain that never built it.
+        self.warm_python = PyInstallerPython(python_exec) if warm is not None else None
+        if warm is not None and not self.warm_python:
+            self.on_line("[WARM] Could not tell which Python runs pyinstaller, using a fresh PyInstaller process per build")
+            self.warm = None
+
+    def stop(self):
+        self._stopped = True
+        with self._lock:
+            procs = list(self._procs)
+            workers = list(self._warm_all)
+            futures = list(self._futures)
+        # Entries still queued in the pool are dropped rather than started and skipped.
+        for future in futures:
+            future.cancel()
+        for p in procs:
+            KillProcessTree(p.pid)
+        for worker in workers:
+            worker.Kill()
+
+    def _acquire_warm(self) -> WarmWorker:
+        with self._lock:
+            if self._warm_idle:
+                return self._warm_idle.pop()
+            worker = WarmWorker(self.warm_python, **self.warm)
+            self._warm_all.append(worker)
+            return worker
+
+    def _release_warm(self, worker: WarmWorker):
+        with self._lock:
+            self._warm_idle.append(worker)
+
+    def Close(self):
+        with self._lock:
+            workers, self._warm_all, self._warm_idle = self._warm_all, [], []
+        for worker in workers:
+            worker.Close()
+
+    def _exec_process(self, cmd: List[str], emit: Callable[[str], None], job: Optional[_Job] = None) -> int:
+        if cmd[0] == "pyinstaller":
+            cmd = PyInstallerLauncher(self.python_exec) + cmd[1:]
+        with subprocess.Popen(
+            cmd,
+            cwd=self.cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            universal_newlines=True
+        ) as p:
+            with self._lock:
+                self._procs.add(p)
+            if job:
+                job.proc = p
+            try:
+                for out_line in p.stdout:
+                    if self._stopped:
+                        p.kill()
+                        break
+                    emit(out_line.rstrip("\n"))
+            finally:
+                with self._lock:
+                    self._procs.discard(p)
+        return p.wait()
+
+    def _exec_warm(self, cmd: List[str], emit: Callable[[str], None], job: Optional[_Job] = None) -> int:
+        worker = self._acquire_warm()
+        if job:
+            job.worker = worker
+        try:
+            return worker.Run(cmd[1:], self.cwd, emit)
+        except WarmWorkerError as e:
+            emit(f"[WARM] {e}; falling back to a fresh PyInstaller process")
+            if worker.proc is None and not worker.jobs_done:
+                self.warm = None
+            if job:
+                job.worker = None
+            return self._exec_process(cmd, emit, job)
+        finally:
+            self._release_warm(worker)
+
+    def _report_progress(self):
+        if not self.on_progress:
+            return
+        with self._lock:
+            total = 0
+            for cmd in self.commands:
+                entry = cmd[-1]
+                if entry in self.results:
+                    total += 100
+                elif entry in self.phases:
+                    total += self.phases[entry].percent
+            value = total // max(1, len(self.commands))
+            if value == self._last_progress:
+                return
+            self._last_progress = value
+        self.on_progress(value)
+
+    def _watchdog(self):
+        while not self._watchdog_stop.wait(1.0):
+            with self._lock:
+                jobs = list(self._jobs)
+            now = time.time()
+            for job in jobs:
+                pid = job.pid
+                if pid is None or job.stalled:
+                    continue
+                cpu = TreeCpuTime(pid)
+                if cpu is not None:
+                    if job.cpu is not None and cpu - job.cpu > 0.05:
+                        job.Touch()
+                    job.cpu = cpu
+                idle = now - job.last_activity
+                if idle < self.stall_timeout or job.flagged:
+                    continue
+                job.flagged = True
+                if self.stall_action == "warn":
+                    self.on_line(f"{job.prefix}[WATCHDOG] No output or CPU activity for {idle:.0f}s, the build may be stuck")
+                else:
+                    self.on_line(f"{job.prefix}[WATCHDOG] No output or CPU activity for {idle:.0f}s, killing the build")
+                    job.stalled = True
+                    KillProcessTree(pid)
+
+    def _job_log_path(self, cmd: List[str]) -> Optional[str]:
+        if "--workpath" not in cmd:
+            return None
+        return os.path.join(cmd[cmd.index("--workpath") + 1], "build.log")
+
+    def _run_command(self, cmd: List[str], tag: str = "") -> bool:
+        prefix = f"[{tag}] " if tag else ""
+        display_cmd = " ".join(map(str, cmd))
+        self.on_line(f"\n=== {prefix}تشغيل: {display_cmd}\n")
+        job_log = None
+        log_path = self._job_log_path(cmd) if tag else None
+        if log_path:
+            try:
+                os.makedirs(os.path.dirname(log_path), exist_ok=True)
+                job_log = open(log_path, "w", encoding="utf-8")
+            except Exception:
+                job_log = None
+
+        tracker = PhaseTracker()
+        job = _Job(prefix)
+        with self._lock:
+            self.phases[cmd[-1]] = tracker
+            self._jobs.append(job)
+
+        def emit(text: str):
+            job.Touch()
+            if job_log:
+                job_log.write(text + "\n")
+            self.on_line(prefix + text)
+            if tracker.Feed(text):
+                self._report_progress()
+
+        try:
+            if self.warm is not None and cmd[0] == "pyinstaller":
+                rc = self._exec_warm(cmd, emit, job)
+            else:
+                rc = self._exec_process(cmd, emit, job)
+            if self._stopped:
+                return False
+            if job.stalled:
+                self.on_line(f"{prefix}[ERROR] No output or CPU activity for {self.stall_timeout}s, the build was aborted")
+                return False
+            if rc != 0:
+                self.on_line(f"{prefix}[ERROR] The Process Ended with a code ! -> {rc}")
+                return False
+            return True
+        except FileNotFoundError:
+            self.on_line(f"{prefix}[ERROR] The command was not found")
+            return False
+        except Exception as e:
+            self.on_line(f"{prefix}[ERROR] {e}")
+            return False
+        finally:
+            with self._lock:
+                self._jobs.remove(job)
+            tracker.Finish()
+            if tracker.timings and not self._stopped:
+                self.on_line(f"{prefix}[TIMING] {tracker.Summary()}")
+            if job_log:
+                job_log.close()
+
+    def _run_entry(self, cmd: List[str], tag: str) -> bool:
+        if self._stopped:
+            return False
+        prefix = f"[{tag}] " if tag else ""
+        key = None
+        if self.cache:
+            try:
+                key = self.cache.Key(cmd, self.python_exec)
+                if self.cache.Restore(key, cmd, self.cwd):
+                    self.on_line(f"{prefix}[CACHE] Unchanged, restored {BuildCache.Artifact(cmd, self.cwd)}")
+                    with self._lock:
+                        self.results[cmd[-1]] = True
+                    self._report_progress()
+                    return True
+            except Exception as e:
+                self.on_line(f"{prefix}[CACHE] {e}")
+                key = None
+        run_cmd = cmd
+        if self.workspace:
+            run_cmd = self.workspace.Prepare(cmd)
+            if "--clean" in run_cmd:
+                self.on_line(f"{prefix}[INCREMENTAL] Interpreter or options changed, running a clean build")
+            else:
+                self.on_line(f"{prefix}[INCREMENTAL] Reusing the warm workpath")
+        if self._stopped:
+            return False
+        ok = self._run_command(run_cmd, tag)
+        if self.workspace:
+            self.workspace.Commit(run_cmd, ok)
+        if ok and key:
+            try:
+                self.cache.Store(key, cmd, self.cwd)
+            except Exception as e:
+                self.on_line(f"{prefix}[CACHE] Failed to store artifact: {e}")
+        with self._lock:
+            self.results[cmd[-1]] = ok
+        self._report_progress()
+        return ok
+
+    def _emit_summary(self):
+        if len(self.commands) < 2:
+            return
+        self.on_line("\n=== Build summary ===")
+        for cmd in self.commands:
+            entry = cmd[-1]
+            state = self.results.get(entry)
+            if state is None:
+                status = "SKIPPED"
+            else:
+                status = "OK" if state else "FAILED"
+            self.on_line(f"[{status}] {entry}")
+        passed = sum(1 for v in self.results.values() if v)
+        self.on_line(f"{passed}/{len(self.commands)} entries built successfully.")
+
+    def run(self) -> bool:
+        batch = len(self.commands) > 1
+        watchdog = None
+        if self.stall_timeout:
+            watchdog = threading.Thread(target=self._watchdog, name="build-watchdog", daemon=True)
+            watchdog.start()
+        pool = ThreadPoolExecutor(max_workers=self.jobs) if self.jobs > 1 else None
+        try:
+            if pool:
+                self.on_line(f"[INFO] Building {len(self.commands)} entries with {self.jobs} parallel jobs")
+                with self._lock:
+                    self._futures = [pool.submit(self._run_entry, cmd, JobName(cmd[-1])) for cmd in self.commands]
+                # Polled so Ctrl+C is delivered on Windows too, where a blocking wait ignores it.
+                pending = set(self._futures)
+                while pending:
+                    _, pending = wait(pending, timeout=0.5)
+                for future in self._futures:
+                    if not future.cancelled():
+                        future.result()
+            else:
+                for cmd in self.commands:
+                    if self._stopped:
+                        break
+                    self._run_entry(cmd, JobName(cmd[-1]) if batch else "")
+        except KeyboardInterrupt:
+            # Kill the running builds first, then drop the queued ones and wait for the pool.
+            self.stop()
+            raise
+        finally:
+            if pool:
+                pool.shutdown(wait=True, cancel_futures=True)
+            if watchdog:
+                self._watchdog_stop.set()
+                watchdog.join()
+            self.Close()
+        ok = not self._stopped and len(self.results) == len({cmd[-1] for cmd in self.commands}) and all(self.results.values())
+        self._emit_summary()
+        return ok
+
+EXIT_OK = 0
+EXIT_BUILD_FAILED = 1
+EXIT_USAGE = 2
+EXIT_TOOL_MISSING = 3
+EXIT_INTERRUPTED = 130
+
+def LoadProject(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        settings = json.load(f)
+    base = os.path.dirname(os.path.abspath(path))
+
+    def resolve(p: str) -> str:
+        return p if not p or os.path.isabs(p) else os.path.normpath(os.path.join(base, p))
+
+    for k in ("last_output", "last_icon", "last_manifest"):
+        if settings.get(k):
+            settings[k] = resolve(settings[k])
+    for k in ("last_entries", "last_files", "last_folders"):
+        settings[k] = [resolve(p) for p in settings.get(k, [])]
+    return settings
+
+def HeadlessMain(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="PyToExe.py build", description="Build executables from a saved PyToExe project without starting the GUI.")
+    parser.add_argument("--project", default="settings.json", help="settings.json saved by the GUI (default: %(default)s)")
+    parser.add_argument("--entries", nargs="+", help="scripts to build (default: the project's batch entries)")
+    parser.add_argument("--jobs", type=int, default=None, help="parallel builds, 0 = one per CPU core (default: project setting)")
+    parser.add_argument("--output", help="override the output folder")
+    parser.add_argument("--incremental", action="store_true", help="keep a warm workpath per entry")
+    parser.add_argument("--no-cache", action="store_true", help="do not restore or store build cache artifacts")
+    parser.add_argument("--warm", action="store_true", help="reuse one long-lived PyInstaller process per job slot")
+    parser.add_argument("--merge", action="store_true", help="build all entries from one generated spec into a shared runtime folder")
+    parser.add_argument("--merge-name", help="name of the shared output folder (default: project setting or 'suite')")
+    parser.add_argument("--stall-timeout", type=int, default=None, help="seconds without output or CPU activity before a build counts as stuck, 0 = off (default: project setting)")
+    parser.add_argument("--stall-action", choices=["abort", "warn"], default=None, help="kill a stuck build or only report it (default: project setting)")
+    parser.add_argument("--no-auto-hidden", action="store_true", help="do not add dynamically imported modules to the hidden imports")
+    args = parser.parse_args(argv)
+
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(errors="replace")
+    out_lock = threading.Lock()
+
+    def emit(text: str):
+        with out_lock:
+            sys.stdout.write(text + "\n")
+            sys.stdout.flush()
+
+    try:
+        settings = LoadProject(args.project)
+    except Exception as e:
+        print(f"[ERROR] Failed to load project {args.project}: {e}", file=sys.stderr)
+        return EXIT_USAGE
+
+    if args.output:
+        settings["last_output"] = os.path.abspath(args.output)
+    if args.incremental:
+        settings["incremental"] = True
+    if args.merge:
+        settings["merge_batch"] = True
+    if args.merge_name:
+        settings["merge_name"] = args.merge_name
+
+    entries = [os.path.abspath(e) for e in args.entries] if args.entries else settings.get("last_entries", [])
+    if not entries:
+        print("[ERROR] No entries to build. Pass --entries or save batch entries in the project.", file=sys.stderr)
+        return EXIT_USAGE
+    missing = [e for e in entries if not os.path.isfile(e)]
+    if missing:
+        for e in missing:
+            print(f"[ERROR] Entry not found: {e}", file=sys.stderr)
+        return EXIT_USAGE
+
+    if not settings.get("python_interpreter") and shutil.which("pyinstaller") is None:
+        print("[ERROR] PyInstaller not found. Install it with: pip install pyinstaller", file=sys.stderr)
+        return EXIT_TOOL_MISSING
+
+    if settings.get("advanced", {}).get("auto_hidden_imports", True) and not args.no_auto_hidden:
+        settings = WithDetectedHiddenImports(settings, entries, settings.get("python_interpreter") or None, emit)
+    cmds = MakeCommands(settings, entries)
+    cache = None
+    if settings.get("build_cache", True) and not args.no_cache:
+        cache = BuildCache(CACHE_DIR, settings.get("build_cache_max_mb", 2048))
+    jobs = args.jobs if args.jobs is not None else settings.get("parallel_jobs", 0)
+    warm = None
+    if args.warm or settings.get("warm_worker", False):
+        warm = WarmWorkerOptions(settings)
+
+    runner = BuildRunner(cmds, os.getcwd(), python_exec=settings.get("python_interpreter") or None, jobs=jobs,
+                         cache=cache, incremental=settings.get("incremental", False), on_line=emit, warm=warm,
+                         stall_timeout=args.stall_timeout if args.stall_timeout is not None else settings.get("stall_timeout", 0),
+                         stall_action=args.stall_action or settings.get("stall_action", "abort"))
+    start = time.time()
+    try:
+        ok = runner.run()
+    except KeyboardInterrupt:
+        runner.stop()
+        emit("[INFO] Build cancelled.")
+        return EXIT_INTERRUPTED
+    emit(f"[INFO] Finished in {time.time() - start:.2f} seconds")
+    return EXIT_OK if ok else EXIT_BUILD_FAILED
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--warm-worker"]:
+        sys.exit(WarmWorkerMain())
+    sys.exit(HeadlessMain(sys.argv[1:]))
@@ -0,0 +1,831 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025
+# Developer : Mohammed Al-Baqer
+
+# Static import analysis for entry scripts: walks the import graph with `ast` and
+# resolves every module against the selected interpreter's sys.path, without
+# running PyInstaller.
+
+import os
+import re
+import sys
+import ast
+import time
+import json
+import hashlib
+import zipfile
+import threading
+import subprocess
+import importlib.machinery
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional, Any, Tuple, Iterable
+
+
+_PROBE = (
+    "import sys, json, sysconfig, importlib.machinery as m;"
+    "p = sysconfig.get_paths();"
+    "print(json.dumps({"
+    "'path': [x for x in sys.path[1:] if x],"
+    "'builtins': list(sys.builtin_module_names),"
+    "'stdlib_names': sorted(getattr(sys, 'stdlib_module_names', ())),"
+    "'stdlib': [p.get('stdlib', ''), p.get('platstdlib', '')],"
+    "'suffixes': list(m.EXTENSION_SUFFIXES),"
+    "'version': sys.version.split()[0]}))"
+)
+
+_ENVIRONMENTS: Dict[str, Dict[str, Any]] = {}
+
+def InterpreterEnvironment(python_exec: Optional[str] = None) -> Dict[str, Any]:
+    # sys.path and friends of the interpreter that will run PyInstaller, probed once per interpreter.
+    key = python_exec or ""
+    if key in _ENVIRONMENTS:
+        return _ENVIRONMENTS[key]
+    env = None
+    if python_exec or getattr(sys, "frozen", False):
+        exe = python_exec or "python"
+        try:
+            out = subprocess.run([exe, "-c", _PROBE], capture_output=True, text=True, timeout=30)
+            env = json.loads(out.stdout.strip().splitlines()[-1])
+        except Exception:
+            env = None
+    if env is None:
+        import sysconfig
+        paths = sysconfig.get_paths()
+        env = {
+            "path": [p for p in sys.path[1:] if p and os.path.abspath(p) != os.path.abspath(os.path.dirname(__file__))],
+            "builtins": list(sys.builtin_module_names),
+            "stdlib_names": sorted(getattr(sys, "stdlib_module_names", ())),
+            "stdlib": [paths.get("stdlib", ""), paths.get("platstdlib", "")],
+            "suffixes": list(importlib.machinery.EXTENSION_SUFFIXES),
+            "version": sys.version.split()[0],
+        }
+    _ENVIRONMENTS[key] = env
+    return env
+
+PARSE_CACHE_FILE = os.path.join("analysis_cache", "parse_cache.json")
+PARSE_CACHE_VERSION = 3
+DYNAMIC_IMPORT_CALLS = {"__import__", "importlib.import_module", "import_module", "importlib.__import__"}
+# "module:attr" or setuptools' "name = module:attr", as found in plugin/entry-point tables.
+ENTRY_POINT = re.compile(r"^\s*(?:[\w.-]+\s*=\s*)?([A-Za-z_][\w]*(?:\.[A-Za-z_]\w*)*)\s*:\s*[A-Za-z_][\w.]*\s*$")
+STRING_METHODS = {"split", "rsplit", "partition", "rpartition"}
+MAX_CANDIDATES = 256
+
+# Audit rules, applied by _ImportCollector during its single walk: rule -> (category, message).
+AUDIT_RULES = {
+    "eval": ("security", "eval() ينفّذ كوداً عشوائياً"),
+    "exec": ("security", "exec() ينفّذ كوداً عشوائياً"),
+    "shell": ("security", "os.system/os.popen ينفّذ الأوامر عبر الـ shell"),
+    "subprocess": ("security", "تشغيل عملية فرعية"),
+    "subprocess-shell": ("security", "عملية فرعية مع shell=True"),
+    "deserialize": ("security", "pickle/marshal غير آمن مع البيانات غير الموثوقة"),
+    "while-true": ("performance", "حلقة while True لا نهائية"),
+    "sleep-in-loop": ("performance", "time.sleep() داخل حلقة"),
+    "recursion": ("performance", "دالة تستدعي نفسها (تعاودية)"),
+    "gui": ("recommendation", "نوصي باستخدام --noconsole لتطبيقات GUI"),
+    "network": ("recommendation", "تأكد من إضافة شهادات SSL إذا كان التطبيق يتصل بالإنترنت"),
+}
+AUDIT_CATEGORIES = ("security", "performance", "recommendation")
+AUDIT_CALLS = {
+    "eval": "eval", "exec": "exec", "os.system": "shell", "os.popen": "shell",
+    "subprocess.run": "subprocess", "subprocess.call": "subprocess", "subprocess.check_call": "subprocess",
+    "subprocess.check_output": "subprocess", "subprocess.Popen": "subprocess", "subprocess.getoutput": "subprocess-shell",
+    "subprocess.getstatusoutput": "subprocess-shell",
+    "pickle.load": "deserialize", "pickle.loads": "deserialize", "marshal.load": "deserialize", "marshal.loads": "deserialize",
+}
+AUDIT_IMPORTS = {
+    "tkinter": "gui", "PyQt5": "gui", "PyQt6": "gui", "PySide2": "gui", "PySide6": "gui", "wx": "gui", "kivy": "gui",
+    "requests": "network", "urllib": "network", "urllib3": "network", "httpx": "network", "aiohttp": "network",
+}
+
+def _dotted(node) -> str:
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if isinstance(node, ast.Name):
+        parts.append(node.id)
+        return ".".join(reversed(parts))
+    return ""
+
+class _ImportCollector:
+    # Collects (module, names, level, lineno, optional) for every import statement, plus
+    # dynamic imports as (name, lineno) and AUDIT_RULES hits as (rule, lineno, detail).
+    # Imports inside `try: ... except ImportError` or `if TYPE_CHECKING:` are optional.
+    # Dynamic import targets are folded from string literals, `+` and f-strings, module-level
+    # constants, loops over literal tables and split/partition()[0]; "module:attr" strings in
+    # module-level tables and entry_points= arguments count as entry points.
+    # Walks with an explicit stack: ast.NodeVisitor's per-node dispatch dominates on large files.
+    # Each stack item carries (node, optional, in_loop, enclosing function name).
+    GUARDS = {"ImportError", "ModuleNotFoundError", "Exception", "BaseException"}
+    LOOPS = (ast.For, ast.AsyncFor, ast.While)
+    FUNCTIONS = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+    def __init__(self):
+        self.imports: List[Tuple[str, List[str], int, int, bool]] = []
+        self.dynamic: List[Tuple[str, int]] = []
+        self.findings: List[Tuple[str, int, str]] = []
+        self.bindings: Dict[str, List[str]] = {}
+        self.tables: Dict[str, ast.AST] = {}
+
+    def Collect(self, tree: ast.AST):
+        self._module_constants(tree)
+        stack = [(tree, False, False, "")]
+        iter_children = ast.iter_child_nodes
+        while stack:
+            node, optional, in_loop, func = stack.pop()
+            kind = type(node)
+            if kind is ast.Import:
+                for alias in node.names:
+                    self.imports.append((alias.name, [], 0, node.lineno, optional))
+                    self._import(alias.name, node.lineno)
+                continue
+            if kind is ast.ImportFrom:
+                names = [a.name for a in node.names if a.name != "*"]
+                self.imports.append((node.module or "", names, node.level, node.lineno, optional))
+                if not node.level and node.module:
+                    self._import(node.module, node.lineno)
+                continue
+            if kind is ast.Constant or kind is ast.Name:
+                continue
+            if kind is ast.Call:
+                self._call(node, in_loop, func)
+            elif kind is ast.Try or kind.__name__ == "TryStar":
+                guarded = optional or any(self._catches_import_error(h.type) for h in node.handlers)
+                stack.extend((stmt, guarded, in_loop, func) for stmt in node.body)
+                stack.extend((stmt, optional, in_loop, func) for stmt in node.handlers + node.orelse + node.finalbody)
+                continue
+            elif kind is ast.If:
+                test = node.test
+                type_checking = (isinstance(test, ast.Name) and test.id == "TYPE_CHECKING") or (isinstance(test, ast.Attribute) and test.attr == "TYPE_CHECKING")
+                stack.append((test, optional, in_loop, func))
+                stack.extend((stmt, optional or type_checking, in_loop, func) for stmt in node.body)
+                stack.extend((stmt, optional, in_loop, func) for stmt in node.orelse)
+                continue
+            elif kind in self.FUNCTIONS:
+                stack.extend((child, optional, False, node.name) for child in iter_children(node))
+                continue
+            elif kind is ast.ClassDef:
+                stack.extend((child, optional, False, "") for child in iter_children(node))
+                continue
+            elif kind in self.LOOPS or kind is ast.comprehension:
+                if kind is not ast.While:
+                    self._bind_loop(node.target, node.iter)
+                if kind is ast.comprehension:
+                    stack.extend((child, optional, in_loop, func) for child in iter_children(node))
+                    continue
+                if kind is ast.While and isinstance(node.test, ast.Constant) and node.test.value is not False and node.test.value:
+                    self.findings.append(("while-true", node.lineno, ""))
+                stack.extend((child, optional, True, func) for child in iter_children(node))
+                continue
+            stack.extend((child, optional, in_loop, func) for child in iter_children(node))
+        self.imports.sort(key=lambda item: item[3])
+        self.dynamic.sort(key=lambda item: item[1])
+        self.findings.sort(key=lambda item: item[1])
+
+    def _import(self, module: str, lineno: int):
+        rule = AUDIT_IMPORTS.get(module.split(".")[0])
+        if rule:
+            self.findings.append((rule, lineno, module))
+
+    def _call(self, node: ast.Call, in_loop: bool, func: str):
+        name = _dotted(node.func)
+        for keyword in node.keywords:
+            if keyword.arg == "entry_points":
+                self._entry_points(keyword.value, node.lineno)
+        if name in DYNAMIC_IMPORT_CALLS and node.args:
+            package = node.args[1] if len(node.args) > 1 and name != "__import__" else next((k.value for k in node.keywords if k.arg == "package"), None)
+            packages = self._strings(package) if package is not None else []
+            for target in self._strings(node.args[0]):
+                target = target.split(":")[0].strip()
+                if target.startswith(".") and packages:
+                    level = len(target) - len(target.lstrip("."))
+                    parts = packages[0].split(".")
+                    if level - 1 < len(parts):
+                        target = ".".join(parts[:len(parts) - level + 1] + ([target.lstrip(".")] if target.lstrip(".") else []))
+                if target.strip("."):
+                    self.dynamic.append((target, node.lineno))
+            return
+        rule = AUDIT_CALLS.get(name)
+        if rule == "subprocess" and any(k.arg == "shell" and isinstance(k.value, ast.Constant) and k.value.value is True for k in node.keywords):
+            rule = "subprocess-shell"
+        if rule:
+            self.findings.append((rule, node.lineno, name))
+        elif in_loop and name in ("time.sleep", "sleep"):
+            self.findings.append(("sleep-in-loop", node.lineno, name))
+        elif func and name in (func, f"self.{func}", f"cls.{func}"):
+            self.findings.append(("recursion", node.lineno, func))
+
+    def _module_constants(self, tree: ast.AST):
+        # Module-level NAME = <string / table> assignments, read up front because the walk
+        # does not visit statements in source order.
+        for stmt in getattr(tree, "body", []):
+            if isinstance(stmt, ast.Assign):
+                targets, value = stmt.targets, stmt.value
+            elif isinstance(stmt, ast.AnnAssign) and stmt.value is not None:
+                targets, value = [stmt.target], stmt.value
+            else:
+                continue
+            for target in targets:
+                if not isinstance(target, ast.Name):
+                    continue
+                if isinstance(value, (ast.Tuple, ast.List, ast.Set, ast.Dict)):
+                    self.tables[target.id] = value
+                    self._entry_points(value, stmt.lineno)
+                else:
+                    strings = self._strings(value)
+                    if strings:
+                        self.bindings[target.id] = strings
+
+    def _entry_points(self, node: ast.AST, lineno: int):
+        for text in self._flatten(node):
+            match = ENTRY_POINT.match(text)
+            if match:
+                self.dynamic.append((match.group(1), lineno))
+
+    def _flatten(self, node: ast.AST) -> List[str]:
+        if isinstance(node, (ast.Tuple, ast.List, ast.Set)):
+            return [s for e in node.elts for s in self._flatten(e)]
+        if isinstance(node, ast.Dict):
+            return [s for v in node.values for s in self._flatten(v)]
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            return [node.value]
+        return []
+
+    def _strings(self, node: ast.AST) -> List[str]:
+        # Every string value `node` can evaluate to, or [] when it is not a constant expression.
+        kind = type(node)
+        if kind is ast.Constant:
+            return [node.value] if isinstance(node.value, str) else []
+        if kind is ast.Name:
+            return self.bindings.get(node.id, [])
+        if kind is ast.BinOp and isinstance(node.op, ast.Add):
+            return self._combine([self._strings(node.left), self._strings(node.right)])
+        if kind is ast.JoinedStr:
+            parts = []
+            for value in node.values:
+                if isinstance(value, ast.FormattedValue):
+                    if value.format_spec is not None:
+                        return []
+                    parts.append(self._strings(value.value))
+                else:
+                    parts.append(self._strings(value))
+            return self._combine(parts)
+        if kind is ast.Subscript and isinstance(node.value, ast.Call) and isinstance(node.value.func, ast.Attribute):
+            call = node.value
+            index = node.slice
+            if call.func.attr in STRING_METHODS and call.args and isinstance(call.args[0], ast.Constant) and isinstance(index, ast.Constant) and index.value in (0, -1):
+                sep = call.args[0].value
+                if not isinstance(sep, str) or not sep:
+                    return []
+                results = []
+                for text in self._strings(call.func.value):
+                    if call.func.attr in ("partition", "rpartition"):
+                        parts = list(getattr(text, call.func.attr)(sep))
+                        parts = [parts[0], parts[2]]
+                    elif call.func.attr == "rsplit":
+                        parts = text.rsplit(sep, 1)
+                    else:
+                        parts = text.split(sep)
+                    results.append(parts[index.value])
+                return results
+        return []
+
+    @staticmethod
+    def _combine(parts: List[List[str]]) -> List[str]:
+        results = [""]
+        for options in parts:
+            if not options:
+                return []
+            results = [a + b for a in results for b in options][:MAX_CANDIDATES]
+        return results
+
+    def _iterate(self, node: ast.AST) -> Tuple[List[str], List[str]]:
+        # (keys, values) produced by iterating a literal table, directly or through
+        # .keys()/.values()/.items(); for sequences both are the elements.
+        method = ""
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and not node.args:
+            method = node.func.attr
+            node = node.func.value
+        if isinstance(node, ast.Name):
+            node = self.tables.get(node.id, node)
+        if isinstance(node, ast.Dict):
+            keys = [s for k in node.keys if k is not None for s in self._strings(k)]
+            values = [s for v in node.values for s in self._strings(v)]
+            if method == "values":
+                return values, values
+            return keys, values
+        if isinstance(node, (ast.Tuple, ast.List, ast.Set)) and not method:
+            elements = [s for e in node.elts for s in self._strings(e)]
+            return elements, elements
+        return [], []
+
+    def _bind_loop(self, target: ast.AST, iterable: ast.AST):
+        keys, values = self._iterate(iterable)
+        if isinstance(target, ast.Name):
+            if keys:
+                self.bindings[target.id] = keys
+        elif isinstance(target, ast.Tuple) and len(target.elts) == 2:
+            for element, strings in zip(target.elts, (keys, values)):
+                if isinstance(element, ast.Name) and strings:
+                    self.bindings[element.id] = strings
+
+    def _catches_import_error(self, handler_type) -> bool:
+        if handler_type is None:
+            return True
+        if isinstance(handler_type, ast.Tuple):
+            return any(self._catches_import_error(e) for e in handler_type.elts)
+        name = handler_type.id if isinstance(handler_type, ast.Name) else getattr(handler_type, "attr", "")
+        return name in self.GUARDS
+
+def ParseFile(path: str) -> Dict[str, Any]:
+    # Everything the analyzers need from one source file. Runs in worker processes,
+    # so it only takes and returns plain data.
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError as e:
+        return {"sha": "", "error": str(e)}
+    record: Dict[str, Any] = {"sha": hashlib.sha256(data).hexdigest()}
+    try:
+        tree = ast.parse(data, filename=path)
+    except (SyntaxError, ValueError) as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+        return record
+    collector = _ImportCollector()
+    collector.Collect(tree)
+    record["imports"] = collector.imports
+    record["dynamic"] = collector.dynamic
+    record["findings"] = collector.findings
+    return record
+
+def ParseImports(path: str) -> List[Tuple[str, List[str], int, int, bool]]:
+    record = ParseFile(path)
+    if "error" in record:
+        raise SyntaxError(record["error"])
+    return record["imports"]
+
+class ParseCache:
+    # Per-file ParseFile() results on disk, keyed by path and validated by mtime and size,
+    # falling back to the content hash when only the mtime moved. Stale files are
+    # re-parsed in a process pool once there are enough of them to pay for it.
+    POOL_THRESHOLD = 64
+
+    def __init__(self, cache_path: str = PARSE_CACHE_FILE):
+        self.cache_path = cache_path
+        self.lock = threading.Lock()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.graphs: Dict[str, List[str]] = {}
+        self.dirty = False
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == PARSE_CACHE_VERSION:
+                self.entries = data.get("files", {})
+                self.graphs = data.get("graphs", {})
+        except Exception:
+            pass
+
+    def Get(self, paths: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        results: Dict[str, Dict[str, Any]] = {}
+        stale: List[Tuple[str, int, int]] = []
+        with self.lock:
+            for path in paths:
+                try:
+                    st = os.stat(path)
+                except OSError as e:
+                    results[path] = {"sha": "", "error": str(e)}
+                    continue
+                entry = self.entries.get(path)
+                if entry and entry.get("size") == st.st_size:
+                    if entry.get("mtime") == st.st_mtime_ns:
+                        results[path] = entry
+                        continue
+                    if entry.get("sha") and entry["sha"] == self._hash(path):
+                        entry["mtime"] = st.st_mtime_ns
+                        self.dirty = True
+                        results[path] = entry
+                        continue
+                stale.append((path, st.st_mtime_ns, st.st_size))
+        if not stale:
+            return results
+
+        parsed = self._parse([p for p, _, _ in stale])
+        with self.lock:
+            for (path, mtime, size), record in zip(stale, parsed):
+                record["mtime"] = mtime
+                record["size"] = size
+                self.entries[path] = record
+                results[path] = record
+            self.dirty = True
+        return results
+
+    def Graph(self, script_path: str) -> List[str]:
+        with self.lock:
+            return list(self.graphs.get(script_path, []))
+
+    def SetGraph(self, script_path: str, files: List[str]):
+        with self.lock:
+            if self.graphs.get(script_path) != files:
+                self.graphs[script_path] = files
+                self.dirty = True
+
+    @staticmethod
+    def _hash(path: str) -> str:
+        try:
+            with open(path, "rb") as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return ""
+
+    def _parse(self, paths: List[str]) -> List[Dict[str, Any]]:
+        if len(paths) < self.POOL_THRESHOLD or (os.cpu_count() or 1) < 2:
+            return [ParseFile(p) for p in paths]
+        workers = max(1, min(os.cpu_count() or 1, len(paths) // 16))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(ParseFile, paths, chunksize=16))
+        except Exception:
+            return [ParseFile(p) for p in paths]
+
+    def Save(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            data = {"version": PARSE_CACHE_VERSION, "files": self.entries, "graphs": self.graphs}
+            self.dirty = False
+        tmp = self.cache_path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp, self.cache_path)
+        except Exception as e:
+            print(f"[Analyzer] Failed to save parse cache: {e}")
+
+_PARSE_CACHE: Optional[ParseCache] = None
+
+def SharedParseCache() -> ParseCache:
+    global _PARSE_CACHE
+    if _PARSE_CACHE is None:
+        _PARSE_CACHE = ParseCache()
+    return _PARSE_CACHE
+
+class ImportAnalyzer:
+    LOCAL = "local"
+    STDLIB = "stdlib"
+    THIRD_PARTY = "third_party"
+    MISSING = "missing"
+
+    def __init__(self, python_exec: Optional[str] = None, cache: Optional[ParseCache] = None):
+        env = InterpreterEnvironment(python_exec)
+        self.cache = cache
+        self.python_version = env.get("version", "")
+        self.builtins = set(env.get("builtins", []))
+        self.stdlib_names = set(env.get("stdlib_names", []))
+        self.stdlib_dirs = [os.path.normcase(os.path.abspath(p)) for p in env.get("stdlib", []) if p]
+        self.suffixes = env.get("suffixes", []) or [".pyd" if os.name == "nt" else ".so"]
+        self.sys_path = env.get("path", [])
+        self._listings: Dict[str, Dict[str, str]] = {}
+        self._found: Dict[Tuple[str, str], Optional[str]] = {}
+
+    def _listing(self, directory: str) -> Dict[str, str]:
+        # Directory (or zip archive on sys.path) contents as {entry name: kind}, read once.
+        if directory in self._listings:
+            return self._listings[directory]
+        entries: Dict[str, str] = {}
+        try:
+            if os.path.isfile(directory) and zipfile.is_zipfile(directory):
+                with zipfile.ZipFile(directory) as zf:
+                    for name in zf.namelist():
+                        head, _, rest = name.partition("/")
+                        entries[head] = "dir" if rest else "file"
+            else:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        entries[entry.name] = "dir" if entry.is_dir() else "file"
+        except OSError:
+            pass
+        self._listings[directory] = entries
+        return entries
+
+    def _find_in(self, directory: str, name: str) -> Optional[str]:
+        key = (directory, name)
+        if key not in self._found:
+            self._found[key] = self._lookup(directory, name)
+        return self._found[key]
+
+    def _lookup(self, directory: str, name: str) -> Optional[str]:
+        listing = self._listing(directory)
+        if listing.get(name) == "dir":
+            init = os.path.join(directory, name, "__init__.py")
+            return init if os.path.isfile(init) else os.path.join(directory, name)
+        if listing.get(name + ".py") == "file":
+            return os.path.join(directory, name + ".py")
+        for suffix in self.suffixes:
+            if listing.get(name + suffix) == "file":
+                return os.path.join(directory, name + suffix)
+        return None
+
+    def _is_stdlib_path(self, path: str) -> bool:
+        path = os.path.normcase(os.path.abspath(path))
+        for d in self.stdlib_dirs:
+            if path.startswith(d + os.sep) and "site-packages" not in path[len(d):] and "dist-packages" not in path[len(d):]:
+                return True
+        return False
+
+    def Resolve(self, module: str, base_dir: str) -> Tuple[str, Optional[str]]:
+        # Returns (kind, path) for a dotted module name imported from a script in base_dir.
+        top = module.split(".")[0]
+        if not top:
+            return self.MISSING, None
+        local = self._find_in(base_dir, top)
+        if local:
+            return self.LOCAL, self._descend(local, module.split(".")[1:])
+        if top in self.builtins:
+            return self.STDLIB, None
+        for directory in self.sys_path:
+            found = self._find_in(directory, top)
+            if not found:
+                continue
+            if top in self.stdlib_names or self._is_stdlib_path(found):
+                return self.STDLIB, found
+            target = self._descend(found, module.split(".")[1:])
+            if target is None and os.path.isdir(found):
+                # Namespace packages can be split across several sys.path entries.
+                continue
+            return self.THIRD_PARTY, target
+        if top in self.stdlib_names:
+            return self.STDLIB, None
+        return self.MISSING, None
+
+    def _descend(self, path: str, parts: List[str]) -> Optional[str]:
+        # Follows a dotted path into a package directory; None when a submodule is missing.
+        for part in parts:
+            package = os.path.dirname(path) if path.endswith("__init__.py") else path
+            if not os.path.isdir(package):
+                return path
+            found = self._find_in(package, part)
+            if found is None:
+                return None
+            path = found
+        return path
+
+    def Analyze(self, script_path: str) -> Dict[str, Any]:
+        script_path = os.path.abspath(script_path)
+        base_dir = os.path.dirname(script_path)
+        result: Dict[str, Any] = {
+            "script": script_path,
+            "python": self.python_version,
+            "missing": [],
+            "local": [],
+            "third_party": [],
+            "stdlib": [],
+            "optional": [],
+            "dynamic": [],
+            "errors": [],
+        }
+        parents: Dict[str, Tuple[Optional[str], int]] = {script_path: (None, 0)}
+        seen_modules: Dict[str, str] = {}
+        reported = set()
+        optional_only: Dict[str, bool] = {}
+        wave = [script_path]
+        visited = set()
+        if self.cache:
+            # Re-validate last run's graph in one batch, so every changed file is
+            # re-parsed together (in parallel) instead of one wave at a time.
+            self.cache.Get([script_path] + self.cache.Graph(script_path))
+
+        # Breadth-first, one wave of newly reached local files at a time, so each wave
+        # can be fetched from the parse cache (and re-parsed in parallel) in one go.
+        while wave:
+            records = self.cache.Get(wave) if self.cache else {p: ParseFile(p) for p in wave}
+            pending: List[str] = []
+            for path in wave:
+                visited.add(path)
+            for path in wave:
+                self._scan(path, records[path], base_dir, result, parents, seen_modules, optional_only, reported, pending, visited)
+            wave = [p for p in dict.fromkeys(pending) if p not in visited]
+
+        result["files"] = sorted(visited)
+        if self.cache:
+            self.cache.SetGraph(script_path, result["files"])
+            self.cache.Save()
+        for module, kind in sorted(seen_modules.items()):
+            result[kind].append(module)
+        result["optional"] = sorted(m for m, only in optional_only.items() if only)
+        return result
+
+    def _scan(self, path, record, base_dir, result, parents, seen_modules, optional_only, reported, pending, visited):
+        if "error" in record:
+            result["errors"].append({"file": path, "error": record["error"]})
+            return
+        for module, names, level, lineno, optional in record["imports"]:
+            if level:
+                root = os.path.dirname(path)
+                for _ in range(level - 1):
+                    root = os.path.dirname(root)
+                if module and not self._follow_relative(module, root, path, lineno, parents, pending, visited):
+                    result["missing"].append({
+                        "module": "." * level + module,
+                        "optional": optional,
+                        "chain": self.Chain(parents, path, lineno),
+                    })
+                    continue
+                for n in names:
+                    self._follow_relative(f"{module}.{n}" if module else n, root, path, lineno, parents, pending, visited)
+                continue
+
+            kind, found = self.Resolve(module, base_dir)
+            if kind == self.LOCAL and found is None:
+                kind = self.MISSING
+            if kind == self.THIRD_PARTY and found is None:
+                kind = self.MISSING
+            if kind == self.MISSING:
+                if module in reported:
+                    continue
+                reported.add(module)
+                result["missing"].append({
+                    "module": module,
+                    "optional": optional,
+                    "chain": self.Chain(parents, path, lineno),
+                })
+                continue
+            top = module.split(".")[0]
+            seen_modules.setdefault(top, kind)
+            if kind == self.THIRD_PARTY:
+                # Third-party packages imported only under ImportError guards: bundled when
+                # installed, but the program runs without them.
+                optional_only[top] = optional_only.get(top, True) and optional
+            if kind == self.LOCAL:
+                targets = [found]
+                for n in names:
+                    sub_kind, sub = self.Resolve(f"{module}.{n}", base_dir)
+                    if sub_kind == self.LOCAL and sub and sub != found:
+                        targets.append(sub)
+                for target in targets:
+                    self._queue(target, path, lineno, parents, pending, visited)
+        for module, lineno in record.get("dynamic", []):
+            self._scan_dynamic(module, lineno, path, base_dir, result, parents, pending, visited)
+
+    def _scan_dynamic(self, module, lineno, path, base_dir, result, parents, pending, visited):
+        # A dynamic import target is reported with its kind; local targets are followed
+        # like static imports so their own imports are analyzed too.
+        found = None
+        if module.startswith("."):
+            level = len(module) - len(module.lstrip("."))
+            root = os.path.dirname(path)
+            for _ in range(level - 1):
+                root = os.path.dirname(root)
+            target = root
+            for part in module.lstrip(".").split("."):
+                found = self._find_in(target, part) if os.path.isdir(target) else None
+                if found is None:
+                    break
+                target = os.path.dirname(found) if found.endswith("__init__.py") else found
+            kind = self.LOCAL if found else self.MISSING
+            rel = os.path.relpath(os.path.splitext(target)[0], base_dir) if found else ""
+            if found and not rel.startswith(".."):
+                module = rel.replace(os.sep, ".")
+        else:
+            kind, found = self.Resolve(module, base_dir)
+            if kind in (self.LOCAL, self.THIRD_PARTY) and found is None:
+                kind = self.MISSING
+        result["dynamic"].append({"module": module, "kind": kind, "chain": self.Chain(parents, path, lineno)})
+        if kind == self.LOCAL and found:
+            self._queue(found, path, lineno, parents, pending, visited)
+
+    def _follow_relative(self, dotted, root, path, lineno, parents, pending, visited) -> bool:
+        target = root
+        for part in dotted.split("."):
+            if not os.path.isdir(target):
+                return False
+            found = self._find_in(target, part)
+            if found is None:
+                return False
+            target = os.path.dirname(found) if found.endswith("__init__.py") else found
+        if os.path.isdir(target) and os.path.isfile(os.path.join(target, "__init__.py")):
+            target = os.path.join(target, "__init__.py")
+        self._queue(target, path, lineno, parents, pending, visited)
+        return True
+
+    @staticmethod
+    def _queue(target, path, lineno, parents, pending, visited):
+        if target and target.endswith(".py") and target not in visited:
+            parents.setdefault(target, (path, lineno))
+            pending.append(target)
+
+    @staticmethod
+    def Chain(parents: Dict[str, Tuple[Optional[str], int]], path: str, lineno: int) -> List[str]:
+        # Entry script -> ... -> importing file, as "file:line" steps.
+        chain = [f"{os.path.basename(path)}:{lineno}"]
+        parent, line = parents.get(path, (None, 0))
+        while parent is not None:
+            chain.append(f"{os.path.basename(parent)}:{line}")
+            parent, line = parents.get(parent, (None, 0))
+        return list(reversed(chain))
+
+def FormatReport(result: Dict[str, Any], index=None) -> str:
+    # `index` is an optional PackageIndex, used for versions and install hints.
+    lines = [f"{os.path.basename(result['script'])} (Python {result['python']})"]
+    for item in result["missing"]:
+        flag = " (optional)" if item["optional"] else ""
+        hint = f"  [pip install {index.InstallName(item['module'])}]" if index and not item["module"].startswith(".") else ""
+        lines.append(f"  [MISSING] {item['module']}{flag}{hint}  <- {' -> '.join(item['chain'])}")
+    lines.append(f"  local: {', '.join(result['local']) or '-'}")
+    third_party = result["third_party"]
+    if index:
+        third_party = [f"{m} {index.Version(m)}" if index.Version(m) else m for m in third_party]
+    lines.append(f"  third-party: {', '.join(third_party) or '-'}")
+    lines.append(f"  stdlib: {len(result['stdlib'])}")
+    for err in result["errors"]:
+        lines.append(f"  [ERROR] {os.path.basename(err['file'])}: {err['error']}")
+    return "\n".join(lines)
+
+def AuditProject(entries: Iterable[str], python_exec: Optional[str] = None, cache: Optional[ParseCache] = None) -> Dict[str, Any]:
+    # Applies AUDIT_RULES to every local module reachable from the entries. The rules ran
+    # inside ParseFile, so after the import walk (which parses stale files in parallel
+    # through the cache) this only gathers findings from the cached records.
+    start = time.time()
+    cache = cache or SharedParseCache()
+    analyzer = ImportAnalyzer(python_exec, cache)
+    files: List[str] = []
+    errors: List[Dict[str, str]] = []
+    entries = [os.path.abspath(e) for e in entries]
+    for entry in entries:
+        result = analyzer.Analyze(entry)
+        files.extend(result["files"])
+        errors.extend(result["errors"])
+    files = list(dict.fromkeys(files))
+    findings: List[Dict[str, Any]] = []
+    for path, record in cache.Get(files).items():
+        for rule, lineno, detail in record.get("findings", []):
+            category, message = AUDIT_RULES[rule]
+            findings.append({"file": path, "line": lineno, "rule": rule, "category": category, "message": message, "detail": detail})
+    findings.sort(key=lambda item: (AUDIT_CATEGORIES.index(item["category"]), item["file"], item["line"]))
+    counts = {category: 0 for category in AUDIT_CATEGORIES}
+    for item in findings:
+        counts[item["category"]] += 1
+    return {
+        "entries": entries,
+        "files": files,
+        "findings": findings,
+        "counts": counts,
+        "errors": list({e["file"]: e for e in errors}.values()),
+        "elapsed": time.time() - start,
+    }
+
+def FormatAudit(audit: Dict[str, Any], limit: int = 0) -> str:
+    # Security and performance findings as "file:line", recommendations once per rule.
+    # `limit` caps the listed locations per category (0 = all).
+    try:
+        base = os.path.commonpath([os.path.dirname(e) for e in audit["entries"]])
+    except ValueError:
+        base = ""
+
+    def where(item):
+        return f"{os.path.relpath(item['file'], base) if base else item['file']}:{item['line']}"
+
+    counts = audit["counts"]
+    lines = [f"{len(audit['files'])} files, {counts['security']} security, {counts['performance']} performance ({audit['elapsed']:.2f} s)"]
+    for category in ("security", "performance"):
+        items = [f for f in audit["findings"] if f["category"] == category]
+        if not items:
+            continue
+        lines.append(f"  {category}:")
+        for item in items[:limit or None]:
+            detail = f" [{item['detail']}]" if item["detail"] else ""
+            lines.append(f"    {where(item)}  {item['message']}{detail}")
+        if limit and len(items) > limit:
+            lines.append(f"    ... +{len(items) - limit}")
+    seen = {}
+    for item in audit["findings"]:
+        if item["category"] == "recommendation":
+            seen.setdefault(item["rule"], item)
+    for item in seen.values():
+        lines.append(f"  [HINT] {item['message']} ({where(item)})")
+    for err in audit["errors"]:
+        lines.append(f"  [ERROR] {os.path.basename(err['file'])}: {err['error']}")
+    return "\n".join(lines)
+
+def DetectHiddenImports(entries: Iterable[str], python_exec: Optional[str] = None, cache: Optional[ParseCache] = None) -> List[Dict[str, Any]]:
+    # Dynamic import targets reachable from the entries that resolve in the target
+    # interpreter and are not imported statically anywhere in the graph, i.e. the modules
+    # PyInstaller's own analysis would miss. Each item is {"module", "kind", "chain"}.
+    cache = cache or SharedParseCache()
+    analyzer = ImportAnalyzer(python_exec, cache)
+    files: List[str] = []
+    found: Dict[str, Dict[str, Any]] = {}
+    for entry in entries:
+        result = analyzer.Analyze(os.path.abspath(entry))
+        files.extend(result["files"])
+        for item in result["dynamic"]:
+            if item["kind"] != ImportAnalyzer.MISSING and not item["module"].startswith("."):
+                found.setdefault(item["module"], item)
+    static = set()
+    for record in cache.Get(dict.fromkeys(files)).values():
+        for module, names, level, _, _ in record.get("imports", []):
+            if not level:
+                static.add(module)
+                static.update(f"{module}.{n}" for n in names)
+    return [item for module, item in sorted(found.items()) if module not in static]
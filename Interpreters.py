@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025
+# Developer : Mohammed Al-Baqer
+
+# Python interpreter discovery for the interpreter combo. Candidates are collected
+# from PATH, the usual install folders and an index of virtual/conda environments,
+# then probed in parallel (version, bitness, PyInstaller importable). Probe results
+# are persisted with a TTL so startup only reads a small JSON file.
+
+import os
+import glob
+import json
+import time
+import shutil
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Any, Tuple
+
+
+INTERPRETER_CACHE_FILE = os.path.join("analysis_cache", "interpreters.json")
+INTERPRETER_CACHE_VERSION = 2
+ENV_INDEX_FILE = os.path.join("analysis_cache", "env_index.json")
+ENV_INDEX_VERSION = 1
+PROBE_TIMEOUT = 15
+
+# Never descended into while looking for environments; hidden folders are skipped too,
+# except the ones that conventionally hold environments.
+SKIP_DIRS = {
+    "node_modules", "__pycache__", "site-packages", "dist-packages", "Lib", "lib", "include",
+    "AppData", "Application Data", "Library", "Applications", "Downloads", "Music", "Pictures", "Videos",
+    "build", "dist",
+}
+HIDDEN_DIRS = {".venv", ".env", ".virtualenvs", ".conda", ".pyenv"}
+
+_PROBE = (
+    "import sys, json, struct, importlib.util;"
+    "print(json.dumps({"
+    "'version': sys.version.split()[0],"
+    "'bits': struct.calcsize('P') * 8,"
+    "'pyinstaller': importlib.util.find_spec('PyInstaller') is not None,"
+    "'executable': sys.executable}))"
+)
+
+def EnvironmentPython(path: str) -> Optional[str]:
+    if os.name == "nt":
+        options = [os.path.join(path, "Scripts", "python.exe"), os.path.join(path, "python.exe")]
+    else:
+        options = [os.path.join(path, "bin", "python"), os.path.join(path, "bin", "python3")]
+    return next((p for p in options if os.path.isfile(p)), None)
+
+def DefaultEnvironmentRoots(depth: int = 2, extra: Optional[List[str]] = None) -> List[Tuple[str, int]]:
+    # (folder, depth): the home folder and the working folder are searched `depth`
+    # levels deep, the folders tools keep their environments in one level.
+    home = os.path.expanduser("~")
+    roots = [(home, depth), (os.path.abspath(os.curdir), depth)]
+    for path in (
+        os.environ.get("WORKON_HOME", ""),
+        os.path.join(home, ".virtualenvs"),
+        os.path.join(home, "Envs"),
+        os.path.join(home, ".local", "share", "virtualenvs"),
+        os.path.join(home, ".cache", "pypoetry", "virtualenvs"),
+        os.path.join(home, "Library", "Caches", "pypoetry", "virtualenvs"),
+        os.path.join(os.environ.get("LOCALAPPDATA", ""), "pypoetry", "Cache", "virtualenvs"),
+        os.path.join(home, ".conda", "envs"),
+        os.path.join(home, ".pyenv", "versions"),
+    ):
+        if path and os.path.isabs(path):
+            roots.append((path, 1))
+    for path in extra or []:
+        roots.append((os.path.abspath(os.path.expanduser(path)), depth))
+    return roots
+
+class EnvironmentIndex:
+    # Folders seen while looking for environments, keyed by path and validated by the
+    # folder's mtime: creating or deleting pyvenv.cfg/conda-meta, or a subfolder, changes
+    # it. Unchanged folders cost one stat on refresh instead of a listing.
+
+    def __init__(self, roots: Optional[List[Tuple[str, int]]] = None, index_path: str = ENV_INDEX_FILE):
+        self.roots = roots if roots is not None else DefaultEnvironmentRoots()
+        self.index_path = index_path
+        self.dirs: Dict[str, Dict[str, Any]] = {}
+        self.envs: Dict[str, str] = {}
+        self.dirty = False
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == ENV_INDEX_VERSION:
+                self.dirs = data.get("dirs", {})
+                self.envs = data.get("envs", {})
+        except Exception:
+            pass
+
+    def Environments(self) -> Dict[str, str]:
+        # {environment folder: "venv" | "conda"} as of the last Refresh(), without touching the disk.
+        return dict(self.envs)
+
+    def _entry(self, path: str, need_children: bool) -> Optional[Dict[str, Any]]:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        entry = self.dirs.get(path)
+        if entry and entry["mtime"] == mtime and (entry["children"] is not None or not need_children):
+            return entry
+        if need_children:
+            names, children = set(), []
+            try:
+                with os.scandir(path) as it:
+                    for item in it:
+                        names.add(item.name)
+                        try:
+                            if item.is_dir(follow_symlinks=False):
+                                children.append(item.name)
+                        except OSError:
+                            continue
+            except OSError:
+                pass
+            kind = "venv" if "pyvenv.cfg" in names else "conda" if "conda-meta" in children else ""
+            entry = {"mtime": mtime, "kind": kind, "children": sorted(children)}
+        else:
+            kind = "venv" if os.path.isfile(os.path.join(path, "pyvenv.cfg")) else "conda" if os.path.isdir(os.path.join(path, "conda-meta")) else ""
+            entry = {"mtime": mtime, "kind": kind, "children": None}
+        self.dirs[path] = entry
+        self.dirty = True
+        return entry
+
+    def Refresh(self) -> Dict[str, str]:
+        envs: Dict[str, str] = {}
+        visited: Dict[str, Dict[str, Any]] = {}
+        stack = list(reversed(self.roots))
+        conda_list = os.path.join(os.path.expanduser("~"), ".conda", "environments.txt")
+        try:
+            with open(conda_list, "r", encoding="utf-8") as f:
+                stack.extend((line.strip(), 0) for line in f if line.strip())
+        except OSError:
+            pass
+
+        while stack:
+            path, depth = stack.pop()
+            if path in visited:
+                continue
+            entry = self._entry(path, depth > 0)
+            if entry is None:
+                continue
+            visited[path] = entry
+            if entry["kind"]:
+                envs[path] = entry["kind"]
+                if entry["kind"] == "conda":
+                    stack.append((os.path.join(path, "envs"), 1))
+                continue
+            if depth > 0:
+                for name in entry["children"] or []:
+                    if name in SKIP_DIRS or (name.startswith(".") and name not in HIDDEN_DIRS):
+                        continue
+                    stack.append((os.path.join(path, name), depth - 1))
+
+        if self.dirty or envs != self.envs or len(visited) != len(self.dirs):
+            self.dirs, self.envs = visited, envs
+            self._save()
+        return dict(envs)
+
+    def _save(self):
+        self.dirty = False
+        tmp = self.index_path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": ENV_INDEX_VERSION, "envs": self.envs, "dirs": self.dirs}, f, separators=(",", ":"))
+            os.replace(tmp, self.index_path)
+        except Exception as e:
+            print(f"[Interpreters] Failed to save environment index: {e}")
+
+def CandidateInterpreters(env_index: Optional[EnvironmentIndex] = None) -> List[Tuple[str, str]]:
+    # (path, kind) with kind "system", "venv" or "conda". Only fixed, shallow locations
+    # are globbed; environments come from the mtime-validated EnvironmentIndex.
+    candidates: List[Tuple[str, str]] = []
+    seen = set()
+
+    def add(path: str, kind: str):
+        key = os.path.normcase(os.path.abspath(path))
+        if key not in seen and os.path.isfile(path):
+            seen.add(key)
+            candidates.append((path, kind))
+
+    for name in ("python", "python3", "py"):
+        path = shutil.which(name)
+        if path:
+            add(path, "system")
+
+    if os.name == "nt":
+        roots = [
+            os.environ.get("ProgramFiles", r"C:\Program Files"),
+            os.environ.get("ProgramFiles(x86)", r"C:\Program Files (x86)"),
+            os.path.join(os.environ.get("LOCALAPPDATA", ""), "Programs", "Python"),
+            os.environ.get("SystemDrive", "C:") + os.sep,
+        ]
+        for root in roots:
+            for path in sorted(glob.glob(os.path.join(root, "Python*", "python.exe"))):
+                add(path, "system")
+    else:
+        for pattern in ("/usr/bin/python3.*", "/usr/local/bin/python3.*", "/opt/homebrew/bin/python3.*",
+                        os.path.expanduser("~/.pyenv/versions/*/bin/python")):
+            for path in sorted(glob.glob(pattern)):
+                if not path.endswith("-config"):
+                    add(path, "system")
+
+    for env, kind in sorted((env_index or EnvironmentIndex()).Refresh().items()):
+        python = EnvironmentPython(env)
+        if python:
+            add(python, kind)
+    return candidates
+
+def ProbeInterpreter(path: str) -> Optional[Dict[str, Any]]:
+    # None when the candidate does not run as a Python interpreter.
+    try:
+        out = subprocess.run([path, "-c", _PROBE], capture_output=True, text=True, timeout=PROBE_TIMEOUT,
+                             creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0))
+        return json.loads(out.stdout.strip().splitlines()[-1]) if out.returncode == 0 else None
+    except Exception:
+        return None
+
+def _stamp(path: str) -> Tuple[int, int]:
+    try:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+    except OSError:
+        return 0, 0
+
+def CachedInterpreters(cache_path: str = INTERPRETER_CACHE_FILE) -> List[Dict[str, Any]]:
+    # Last discovery result whatever its age, for filling the combo instantly.
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == INTERPRETER_CACHE_VERSION:
+            return data.get("interpreters", [])
+    except Exception:
+        pass
+    return []
+
+def DiscoverInterpreters(ttl: float = 86400, force: bool = False, depth: int = 2, extra_roots: Optional[List[str]] = None,
+                         cache_path: str = INTERPRETER_CACHE_FILE, cancel: Optional[threading.Event] = None) -> List[Dict[str, Any]]:
+    # Runs off the GUI thread. Candidates are re-collected every time (cheap: globs plus
+    # the environment index); an executable is probed again only when it is new, its
+    # mtime/size changed, or its last probe is older than the TTL (PyInstaller may have
+    # been installed since). Setting `cancel` stops probing between probes; the cache is
+    # then left untouched and the previous result is returned.
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != INTERPRETER_CACHE_VERSION:
+            data = {}
+    except Exception:
+        data = {}
+
+    previous = {item["path"]: item for item in data.get("interpreters", [])}
+    candidates = CandidateInterpreters(EnvironmentIndex(DefaultEnvironmentRoots(depth, extra_roots)))
+    now = time.time()
+    stale = []
+    results: Dict[str, Optional[Dict[str, Any]]] = {}
+    for path, kind in candidates:
+        mtime, size = _stamp(path)
+        old = previous.get(path)
+        if not force and old and old.get("mtime") == mtime and old.get("size") == size and now - old.get("probed", 0) < ttl:
+            results[path] = dict(old, kind=kind)
+        else:
+            stale.append((path, kind, mtime, size))
+
+    if stale:
+        pool = ThreadPoolExecutor(max_workers=min(8, len(stale)))
+        try:
+            futures = [pool.submit(ProbeInterpreter, path) for path, _, _, _ in stale]
+            for (path, kind, mtime, size), future in zip(stale, futures):
+                if cancel is not None and cancel.is_set():
+                    break
+                info = future.result()
+                results[path] = dict(info, path=path, kind=kind, mtime=mtime, size=size, probed=now) if info else None
+        finally:
+            # Probes already running finish on their own (bounded by PROBE_TIMEOUT).
+            pool.shutdown(wait=not (cancel is not None and cancel.is_set()), cancel_futures=True)
+        if cancel is not None and cancel.is_set():
+            return list(previous.values())
+
+    interpreters = [results[path] for path, _ in candidates if results.get(path)]
+    if not stale and interpreters == data.get("interpreters"):
+        return interpreters
+    tmp = cache_path + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": INTERPRETER_CACHE_VERSION, "time": time.time(), "interpreters": interpreters}, f, indent=2)
+        os.replace(tmp, cache_path)
+    except Exception as e:
+        print(f"[Interpreters] Failed to save cache: {e}")
+    return interpreters
+
+def Describe(item: Dict[str, Any]) -> str:
+    pyinstaller = "PyInstaller ✓" if item.get("pyinstaller") else "PyInstaller ✗"
+    return f"Python {item.get('version', '?')}, {item.get('bits', '?')}-bit, {pyinstaller}"
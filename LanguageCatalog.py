@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025
+# Developer : Mohammed Al-Baqer
+
+# Compiled translation catalogs. A language JSON file is flattened once into
+# {"a.b.c": value} (intermediate dicts and list items included, so both "ui" and
+# "compression_levels.0" resolve with one dict lookup) and cached as a marshal file
+# keyed by the source file's mtime and size.
+
+import os
+import json
+import marshal
+from typing import Dict, Any, Optional, Tuple
+
+
+CATALOG_DIR = os.path.join("analysis_cache", "languages")
+CATALOG_VERSION = 1
+
+def Flatten(data: Any, prefix: str = "", out: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    out = {} if out is None else out
+    items = data.items() if isinstance(data, dict) else enumerate(data)
+    for key, value in items:
+        name = f"{prefix}{key}"
+        out[name] = value
+        if isinstance(value, (dict, list)):
+            Flatten(value, name + ".", out)
+    return out
+
+def _stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+    except OSError:
+        return None
+
+class Catalog:
+    def __init__(self, code: str, source: str, entries: Dict[str, Any], stamp: Optional[Tuple[int, int]]):
+        self.code = code
+        self.source = source
+        self.entries = entries
+        self.stamp = stamp
+
+    def Fresh(self) -> bool:
+        # One stat: a catalog held in memory is reused until its JSON file is edited.
+        return _stamp(self.source) == self.stamp
+
+def LoadCatalog(code: str, languages_dir: str = "languages", cache_dir: str = CATALOG_DIR) -> Catalog:
+    # Raises like json.load when the source is missing or malformed and no valid cache exists.
+    source = os.path.join(languages_dir, f"{code}.json")
+    stamp = _stamp(source)
+    cache = os.path.join(cache_dir, f"{code}.catalog")
+    try:
+        with open(cache, "rb") as f:
+            version, cached_stamp, entries = marshal.load(f)
+        if version == CATALOG_VERSION and stamp is not None and tuple(cached_stamp) == stamp:
+            return Catalog(code, source, entries, stamp)
+    except Exception:
+        pass
+
+    with open(source, "r", encoding="utf-8") as f:
+        entries = Flatten(json.load(f))
+    tmp = cache + ".tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp, "wb") as f:
+            marshal.dump((CATALOG_VERSION, stamp, entries), f)
+        os.replace(tmp, cache)
+    except Exception as e:
+        print(f"[Language] Failed to cache catalog {code}: {e}")
+    return Catalog(code, source, entries, stamp)
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025
+# Developer : Mohammed Al-Baqer
+
+# Index of the distributions installed in an interpreter: top-level import name ->
+# distribution, version, files and bytes on disk. Built once by a subprocess using
+# importlib.metadata and cached on disk until one of the interpreter's sys.path
+# directories changes (installing or removing a package touches site-packages).
+
+import os
+import re
+import sys
+import json
+import hashlib
+import threading
+import subprocess
+from typing import List, Dict, Optional, Any, Iterable, Tuple
+
+from ImportAnalyzer import ImportAnalyzer, InterpreterEnvironment, SharedParseCache
+
+
+INDEX_DIR = "analysis_cache"
+INDEX_VERSION = 1
+
+# Import names whose distribution is named differently, for install hints on missing modules.
+INSTALL_NAMES = {
+    "cv2": "opencv-python", "PIL": "Pillow", "yaml": "PyYAML", "sklearn": "scikit-learn",
+    "bs4": "beautifulsoup4", "skimage": "scikit-image", "Crypto": "pycryptodome",
+    "dateutil": "python-dateutil", "dotenv": "python-dotenv", "win32api": "pywin32",
+    "win32con": "pywin32", "win32com": "pywin32", "serial": "pyserial", "usb": "pyusb",
+    "magic": "python-magic", "docx": "python-docx", "pptx": "python-pptx", "jwt": "PyJWT",
+    "OpenGL": "PyOpenGL", "attr": "attrs", "google.protobuf": "protobuf", "fitz": "PyMuPDF",
+}
+
+_INDEX_SCRIPT = r'''
+import os, re, sys, json
+try:
+    from importlib import metadata
+except ImportError:
+    import importlib_metadata as metadata
+
+def norm(name):
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+dists = {}
+for dist in metadata.distributions():
+    try:
+        name = dist.metadata["Name"]
+    except Exception:
+        name = None
+    if not name or norm(name) in dists:
+        continue
+    files, size, top = [], 0, set()
+    for f in dist.files or []:
+        parts = f.parts
+        if not parts or parts[0] == "..":
+            continue
+        files.append("/".join(parts))
+        n = f.size
+        if n is None:
+            try:
+                n = os.path.getsize(dist.locate_file(f))
+            except OSError:
+                n = 0
+        size += n
+        head = parts[0]
+        if head.endswith((".dist-info", ".egg-info")) or head == "__pycache__":
+            continue
+        if len(parts) > 1:
+            top.add(head)
+        elif head.endswith(".py"):
+            top.add(head[:-3])
+        elif head.endswith((".so", ".pyd")):
+            top.add(head.split(".")[0])
+    try:
+        text = dist.read_text("top_level.txt") or ""
+    except Exception:
+        text = ""
+    top.update(line.strip().split("/")[0] for line in text.splitlines() if line.strip())
+    requires = []
+    for req in dist.requires or []:
+        if "extra ==" in req:
+            continue
+        m = re.match(r"[A-Za-z0-9][A-Za-z0-9._-]*", req)
+        if m:
+            requires.append(norm(m.group(0)))
+    dists[norm(name)] = {
+        "name": name,
+        "version": dist.version,
+        "location": str(dist.locate_file("")),
+        "top_level": sorted(t for t in top if t.isidentifier()),
+        "requires": requires,
+        "files": files,
+        "bytes": size,
+    }
+print(json.dumps(dists))
+'''
+
+def NormalizeName(name: str) -> str:
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+class PackageIndex:
+    def __init__(self, python_exec: Optional[str] = None, index_dir: str = INDEX_DIR):
+        self.python_exec = python_exec
+        key = hashlib.md5((python_exec or sys.executable).encode("utf-8")).hexdigest()[:8]
+        self.index_path = os.path.join(index_dir, f"dist_index-{key}.json")
+        self.lock = threading.Lock()
+        self.signature: Dict[str, int] = {}
+        self.dists: Dict[str, Dict[str, Any]] = {}
+        self.modules: Dict[str, str] = {}
+        self.error = ""
+
+    def _signature(self) -> Dict[str, int]:
+        # mtime of every sys.path directory of the interpreter; any install, upgrade or
+        # uninstall adds or removes a *.dist-info folder in one of them.
+        signature = {}
+        for path in InterpreterEnvironment(self.python_exec).get("path", []):
+            try:
+                signature[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+        return signature
+
+    def Load(self) -> "PackageIndex":
+        with self.lock:
+            signature = self._signature()
+            if self.dists and signature == self.signature:
+                return self
+            data = None
+            try:
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") != INDEX_VERSION or data.get("signature") != signature:
+                    data = None
+            except Exception:
+                data = None
+            if data is None:
+                data = {"version": INDEX_VERSION, "signature": signature, "dists": self._build()}
+                if not self.error:
+                    self._save(data)
+            self.signature = signature
+            self.dists = data["dists"]
+            self.modules = {}
+            for key, dist in self.dists.items():
+                for module in dist["top_level"]:
+                    self.modules.setdefault(module, key)
+            return self
+
+    def _build(self) -> Dict[str, Dict[str, Any]]:
+        exe = self.python_exec or (sys.executable if not getattr(sys, "frozen", False) else "python")
+        try:
+            out = subprocess.run([exe, "-c", _INDEX_SCRIPT], capture_output=True, text=True, timeout=120)
+            self.error = "" if out.returncode == 0 else (out.stderr.strip().splitlines() or ["failed"])[-1]
+            return json.loads(out.stdout.strip().splitlines()[-1]) if not self.error else {}
+        except Exception as e:
+            self.error = str(e)
+            return {}
+
+    def _save(self, data: Dict[str, Any]):
+        tmp = self.index_path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp, self.index_path)
+        except Exception as e:
+            print(f"[PackageIndex] Failed to save index: {e}")
+
+    def Distribution(self, name: str) -> Optional[Dict[str, Any]]:
+        # By import name (top-level module) first, then by distribution name.
+        self.Load()
+        key = self.modules.get(name.split(".")[0]) or NormalizeName(name)
+        return self.dists.get(key)
+
+    def Version(self, name: str) -> Optional[str]:
+        dist = self.Distribution(name)
+        return dist["version"] if dist else None
+
+    def InstallName(self, module: str) -> str:
+        dist = self.Distribution(module)
+        if dist:
+            return dist["name"]
+        return INSTALL_NAMES.get(module, INSTALL_NAMES.get(module.split(".")[0], module.split(".")[0]))
+
+    def Footprint(self, modules: Iterable[str]) -> List[Tuple[str, str, int]]:
+        # (name, version, bytes) of the distributions providing `modules` and everything
+        # they require, largest first. What PyInstaller will bundle is a subset of this.
+        self.Load()
+        pending = [self.modules[m.split(".")[0]] for m in modules if m.split(".")[0] in self.modules]
+        seen = set()
+        while pending:
+            key = pending.pop()
+            if key in seen or key not in self.dists:
+                continue
+            seen.add(key)
+            pending.extend(self.dists[key]["requires"])
+        return sorted(((self.dists[k]["name"], self.dists[k]["version"], self.dists[k]["bytes"]) for k in seen), key=lambda item: item[2], reverse=True)
+
+_INDEXES: Dict[str, PackageIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+def SharedPackageIndex(python_exec: Optional[str] = None) -> PackageIndex:
+    # One index per interpreter per session; Load() re-validates it cheaply on every use.
+    with _INDEXES_LOCK:
+        key = python_exec or ""
+        if key not in _INDEXES:
+            _INDEXES[key] = PackageIndex(python_exec)
+        return _INDEXES[key]
+
+def EstimateBuild(entries: Iterable[str], python_exec: Optional[str] = None, excludes: Iterable[str] = ()) -> Dict[str, Any]:
+    # Pre-build size estimate from the import graph and the index: the installed
+    # distributions the entries pull in, and the optional-only imports that would be
+    # bundled just because they are installed (candidates for --exclude-module).
+    analyzer = ImportAnalyzer(python_exec, SharedParseCache())
+    required, optional = set(), set()
+    for entry in entries:
+        result = analyzer.Analyze(entry)
+        optional.update(result["optional"])
+        required.update(m for m in result["third_party"] if m not in result["optional"])
+    optional -= required
+    excluded = {e.split(".")[0] for e in excludes}
+    index = SharedPackageIndex(python_exec).Load()
+    packages = index.Footprint(m for m in required | optional if m not in excluded)
+    suggestions = []
+    for module in sorted(optional - excluded):
+        dist = index.Distribution(module)
+        if dist:
+            suggestions.append((module, dist["name"], dist["bytes"]))
+    return {
+        "packages": packages,
+        "bytes": sum(size for _, _, size in packages),
+        "exclude": sorted(suggestions, key=lambda item: item[2], reverse=True),
+        "error": index.error,
+    }
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025
+# Developer : Mohammed Al-Baqer
+
+# Fast file-size scanner for project and output folders. Built on os.scandir so the
+# dirent type/stat data is reused, with subdirectories scanned concurrently and a
+# per-directory index of entry names that is reused while a directory's mtime is
+# unchanged. Sizes are never cached: rewriting a file does not touch its directory.
+
+import os
+import time
+import heapq
+import fnmatch
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import List, Dict, Optional, Any, Tuple, Iterable
+
+
+DEFAULT_IGNORES = [
+    ".git", ".hg", ".svn", "__pycache__", "node_modules",
+    "venv", ".venv", "env", ".env", ".tox", ".nox",
+    ".mypy_cache", ".pytest_cache", ".ruff_cache", ".idea", ".vscode",
+    "build", "dist", "build_cache", "analysis_cache", "*.egg-info",
+]
+
+class ProjectScanner:
+    INDEX_MAX_AGE = 300.0
+
+    def __init__(self, ignore: Optional[Iterable[str]] = None, workers: int = 8):
+        self.ignore = list(DEFAULT_IGNORES if ignore is None else ignore)
+        self.workers = max(1, workers)
+        self._index: Dict[str, Tuple[int, float, List[str], List[str]]] = {}
+        self._lock = threading.Lock()
+
+    def _ignored(self, name: str, rel: str) -> bool:
+        for pattern in self.ignore:
+            if "/" in pattern:
+                if fnmatch.fnmatch(rel.replace(os.sep, "/"), pattern):
+                    return True
+            elif fnmatch.fnmatch(name, pattern):
+                return True
+        return False
+
+    def _scan_dir(self, path: str) -> Tuple[List[Tuple[str, int]], List[str]]:
+        # One directory level: (files as (name, size), subdirectory names).
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return [], []
+        now = time.time()
+        with self._lock:
+            cached = self._index.get(path)
+        files: List[Tuple[str, int]] = []
+        if cached and cached[0] == mtime and now - cached[1] < self.INDEX_MAX_AGE:
+            # Listing unchanged: skip the readdir, but re-stat each file for its current size.
+            for name in cached[2]:
+                try:
+                    files.append((name, os.stat(os.path.join(path, name), follow_symlinks=False).st_size))
+                except OSError:
+                    continue
+            return files, cached[3]
+        dirs: List[str] = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            dirs.append(entry.name)
+                        elif entry.is_file(follow_symlinks=False):
+                            files.append((entry.name, entry.stat(follow_symlinks=False).st_size))
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        with self._lock:
+            self._index[path] = (mtime, now, [name for name, _ in files], dirs)
+        return files, dirs
+
+    def Scan(self, root: str, top_n: int = 20, large_bytes: int = 10 * 1024 * 1024) -> Dict[str, Any]:
+        root = os.path.abspath(root)
+        start = time.time()
+        largest: List[Tuple[int, str]] = []
+        large_files: List[Tuple[str, int]] = []
+        own_bytes: Dict[str, int] = {}
+        file_count = 0
+
+        if os.path.isfile(root):
+            size = os.path.getsize(root)
+            return {"root": root, "files": 1, "bytes": size, "largest": [(root, size)],
+                    "large_files": [(root, size)] if size >= large_bytes else [], "dirs": [], "elapsed": time.time() - start}
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(self._scan_dir, root): root}
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = futures.pop(future)
+                    files, dirs = future.result()
+                    total = 0
+                    for name, size in files:
+                        total += size
+                        file_count += 1
+                        full = os.path.join(path, name)
+                        if len(largest) < top_n:
+                            heapq.heappush(largest, (size, full))
+                        elif size > largest[0][0]:
+                            heapq.heapreplace(largest, (size, full))
+                        if size >= large_bytes:
+                            large_files.append((full, size))
+                    own_bytes[path] = total
+                    for name in dirs:
+                        sub = os.path.join(path, name)
+                        if not self._ignored(name, os.path.relpath(sub, root)):
+                            futures[pool.submit(self._scan_dir, sub)] = sub
+
+        totals = dict(own_bytes)
+        for path in sorted(own_bytes, key=lambda p: p.count(os.sep), reverse=True):
+            parent = os.path.dirname(path)
+            if path != root and parent in totals:
+                totals[parent] += totals[path]
+
+        dirs = sorted(((os.path.relpath(p, root), b) for p, b in totals.items() if p != root), key=lambda item: item[1], reverse=True)
+        return {
+            "root": root,
+            "files": file_count,
+            "bytes": totals.get(root, 0),
+            "largest": [(p, s) for s, p in sorted(largest, reverse=True)],
+            "large_files": sorted(large_files, key=lambda item: item[1], reverse=True),
+            "dirs": dirs[:top_n],
+            "elapsed": time.time() - start,
+        }
+
+_SCANNER: Optional[ProjectScanner] = None
+
+def SharedScanner(extra_ignores: Optional[Iterable[str]] = None) -> ProjectScanner:
+    # One scanner per session so its directory index is shared by the analysis dialog and the build report.
+    global _SCANNER
+    ignore = DEFAULT_IGNORES + list(extra_ignores or [])
+    if _SCANNER is None or _SCANNER.ignore != ignore:
+        _SCANNER = ProjectScanner(ignore)
+    return _SCANNER
+
+def FormatSize(size: int) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.2f} {unit}"
+        size /= 1024
+    return f"{size:.2f} GB"
@@ -6,8 +6,26 @@
 import os
 from pyclbr import Class
 import sys
+
+# `PyToExe.py build ...` runs headless: dispatch before any Qt/matplotlib import.
+if __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] == "build":
+    from BuildCore import HeadlessMain
+    sys.exit(HeadlessMain(sys.argv[2:]))
+
+# `--import-time` prints an `-X importtime`-style report once the window is shown,
+# `--trace-startup` writes one timed span per startup stage.
+from StartupProfile import ImportTimer, StartupTrace, ElapsedMs, HEAVY_MODULES
+IMPORT_TIMER = ImportTimer().Install() if "--import-time" in sys.argv else None
+STARTUP_TRACE = StartupTrace("--trace-startup" in sys.argv)
+DEBUG_FLAGS = ("--import-time", "--trace-startup")
+
 import time
+import math
 import json
+import gzip
+import queue
+import atexit
+import codecs
 import shlex
 import traceback
 import webbrowser
@@ -16,34 +34,42 @@ import ctypes
 import subprocess
 import importlib
 import importlib.util
-import GPUtil
-import psutil
+try:
+    import psutil
+except ImportError:
+    psutil = None
 import ctypes
 import struct
 import shlex
 import winsound
 import tempfile
+import multiprocessing
+import threading
+from array import array
 from collections import deque
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import numpy as np
-from matplotlib.figure import Figure
-from plyer import notification
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Any
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QObject, QTimer
+from typing import List, Dict, Optional, Any, Tuple
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, QObject, QTimer, QAbstractListModel, QModelIndex
 from PyQt5.QtCore import QSize
-from PyQt5.QtGui import QIcon, QPalette, QColor, QFont
+from PyQt5.QtGui import QIcon, QPalette, QColor, QFont, QKeySequence, QPainter
 from PyQt5.QtWidgets import QColorDialog
 from PyQt5.QtWidgets import QDialog
-from PyQt5.QtCore import QCoreApplication, QProcess
+from PyQt5.QtCore import QProcess
+from BuildCore import CACHE_DIR, BuildCache, BuildRunner, MakeCommands, WarmWorkerOptions, WithDetectedHiddenImports
+from ImportAnalyzer import ImportAnalyzer, FormatReport, SharedParseCache, AuditProject, FormatAudit, DetectHiddenImports
+from ProjectScanner import ProjectScanner, SharedScanner, FormatSize
+from PackageIndex import SharedPackageIndex, EstimateBuild
+from Interpreters import CachedInterpreters, DiscoverInterpreters, Describe
+from LanguageCatalog import LoadCatalog, Flatten
+from SettingsStore import SettingsStore
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QFileDialog, QListWidget, QListWidgetItem,
     QLineEdit, QPushButton, QCheckBox, QPlainTextEdit, QMessageBox, QLabel,
     QHBoxLayout, QVBoxLayout, QGroupBox, QComboBox, QProgressBar, QMenu, QAction,
-    QTabWidget, QSpinBox, QDoubleSpinBox, QTextEdit, QSplitter, QInputDialog
+    QTabWidget, QSpinBox, QDoubleSpinBox, QTextEdit, QSplitter, QInputDialog, QListView, QAbstractItemView
 )
 
+STARTUP_TRACE.Add("imports", 0.0)
 
 SETTINGS_FILE = "settings.json"
 LOG_FILE = "log.txt"
@@ -61,8 +87,34 @@ DEFAULT_SETTINGS = {
     "last_files": [],
     "last_folders": [],
     "python_interpreter": "",
+    "parallel_jobs": 0,
+    "build_cache": True,
+    "build_cache_max_mb": 2048,
+    "incremental": False,
+    "warm_worker": False,
+    "warm_worker_max_jobs": 20,
+    "warm_worker_max_mb": 1536,
+    "merge_batch": False,
+    "merge_name": "suite",
+    "startup_budget_ms": 1500,
+    "settings_save_delay_ms": 500,
+    "settings_backups": 10,
+    "interpreter_cache_ttl": 86400,
+    "venv_scan_depth": 2,
+    "venv_scan_roots": [],
+    "audit_before_build": True,
+    "estimate_before_build": True,
+    "stall_timeout": 0,
+    "stall_action": "abort",
+    "log_max_lines": 20000,
+    "scan_ignore": [],
+    "scan_top_n": 20,
+    "large_file_mb": 10,
+    "log_max_mb": 5,
+    "log_backups": 5,
     "advanced": {
         "hidden_imports": [],
+        "auto_hidden_imports": True,
         "exclude_modules": [],
         "uac_admin": False,
         "key": "",
@@ -99,16 +151,130 @@ DEFAULT_SETTINGS = {
     }
 }
 
-PATHSEP = ";" if os.name == "nt" else ":"
+class LogWriter:
+    # Appends to log.txt from a single background thread through one buffered handle.
+    # The file is rotated into log.txt.1.gz, log.txt.2.gz, ... once it passes max_bytes.
+    FLUSH_INTERVAL = 1.0
+
+    def __init__(self, path: str, max_bytes: int = 5 * 1024 * 1024, backups: int = 5):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.thread: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+
+    def Configure(self, max_mb: float, backups: int):
+        self.max_bytes = max(1, int(float(max_mb) * 1024 * 1024))
+        self.backups = max(0, int(backups))
+
+    def Write(self, text: str):
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+                self.thread.start()
+        self.queue.put(text)
+
+    def Close(self):
+        with self.lock:
+            thread, self.thread = self.thread, None
+        if thread is not None:
+            self.queue.put(None)
+            thread.join(timeout=5)
+
+    def _open(self):
+        try:
+            return open(self.path, "a", encoding="utf-8", buffering=64 * 1024)
+        except Exception:
+            return None
+
+    def _run(self):
+        f = self._open()
+        last_flush = time.time()
+        while True:
+            try:
+                item = self.queue.get(timeout=self.FLUSH_INTERVAL)
+            except queue.Empty:
+                item = ""
+            stop = item is None
+            chunk = [item] if item else []
+            while not stop:
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                else:
+                    chunk.append(item)
+            if f is not None and chunk:
+                try:
+                    f.write("".join(chunk))
+                except Exception:
+                    pass
+            if f is not None and (stop or time.time() - last_flush >= self.FLUSH_INTERVAL):
+                try:
+                    f.flush()
+                except Exception:
+                    pass
+                last_flush = time.time()
+                try:
+                    if f.tell() >= self.max_bytes:
+                        f.close()
+                        self._rotate()
+                        f = self._open()
+                except Exception:
+                    pass
+            if stop:
+                break
+        if f is not None:
+            try:
+                f.close()
+            except Exception:
+                pass
+
+    def _rotate(self):
+        for i in range(self.backups, 0, -1):
+            src = f"{self.path}.{i}.gz"
+            if not os.path.exists(src):
+                continue
+            if i == self.backups:
+                os.remove(src)
+            else:
+                os.replace(src, f"{self.path}.{i + 1}.gz")
+        if self.backups > 0:
+            with open(self.path, "rb") as src, gzip.open(f"{self.path}.1.gz", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+        os.remove(self.path)
+
+_APP_LOG: Optional[LogWriter] = None
+
+def AppLog() -> LogWriter:
+    global _APP_LOG
+    if _APP_LOG is None:
+        _APP_LOG = LogWriter(LOG_FILE)
+        atexit.register(_APP_LOG.Close)
+    return _APP_LOG
+
+# Order of the per-language fallbacks callers may pass to LanguageManager.tr().
+LANGUAGE_ORDER = ("ar", "en", "fr", "ru", "zh")
+_MISSING = object()
 
 class LanguageManager:
-    def __init__(self, settings_path="settings.json", languages_dir="languages"):
+    banner_shown = False
+
+    def __init__(self, settings_path="settings.json", languages_dir="languages", load=True):
+        # load=False when the caller already has the settings and picks the language itself.
         self.languages_dir = languages_dir
         self.settings_path = settings_path
         self.current_language = "ar"
-        self.translations = {}
+        self.entries: Dict[str, Any] = {}
+        self._catalogs = {}
+        self._fallback_index = 0
+        self._bindings: Dict[Tuple[int, str, Optional[int]], Tuple[Any, str, Optional[int], str, tuple]] = {}
         os.makedirs(self.languages_dir, exist_ok=True)
-        self.SaveLoadLanguages()
+        if load:
+            self.SaveLoadLanguages()
     
     def SaveLoadLanguages(self):
         try:
@@ -134,16 +300,22 @@ class LanguageManager:
             return self.LoadLanguages("ar")
 
     def LoadLanguages(self, lang_code: str):
+        # Catalogs already loaded this session are reused while their JSON file is unchanged.
         lang_file = os.path.join(self.languages_dir, f"{lang_code}.json")
         try:
+            file_code = lang_code
             if not os.path.exists(lang_file):
                 print(f"[Language] Language file {lang_code}.json not found, using default language (ar)")
-                lang_file = os.path.join(self.languages_dir, "ar.json")
+                file_code = "ar"
 
-            with open(lang_file, "r", encoding="utf-8") as f:
-                self.translations = json.load(f)
+            catalog = self._catalogs.get(file_code)
+            if catalog is None or not catalog.Fresh():
+                catalog = LoadCatalog(file_code, self.languages_dir)
+                self._catalogs[file_code] = catalog
+            self.entries = catalog.entries
 
             self.current_language = lang_code
+            self._fallback_index = LANGUAGE_ORDER.index(lang_code) if lang_code in LANGUAGE_ORDER else 0
             
             S = "\033[0m"        # Reset
             R = "\033[91;1m"     # Red
@@ -158,11 +330,12 @@ class LanguageManager:
             O = "\033[38;5;202m" # Orange
             
             print(f"[Language] Language loaded -> {lang_code}\n")
-            os.system('cls' if os.name == 'nt' else 'clear')
-            print(f"{C}From Python To Executable\n{Y}Developer {W}: {O}Mohammed Al-Baqer\n{B}Instagram {W}: {P}@wsl.iq{W}")
+            if not LanguageManager.banner_shown:
+                LanguageManager.banner_shown = True
+                print(f"{C}From Python To Executable\n{Y}Developer {W}: {O}Mohammed Al-Baqer\n{B}Instagram {W}: {P}@wsl.iq{W}")
 
-            if not self.translations.get("ui"):
-                self.translations["ui"] = {
+            if not self.entries.get("ui"):
+                self.entries.update(Flatten({"ui": {
                     "title": "عنوان",
                     "message": "رسالة",
                     "button": "زر",
@@ -173,31 +346,64 @@ class LanguageManager:
                     "error": "خطأ",
                     "success": "نجاح",
                     "info": "معلومات"
-                }
+                }}))
             return True
         except Exception as e:
             print(f"[Language] Error loading language {lang_code}: {e}")
             return False
 
     def get(self, key: str, default: str = None) -> str:
-        return self.translations.get(key, default or key)
-
-    def tr(self, key: str, *args) -> str:
-        keys = key.split('.')
-        value = self.translations
+        return self.entries.get(key, default or key)
+
+    def tr(self, key: str, *fallbacks) -> str:
+        # One dict lookup; dotted keys are flattened in the catalog. Extra arguments are
+        # fallbacks for a missing key: one default, or one per language in LANGUAGE_ORDER.
+        text = self.entries.get(key, _MISSING)
+        if text is not _MISSING:
+            return text
+        if not fallbacks:
+            return key
+        return fallbacks[self._fallback_index] if 1 < len(fallbacks) and self._fallback_index < len(fallbacks) else fallbacks[0]
+
+    def trf(self, key: str, default: str, *values) -> str:
+        # tr() for messages with "{}" placeholders.
+        text = self.tr(key, default)
         try:
-            for k in keys:
-                value = value[k]
-            text = value
-        except (KeyError, TypeError):
-            text = key
-        
-        if args:
+            return text.format(*values)
+        except Exception:
+            return text
+
+    def Bind(self, target, setter: str, key: str, *fallbacks, at: Optional[int] = None):
+        # Sets target.setter([at,] text) now and registers it for Retranslate(). Binding the
+        # same target/setter/index again replaces the key (e.g. a Pause/Resume button).
+        self._bindings[(id(target), setter, at)] = (target, setter, at, key, fallbacks)
+        self._apply(target, setter, at, self.tr(key, *fallbacks))
+        return target
+
+    def BindItems(self, combo, key: str, fallbacks: List[str]):
+        # Adds one combo item per entry of a list translation, each bound to "key.N".
+        items = self.tr(key, fallbacks)
+        for index, text in enumerate(items):
+            combo.addItem("")
+            self.Bind(combo, "setItemText", f"{key}.{index}", fallbacks[index] if index < len(fallbacks) else text, at=index)
+        return combo
+
+    @staticmethod
+    def _apply(target, setter: str, at: Optional[int], text):
+        method = getattr(target, setter)
+        if at is None:
+            method(text)
+        else:
+            method(at, text)
+
+    def Retranslate(self) -> int:
+        # Re-applies every binding from the loaded catalog; bindings of deleted widgets are dropped.
+        for handle, (target, setter, at, key, fallbacks) in list(self._bindings.items()):
             try:
-                text = text.format(*args)
-            except Exception:
-                pass
-        return text
+                self._apply(target, setter, at, self.tr(key, *fallbacks))
+            except RuntimeError:
+                del self._bindings[handle]
+        return len(self._bindings)
 
     def AvailableLanguges(self) -> List[str]:
         languages = []
@@ -254,74 +460,73 @@ def Administrator() -> bool:
     except Exception:
         return False
 
-def FindPythonInterpreters() -> List[str]:
-    candidates = []
-    for name in ("python", "python3", "py"):
-        path = shutil.which(name)
-        if path and path not in candidates:
-            candidates.append(path)
-    
-    if os.name == "nt":
-        program_files = os.environ.get("ProgramFiles", r"C:\Program Files")
-        pf_x86 = os.environ.get("ProgramFiles(x86)", r"C:\Program Files (x86)")
-        for base in (program_files, pf_x86):
-            for root, dirs, files in os.walk(base):
-                for f in files:
-                    if f.lower().startswith("python") and f.lower().endswith(".exe"):
-                        p = os.path.join(root, f)
-                        if p not in candidates:
-                            candidates.append(p)
-                break
-    
-    virtual_envs = FindVirtualEnvironments()
-    candidates.extend(virtual_envs)
-    
-    return candidates
-
-def FindVirtualEnvironments() -> List[str]:
-    envs = []
-    common_locations = [
-        os.path.expanduser("~"),
-        os.path.expanduser("~/.virtualenvs"),
-        os.path.expanduser("~/Envs"),
-        os.path.curdir
-    ]
-    
-    for location in common_locations:
-        if os.path.exists(location):
-            for item in os.listdir(location):
-                env_path = os.path.join(location, item)
-                if os.path.isdir(env_path):
-                    python_exe = None
-                    if os.name == "nt":
-                        python_exe = os.path.join(env_path, "Scripts", "python.exe")
-                    else:
-                        python_exe = os.path.join(env_path, "bin", "python")
-                    
-                    if python_exe and os.path.isfile(python_exe):
-                        envs.append(python_exe)
-    return envs
+VIRTUAL_ENV_TYPES = [
+    "venv (Python built-in)",
+    "virtualenv",
+    "conda",
+    "pipenv",
+    "poetry",
+    "rye",
+    "pyenv",
+    "wsl venv",
+]
 
 @dataclass
 class BuildItem:
     entry_script: str
 
+class InterpreterWorker(QObject):
+    done = pyqtSignal(list)
+
+    def __init__(self, ttl: float, force: bool = False, depth: int = 2, roots: Optional[List[str]] = None):
+        super().__init__()
+        self.ttl = ttl
+        self.force = force
+        self.depth = depth
+        self.roots = roots
+        self._cancel = threading.Event()
+
+    def stop(self):
+        self._cancel.set()
+
+    def run(self):
+        try:
+            interpreters = DiscoverInterpreters(self.ttl, self.force, self.depth, self.roots, cancel=self._cancel)
+        except Exception as e:
+            print(f"[Interpreters] Discovery failed: {e}")
+            interpreters = []
+        if not self._cancel.is_set():
+            self.done.emit(interpreters)
+
 class BuildWorker(QObject):
+    FLUSH_INTERVAL = 0.05
+    FLUSH_LINES = 500
+    SAMPLE_INTERVAL = 1.0
+
     line = pyqtSignal(str)
+    lines = pyqtSignal(list)
     done = pyqtSignal(bool)
     progress = pyqtSignal(int)
     cpu_mem = pyqtSignal(float, float)
+    preview = pyqtSignal(str)
 
-    def __init__(self, commands: List[List[str]], cwd: str, python_exec: Optional[str] = None, run_after=False):
+    def __init__(self, commands: List[List[str]], cwd: str, python_exec: Optional[str] = None, run_after=False, jobs: int = 1, cache: Optional[BuildCache] = None, incremental: bool = False, warm: Optional[Dict[str, int]] = None, stall_timeout: int = 0, stall_action: str = "abort", audit: Optional[List[str]] = None, estimate: Optional[List[str]] = None, excludes: Optional[List[str]] = None, detect: Optional[Tuple[Dict[str, Any], List[str]]] = None):
         super().__init__()
         self.commands = commands
         self.cwd = cwd
-        self._stopped = False
         self.python_exec = python_exec
         self.run_after = run_after
+        self.detect = detect
+        self.audit = audit
+        self.estimate = estimate
+        self.excludes = excludes or []
+        self._pending: List[str] = []
+        self._pending_lock = threading.Lock()
+        self._pump_stop = threading.Event()
+        self.runner = BuildRunner(commands, cwd, python_exec=python_exec, jobs=jobs, cache=cache, incremental=incremental, on_line=self._on_line, warm=warm, on_progress=self.progress.emit, stall_timeout=stall_timeout, stall_action=stall_action)
 
     def stop(self):
-        self._stopped = True
+        self.runner.stop()
 
     def EmitSysUsage(self):
         if psutil:
@@ -332,46 +537,91 @@ class BuildWorker(QObject):
             except Exception:
                 pass
 
+    def _on_line(self, text: str):
+        with self._pending_lock:
+            self._pending.append(text)
+            if len(self._pending) >= self.FLUSH_LINES:
+                self._flush_locked()
+
+    def _flush_locked(self):
+        if self._pending:
+            chunk, self._pending = self._pending, []
+            self.lines.emit(chunk)
+
+    def FlushLines(self):
+        with self._pending_lock:
+            self._flush_locked()
+
+    def _pump(self):
+        last_sample = 0.0
+        while not self._pump_stop.wait(self.FLUSH_INTERVAL):
+            self.FlushLines()
+            now = time.time()
+            if now - last_sample >= self.SAMPLE_INTERVAL:
+                last_sample = now
+                self.EmitSysUsage()
+
+    def _detect_hidden(self):
+        # Hidden-import detection may probe the interpreter and parse the whole project,
+        # so it runs here rather than on the GUI thread; the commands are rebuilt with
+        # the detected modules before the runner starts.
+        options, entries = self.detect
+        detected = WithDetectedHiddenImports(options, entries, self.python_exec, self._on_line)
+        if detected is options:
+            return
+        try:
+            commands = MakeCommands(detected, entries, cwd=self.cwd)
+        except Exception as e:
+            self._on_line(f"[WARN] Hidden import detection failed: {e}")
+            return
+        self.commands = self.runner.commands = commands
+        self.preview.emit("\n\n".join(" ".join(map(quote, c)) for c in commands))
+
+    def _audit(self):
+        # Pre-build audit of every local module the entries reach. Findings are
+        # informational and never stop the build.
+        try:
+            audit = AuditProject(self.audit, self.python_exec, SharedParseCache())
+        except Exception as e:
+            self._on_line(f"[WARN] Code audit failed: {e}")
+            return
+        for text in FormatAudit(audit, limit=5).splitlines():
+            self._on_line(f"[AUDIT] {text}")
+
+    def _estimate(self):
+        try:
+            estimate = EstimateBuild(self.estimate, self.python_exec, self.excludes)
+        except Exception as e:
+            self._on_line(f"[WARN] Size estimate failed: {e}")
+            return
+        if estimate["error"]:
+            self._on_line(f"[WARN] Package index unavailable: {estimate['error']}")
+            return
+        if estimate["packages"]:
+            top = ", ".join(f"{name} {FormatSize(size)}" for name, _, size in estimate["packages"][:5])
+            self._on_line(f"[ESTIMATE] Third-party packages: {FormatSize(estimate['bytes'])} in {len(estimate['packages'])} distributions ({top})")
+        for module, dist, size in estimate["exclude"][:5]:
+            self._on_line(f"[ESTIMATE] {module} ({dist}, {FormatSize(size)}) is only imported optionally; exclude it if it is not needed")
+
     def run(self):
-        ok = True
-        for cmd in self.commands:
-            if self._stopped:
-                ok = False
-                break
-            display_cmd = " ".join(map(str, cmd))
-            self.line.emit(f"\n=== تشغيل: {display_cmd}\n")
-            try:
-                with subprocess.Popen(
-                    cmd,
-                    cwd=self.cwd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
-                    universal_newlines=True
-                ) as p:
-                    for out_line in p.stdout:
-                        if self._stopped:
-                            p.kill()
-                            ok = False
-                            break
-                        text = out_line.rstrip("\n")
-                        self.line.emit(text)
-                        self.EmitSysUsage()
-                rc = p.wait()
-                if rc != 0:
-                    ok = False
-                    self.line.emit(f"[ERROR] The Process Ended with a code ! -> {rc}")
-                    break
-            except FileNotFoundError:
-                ok = False
-                self.line.emit("[ERROR] The command was not found")
-                break
-            except Exception as e:
-                ok = False
-                self.line.emit(f"[ERROR] {e}")
-                break
-        
+        pump = threading.Thread(target=self._pump, daemon=True)
+        pump.start()
+        try:
+            if self.detect:
+                self._detect_hidden()
+            if self.audit:
+                self._audit()
+            if self.estimate:
+                self._estimate()
+            ok = self.runner.run()
+        except Exception as e:
+            self._on_line(f"[ERROR] {e}")
+            ok = False
+        finally:
+            self._pump_stop.set()
+            pump.join()
+            self.FlushLines()
+
         if ok and self.run_after and self.commands:
             try:
                 output_dir = self.commands[0][self.commands[0].index("--distpath") + 1] if "--distpath" in self.commands[0] else "dist"
@@ -392,80 +642,217 @@ class BuildWorker(QObject):
         
         self.done.emit(ok)
 
+class LogBuffer:
+    # Keeps the newest `max_lines` lines in memory and spills older ones to a temporary file.
+    # Spilled lines stay addressable by row through a byte-offset index.
+    def __init__(self, max_lines: int = 20000):
+        self.max_lines = max(1000, int(max_lines or 0))
+        self.memory: deque = deque()
+        self.spill = None
+        self.offsets = array("q")
+        self.spill_end = 0
+
+    def __len__(self) -> int:
+        return len(self.offsets) + len(self.memory)
+
+    def Append(self, lines: List[str]):
+        self.memory.extend(lines)
+        if len(self.memory) > self.max_lines:
+            self._spill(len(self.memory) - self.max_lines + self.max_lines // 4)
+
+    def _spill(self, count: int):
+        if self.spill is None:
+            self.spill = tempfile.TemporaryFile(prefix="pytoexe-log-")
+        self.spill.seek(self.spill_end)
+        chunk = []
+        for _ in range(min(count, len(self.memory))):
+            data = (self.memory.popleft() + "\n").encode("utf-8", "replace")
+            self.offsets.append(self.spill_end)
+            self.spill_end += len(data)
+            chunk.append(data)
+        self.spill.write(b"".join(chunk))
+        self.spill.flush()
+
+    def Line(self, row: int) -> str:
+        spilled = len(self.offsets)
+        if row >= spilled:
+            return self.memory[row - spilled]
+        start = self.offsets[row]
+        end = self.offsets[row + 1] if row + 1 < spilled else self.spill_end
+        self.spill.seek(start)
+        return self.spill.read(end - start).decode("utf-8", "replace").rstrip("\n")
+
+    def Export(self, f):
+        if self.spill is not None:
+            self.spill.flush()
+            self.spill.seek(0)
+            decoder = codecs.getincrementaldecoder("utf-8")("replace")
+            remaining = self.spill_end
+            while remaining > 0:
+                data = self.spill.read(min(remaining, 1024 * 1024))
+                if not data:
+                    break
+                f.write(decoder.decode(data))
+                remaining -= len(data)
+        for text in self.memory:
+            f.write(text + "\n")
+
+    def Clear(self):
+        self.memory.clear()
+        self.offsets = array("q")
+        self.spill_end = 0
+        if self.spill is not None:
+            try:
+                self.spill.close()
+            except Exception:
+                pass
+            self.spill = None
+
+class LogModel(QAbstractListModel):
+    def __init__(self, buffer: LogBuffer, parent=None):
+        super().__init__(parent)
+        self.buffer = buffer
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.buffer)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            try:
+                return self.buffer.Line(index.row())
+            except Exception:
+                return ""
+        return None
+
+    def Append(self, lines: List[str]):
+        if not lines:
+            return
+        start = len(self.buffer)
+        self.beginInsertRows(QModelIndex(), start, start + len(lines) - 1)
+        self.buffer.Append(lines)
+        self.endInsertRows()
+
+    def Clear(self):
+        self.beginResetModel()
+        self.buffer.Clear()
+        self.endResetModel()
+
+class LogView(QListView):
+    # Only the visible rows are ever rendered, so the view stays fast however long the log grows.
+    def __init__(self, max_lines: int = 20000, parent=None):
+        super().__init__(parent)
+        self.buffer = LogBuffer(max_lines)
+        self.model_ = LogModel(self.buffer, self)
+        self.setModel(self.model_)
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setFont(QFont("Consolas" if os.name == "nt" else "Monospace"))
+        self._placeholder = ""
+
+    def setPlaceholderText(self, text: str):
+        self._placeholder = text
+        self.viewport().update()
+
+    def appendPlainText(self, text: str):
+        self.appendLines(text.split("\n"))
+
+    def appendLines(self, lines: List[str]):
+        bar = self.verticalScrollBar()
+        follow = bar.value() >= bar.maximum() - 2
+        self.model_.Append(lines)
+        if follow:
+            self.scrollToBottom()
+
+    def clear(self):
+        self.model_.Clear()
+
+    def Export(self, f):
+        self.buffer.Export(f)
+
+    def keyPressEvent(self, event):
+        if event.matches(QKeySequence.Copy):
+            rows = sorted(index.row() for index in self.selectedIndexes())
+            QApplication.clipboard().setText("\n".join(self.buffer.Line(r) for r in rows))
+            return
+        super().keyPressEvent(event)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self._placeholder and not len(self.buffer):
+            painter = QPainter(self.viewport())
+            painter.setPen(self.palette().color(QPalette.PlaceholderText))
+            painter.drawText(self.viewport().rect().adjusted(4, 4, -4, -4), Qt.AlignTop | Qt.AlignLeft, self._placeholder)
+            painter.end()
+
 class PyInstallerExtras:
-    def __init__(self, presets_dir="presets"):
+    def __init__(self, presets_dir="presets", scan_ignore: Optional[List[str]] = None, scan_top_n: int = 20, large_file_mb: float = 10):
         self.presets_dir = presets_dir
+        self.scan_ignore = scan_ignore or []
+        self.scan_top_n = scan_top_n
+        self.large_bytes = int(large_file_mb * 1024 * 1024)
         os.makedirs(presets_dir, exist_ok=True)
 
-    def AnalyzeMissingImports(self, script_path: str) -> List[str]:
+    def AnalyzeImports(self, script_path: str, python_exec: Optional[str] = None) -> Dict[str, Any]:
+        return ImportAnalyzer(python_exec, SharedParseCache()).Analyze(script_path)
+
+    def AnalyzeMissingImports(self, script_path: str, python_exec: Optional[str] = None) -> List[str]:
         if not os.path.isfile(script_path):
             return []
-
-        missing = set()
-        cmd = ["pyinstaller", "--debug=imports", "--noconfirm", "--onefile", script_path]
         try:
-            with subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                universal_newlines=True
-            ) as proc:
-                for line in proc.stdout:
-                    if "ModuleNotFoundError" in line:
-                        mod_name = line.split("'")[-2]
-                        missing.add(mod_name)
-                    elif "WARNING" in line and "hidden import" in line.lower():
-                        parts = line.split("'")
-                        if len(parts) >= 2:
-                            missing.add(parts[1])
+            result = self.AnalyzeImports(script_path, python_exec)
         except Exception as e:
             print(f"[Analyzer] Failed to analyze: {e}")
-        finally:
-            for d in ("build", "__pycache__"):
-                if os.path.isdir(d):
-                    shutil.rmtree(d, ignore_errors=True)
-            spec_file = os.path.splitext(os.path.basename(script_path))[0] + ".spec"
-            if os.path.isfile(spec_file):
-                os.remove(spec_file)
-
-        return list(missing)
+            return []
+        return [item["module"] for item in result["missing"] if not item["optional"]]
 
-    def AdvancedDependencyAnalysis(self, script_path: str) -> Dict[str, Any]:
+    def AdvancedDependencyAnalysis(self, script_path: str, python_exec: Optional[str] = None) -> Dict[str, Any]:
         analysis_result = {
             "missing_imports": [],
             "large_files": [],
+            "largest_files": [],
+            "dir_sizes": [],
             "suspicious_imports": [],
             "performance_issues": [],
-            "recommendations": []
+            "recommendations": [],
+            "audit": None,
+            "packages": [],
+            "package_bytes": 0,
+            "exclude_suggestions": []
         }
         
-        missing = self.AnalyzeMissingImports(script_path)
+        missing = self.AnalyzeMissingImports(script_path, python_exec)
         analysis_result["missing_imports"] = missing
         
-        script_dir = os.path.dirname(script_path)
-        for root, dirs, files in os.walk(script_dir):
-            for file in files:
-                file_path = os.path.join(root, file)
-                if os.path.getsize(file_path) > 10 * 1024 * 1024:
-                    analysis_result["large_files"].append(file_path)
-        
-        suspicious_keywords = ["os.system", "subprocess", "eval", "exec", "pickle", "marshal"]
-        with open(script_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-            for keyword in suspicious_keywords:
-                if keyword in content:
-                    analysis_result["suspicious_imports"].append(keyword)
-        
-        performance_issues = ["time.sleep", "while True", "recursive"]
-        for issue in performance_issues:
-            if issue in content:
-                analysis_result["performance_issues"].append(issue)
-        
-        if "tkinter" in content:
-            analysis_result["recommendations"].append("نوصي باستخدام --noconsole لتطبيقات GUI")
-        if "requests" in content or "urllib" in content:
-            analysis_result["recommendations"].append("تأكد من إضافة شهادات SSL إذا كان التطبيق يتصل بالإنترنت")
+        script_dir = os.path.dirname(os.path.abspath(script_path))
+        scan = SharedScanner(self.scan_ignore).Scan(script_dir, self.scan_top_n, self.large_bytes)
+        analysis_result["large_files"] = [path for path, _ in scan["large_files"]]
+        analysis_result["largest_files"] = scan["largest"]
+        analysis_result["dir_sizes"] = scan["dirs"]
+        
+        try:
+            estimate = EstimateBuild([script_path], python_exec)
+            analysis_result["packages"] = estimate["packages"]
+            analysis_result["package_bytes"] = estimate["bytes"]
+            analysis_result["exclude_suggestions"] = estimate["exclude"]
+        except Exception as e:
+            print(f"[PackageIndex] Failed to estimate: {e}")
+
+        try:
+            audit = AuditProject([script_path], python_exec, SharedParseCache())
+        except Exception as e:
+            print(f"[Audit] Failed to audit: {e}")
+            return analysis_result
+        analysis_result["audit"] = audit
+        for item in audit["findings"]:
+            where = f"{os.path.relpath(item['file'], script_dir)}:{item['line']}"
+            if item["category"] == "security":
+                analysis_result["suspicious_imports"].append(f"{item['detail'] or item['rule']} ({where})")
+            elif item["category"] == "performance":
+                analysis_result["performance_issues"].append(f"{item['rule']} ({where})")
+            elif item["message"] not in analysis_result["recommendations"]:
+                analysis_result["recommendations"].append(item["message"])
         
         return analysis_result
 
@@ -532,104 +919,88 @@ def GetScriptPaths(ui) -> list:
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.settings = {}
-        self.LoadSettings()
-
-        self.lang_manager = LanguageManager()
-        self.lang_manager.LoadLanguages("ar")
-        self.setWindowTitle(self.lang_manager.tr("app_title", "From Python To Executable v3.1.0"))
-        self.resize(1200, 800)
-        self.icon_path = r"icon\icon.png" if os.path.isfile(r"icon\icon.png") else None
-        self.shield_icon = r"icon\run.ico" if os.path.isfile(r"icon\run.ico") else self.icon_path
-        if self.icon_path:
-            self.setWindowIcon(QIcon(self.icon_path))
-            
-        self.info_label = QLabel()
-        self.info_label.setWordWrap(True)
-        self.info_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-        self.info_label.setStyleSheet("background-color: rgba(255, 255, 255, 0.8); border: 1px solid #ccc; padding: 5px;")
-        self.info_label.setMinimumHeight(100)
-
+        # One ordered pass: settings.json and the language file are each read once, and
+        # every stage is a span in the --trace-startup report.
         self.interval_ms = 1000
-        self.settings = {}
         self.thread = None
         self.worker = None
+        self._interp_thread = None
+        self._interp_worker = None
+        self._lazy_tabs: Dict[str, Tuple[int, Any, Any]] = {}
         self._indeterminate = False
 
-        self.LoadSettings()
-        self.CreateBackup()
-        
-        self.lang_manager = LanguageManager()
-        self.LoadLanguagesFromSettings()
-        
-        self.__CreateMenus__()
-        self.CreateMenusGUI()
-        self.setAcceptDrops(True)
-        self.__ApplySettingsGUI__()
-        
-        self.ui_timer = QTimer()
-        self.ui_timer.setInterval(1000)
-        self.ui_timer.timeout.connect(self.__UpdateSysLabelUsing__)
-        self.ui_timer.start()
-        
-        self.apply_theme()
-        
-        try:
-            self.plugin_manager = PluginManager(PLUGINS_DIR)
-            self.plugin_manager.LoadPlugins()
-        except Exception as e:
-            print(f"[Plugin] Failed to load plugins: {e}")
+        with STARTUP_TRACE.Span("settings"):
+            self.store = SettingsStore(SETTINGS_FILE, BACKUP_DIR, DEFAULT_SETTINGS)
+            self.LoadSettings()
+            self.CreateBackup()
+            # SaveSettings() only collects and restarts this timer; the file is written once it fires.
+            self._save_timer = QTimer(self)
+            self._save_timer.setSingleShot(True)
+            self._save_timer.setInterval(self.settings.get("settings_save_delay_ms", 500))
+            self._save_timer.timeout.connect(self.FlushSettings)
+            AppLog().Configure(self.settings.get("log_max_mb", 5), self.settings.get("log_backups", 5))
+            self.extra = PyInstallerExtras(scan_ignore=self.settings.get("scan_ignore", []), scan_top_n=self.settings.get("scan_top_n", 20), large_file_mb=self.settings.get("large_file_mb", 10))
+
+        with STARTUP_TRACE.Span("translations"):
+            self.lang_manager = LanguageManager(load=False)
+            self.LoadLanguagesFromSettings()
+
+        with STARTUP_TRACE.Span("widgets"):
+            self.lang_manager.Bind(self, "setWindowTitle", "app_title", "From Python To Executable v3.1.0")
+            self.resize(1200, 800)
+            self.icon_path = r"icon\icon.png" if os.path.isfile(r"icon\icon.png") else None
+            self.shield_icon = r"icon\run.ico" if os.path.isfile(r"icon\run.ico") else self.icon_path
+            if self.icon_path:
+                self.setWindowIcon(QIcon(self.icon_path))
+                
+            self.info_label = QLabel()
+            self.info_label.setWordWrap(True)
+            self.info_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+            self.info_label.setStyleSheet("background-color: rgba(255, 255, 255, 0.8); border: 1px solid #ccc; padding: 5px;")
+            self.info_label.setMinimumHeight(100)
+
+            self.__CreateMenus__()
+            self.CreateMenusGUI()
+            self.setAcceptDrops(True)
+            self.__ApplySettingsGUI__()
             
-    def RestartApplication(self):
-        exe_path = os.path.abspath(sys.argv[0])
-        bat_path = os.path.join(tempfile.gettempdir(), "restart_pytoexe.bat")
-        with open(bat_path, "w", encoding="utf-8") as bat:
-            bat.write(f"""@echo off
-    timeout /t 1 >nul
-    start "" "{exe_path}"
-    exit
-    """)
-
-        os.startfile(bat_path)
-        QCoreApplication.quit()
-
-
+            self.ui_timer = QTimer()
+            self.ui_timer.setInterval(1000)
+            self.ui_timer.timeout.connect(self.__UpdateSysLabelUsing__)
+            self.ui_timer.start()
+            
+            self.apply_theme()
         
+        with STARTUP_TRACE.Span("plugins"):
+            try:
+                self.plugin_manager = PluginManager(PLUGINS_DIR)
+                self.plugin_manager.LoadPlugins()
+            except Exception as e:
+                print(f"[Plugin] Failed to load plugins: {e}")
+            
     def ChangeLanguage(self, lang_code: str):
-        if self.lang_manager.LoadLanguages(lang_code):
-            self.settings["language"] = lang_code
-            self.SaveSettings()
-            self.RefreshGUI()
-
-            msg = {
-                "ar": "تم تغيير اللغة إلى (العربية)",
-                "en": "Language changed to (English)",
-                "fr": "La langue a été changée en (Français)",
-                "ru": "Язык изменён на (Русский)",
-                "zh": "语言已更改为 (中文)"
-            }.get(lang_code, "Language changed.")
-
-            restart_q = {
-                "ar": "هل تريد إعادة تشغيل البرنامج الآن لتطبيق التغييرات؟",
-                "en": "Do you want to restart now to apply changes?",
-                "fr": "Voulez-vous redémarrer maintenant pour appliquer les modifications ?",
-                "ru": "Хотите перезапустить сейчас?",
-                "zh": "是否现在重新启动？"
-            }.get(lang_code, "Restart now?")
-
-            QMessageBox.information(self,
-                                    self.lang_manager.tr("language", "اللغة"),
-                                    msg)
-
-            reply = QMessageBox.question(self,
-                                        self.lang_manager.tr("language", "اللغة"),
-                                        restart_q,
-                                        QMessageBox.Yes | QMessageBox.No)
+        # Bound texts are swapped in place from the catalog; the build, its log and the
+        # window state are untouched, so no restart is needed.
+        start = time.perf_counter()
+        if not self.lang_manager.LoadLanguages(lang_code):
+            return
+        count = self.lang_manager.Retranslate()
+        self.settings["language"] = lang_code
+        self.SaveSettings()
+        AppLog().Write(f"[LANGUAGE] {lang_code}: {count} texts updated in {(time.perf_counter() - start) * 1000:.1f} ms\n")
 
-            if reply == QMessageBox.Yes:
-                self.RestartApplication()
+        msg = {
+            "ar": "تم تغيير اللغة إلى (العربية)",
+            "en": "Language changed to (English)",
+            "fr": "La langue a été changée en (Français)",
+            "ru": "Язык изменён на (Русский)",
+            "zh": "语言已更改为 (中文)"
+        }.get(lang_code, "Language changed.")
+
+        QMessageBox.information(self,
+                                self.lang_manager.tr("language", "اللغة"),
+                                msg)
 
-            
     def LoadLanguagesFromSettings(self):
         try:
             if not hasattr(self, 'settings') or not self.settings:
@@ -651,249 +1022,119 @@ class MainWindow(QMainWindow):
             print(f"[Language] Failed to load language from settings: {e}")
             self.lang_manager.LoadLanguages("ar")
             
-    def RefreshGUI(self):
-        self.ApplyLanguage()
-        self.apply_theme()
-
-    def ApplyLanguage(self):
-        tr = self.lang_manager.tr        
-        self.setWindowTitle(self.lang_manager.tr("app_title", "from Python To Executable v3.1.0"))
-        self.UpdateMenusText()
-        self.UpdateTextGUI()
-    
-    def UpdateMenusText(self):
-        tr = self.lang_manager.tr
-        self.menuBar().actions()[0].setText(tr("file_menu", "قائمة الملف"))
-    
-    def UpdateTextGUI(self):
-        tr = self.lang_manager.tr
-       
-        if not hasattr(self, "tab_basic"):
-            return
-        self.tab_basic.setText(tr("tab_basic", "أساسي"))
-        self.tab_advanced.setText(tr("tab_advanced", "متقدم"))
-        self.tab_version.setText(tr("tab_version", "معلومات الإصدار"))
-        self.tab_security.setText(tr("tab_security", "الأمان"))
-        
-        self.entryLabel.setText(tr("options_os_system", "خيارات نظام التشغيل"))
-        
-        self.modeCombo.setItemText(0, tr("single_file"))
-        self.modeCombo.setItemText(1, tr("batch_files"))
-        self.entryBtn.setText(tr("choose_file"))
-        self.addEntryBtn.setText(tr("add_script"))
-        self.remEntryBtn.setText(tr("remove_selected"))
-        self.oneFileChk.setText(tr("one_file"))
-        self.consoleChk.setText(tr("show_console"))
-        self.cleanChk.setText(tr("clean_before"))
-        self.buildSystemCombo.setItemText(0, tr("PyInstaller", "PyInstaller تجميع شامل"))
-        self.buildSystemCombo.setItemText(1, tr("cx_Freeze", "cx_Freeze تجميع تقليدي"))
-        self.buildSystemCombo.setItemText(2, tr("Nuitka", "Nuitka C مترجم لغة"))
-        self.buildSystemCombo.setItemText(3, tr("PyOxidizer", "PyOxidizer Rustمدمج بـ"))
-        self.platformCombo.setItemText(0, tr("Windows 32-bit (win32)", "Windows 32-bit (win32)"))
-        self.platformCombo.setItemText(1, tr("Windows 64-bit (win64)", "Windows 64-bit (win64)"))
-        self.platformCombo.setItemText(2, tr("Linux", "Linux"))
-        self.platformCombo.setItemText(3, tr("macOS", "macOS"))
-        self.templateCombo.setItemText(0, tr("Application (GUI)", "تطبيق واجهة رسومية (GUI)"))
-        self.templateCombo.setItemText(1, tr("Application (CLI)", "تطبيق وحدة التحكم (CLI)"))
-        self.templateCombo.setItemText(2, tr("Application (Service)", "تطبيق خدمة (Service)"))
-        self.templateCombo.setItemText(3, tr("Application (Web)", "تطبيق ويب (Web)"))
-        self.templateCombo.setItemText(4, tr("Custom (Custom)", "مخصص (Custom)"))
-        self.optimizeChk.setText(tr("enable_optimizations"))
-        self.stripChk.setText(tr("strip_info"))
-        self.noPreferRedirectChk.setText(tr("disable_redirect"))
-        self.obfuscateChk.setText(tr("obfuscation"))
-        self.antiDebugChk.setText(tr("anti_debug"))
-        self.packerChk.setText(tr("packer"))
-        self.certFileBtn.setText(tr("choose_certificate"))
-        self.certPassEdit.setPlaceholderText(tr("cert_password"))
-        self.timestampCombo.setItemText(0, tr("http://timestamp.digicert.com", "http://timestamp.digicert.com"))
-        self.timestampCombo.setItemText(1, tr("http://timestamp.comodoca.com", "http://timestamp.comodoca.com"))
-        self.timestampCombo.setItemText(2, tr("http://timestamp.globalsign.com", "http://timestamp.globalsign.com"))
-        self.addFileBtn.setText(tr("add_file"))
-        self.remFileBtn.setText(tr("remove_file"))
-        self.addFolderBtn.setText(tr("add_folder"))
-        self.remFolderBtn.setText(tr("remove_folder"))
-        self.compressionCombo.setItemText(0, tr("compression_levels.0", "بدون ضغط"))
-        self.compressionCombo.setItemText(1, tr("compression_levels.1", "ضغط عادي"))
-        self.compressionCombo.setItemText(2, tr("compression_levels.2", "ضغط عالي"))
-        self.encryptionChk.setText(tr("encrypt_resources"))
-        self.outBtn.setText(tr("choose_output"))
-        self.iconBtn.setText(tr("choose_icon"))
-        self.manifestBtn.setText(tr("choose_manifest"))
-        self.buildBtn.setText(tr("start_build_button"))
-        self.cancelBtn.setText(tr("cancel"))
-        self.runAfterChk.setText(tr("run_after"))
-        self.sysUsageLabel.setText(tr("sys_usage", "CPU: -%  RAM: -%"))
-        self.cmdPreview.setPlaceholderText(tr("command_placeholder"))
-        self.log.setPlaceholderText(tr("log_placeholder"))
-        self.reportText.setPlaceholderText(tr("report_placeholder"))
-        self.saveLogBtn.setText(tr("save_log"))
-        self.openDistBtn.setText(tr("open_output"))
-        self.openBuildBtn.setText(tr("open_build"))
-        self.testOutputBtn.setText(tr("test_output"))
-        self.setWindowTitle(tr("app_title"))
-        try:
-            QApplication.processEvents()
-            self.repaint()
-            mb = self.menuBar()
-            if mb:
-                mb.update()
-        except Exception:
-            pass
-
-        try:
-            menubar = self.menuBar()
-            for action in menubar.actions():
-                text = action.text().lower()
-            if "language" in text or "اللغة" in text:
-                action.setText(tr("language_menu", "اللغة"))
-            if "file" in text or "الملف" in text:
-                action.setText(tr("file_menu", "الملف"))
-            if "build" in text or "البناء" in text:
-                action.setText(tr("build_menu", "البناء"))
-            if "tools" in text or "أدوات" in text:
-                action.setText(tr("tools_menu", "أدوات"))
-            if "view" in text or "المظهر" in text:
-                action.setText(tr("view_menu", "المظهر"))
-            if "settings" in text or "الإعدادات" in text:
-                action.setText(tr("settings_menu", "الإعدادات"))
-            if "help" in text or "مساعدة" in text:
-                action.setText(tr("help_menu", "مساعدة"))
-            if "about" in text or "حول" in text:
-                action.setText(tr("about_menu", "حول"))
-            if "exit" in text or "خروج" in text:
-                action.setText(tr("exit_menu", "خروج"))
-                action.triggered.connect(self.close)
-        except Exception:
-            pass
-        
-        try:
-            addtab = addtab = self.tabWidget.widget(0)
-            addtab.setTitle(tr("tab_basic", "أساسي", "Basic", "Basique", "Базовый", "基础"))
-        except Exception:
-            pass
-        
-        try:
-            addtab = self.tabWidget.widget(1)
-            addtab.setTitle(tr("tab_advanced", "متقدم", "Advanced", "Avancé", "Продвинутый", "高级"))
-        except Exception:
-            pass
-        
-        try:
-            addtab = self.tabWidget.widget(2)
-            addtab.setTitle(tr("tab_version", "معلومات الإصدار", "Version Info", "Infos de version", "Информация о версии", "版本信息"))
-        except Exception:
-            pass
-        
-        try:
-            addtab = self.tabWidget.widget(3)
-            addtab.setTitle(tr("tab_security", "الأمان", "Security", "Sécurité", "Безопасность", "安全"))
-        except Exception:
-            pass
-        
-        try:
-            addtab = self.tabWidget.widget(4)
-            addtab.setTitle(tr("tab_resources", "الموارد", "Resources", "Ressources", "Ресурсы", "资源"))
-        except Exception:
-            pass
-        
-        try:
-            addtab = self.tabWidget.widget(5)
-            addtab.setTitle(tr("tab_log", "السجل", "Log", "Journal", "Журнал", "日志"))
-        except Exception:
-            pass
-        
-        try: # entryLabel خيارات نظام التشغيل
-            addtab = self.entryLabel
-            addtab.setText(tr("options_os_system", "خيارات نظام التشغيل", "OS System Options", "Options du système d'exploitation", "Параметры ОС", "操作系统选项"))
-        except Exception:
-            pass
-
     def LoadSettings(self):
-        if os.path.isfile(SETTINGS_FILE):
-            try:
-                with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
-                    self.settings = json.load(f)
-            except Exception as e:
-                print(f"[Settings] Failed to load settings: {e}")
-                self.settings = DEFAULT_SETTINGS.copy()
-        else:
-            self.settings = DEFAULT_SETTINGS.copy()
+        self.settings = self.store.Load()
 
     def CreateBackup(self):
-        os.makedirs(BACKUP_DIR, exist_ok=True)
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        backup_file = os.path.join(BACKUP_DIR, f"settings_backup_{timestamp}.json")
-        try:
-            shutil.copy2(SETTINGS_FILE, backup_file)
-        except Exception:
-            pass
+        self.store.Backup(self.settings.get("settings_backups", 10))
 
-    def SaveSettings(self):
+    def __TabBuilt__(self, name: str) -> bool:
+        return name not in self._lazy_tabs
+
+    def __EnsureTab__(self, name: str):
+        # Builds a lazy tab into its placeholder and applies the settings model to it.
+        entry = self._lazy_tabs.pop(name, None)
+        if entry is None:
+            return
+        index, builder, apply = entry
+        self.leftTabs.widget(index).layout().addWidget(builder())
+        if apply:
+            apply()
+
+    def _on_left_tab_changed(self, index: int):
+        for name, entry in list(self._lazy_tabs.items()):
+            if entry[0] == index:
+                self.__EnsureTab__(name)
+
+    def CurrentInterpreter(self) -> Optional[str]:
+        # The combo once the Advanced tab exists, otherwise the saved interpreter.
+        text = self.interpCombo.currentText() if self.__TabBuilt__("advanced") else self.settings.get("python_interpreter", "")
+        return text.strip() or None
+
+    def __CollectSettings__(self):
+        # Widgets -> self.settings. Tabs that were never opened keep the values already in the model.
         self.settings["onefile"] = self.oneFileChk.isChecked()
         self.settings["noconsole"] = not self.consoleChk.isChecked()
         self.settings["clean"] = self.cleanChk.isChecked()
+        self.settings["build_cache"] = self.cacheChk.isChecked()
+        self.settings["incremental"] = self.incrementalChk.isChecked()
+        self.settings["warm_worker"] = self.warmWorkerChk.isChecked()
+        self.settings["merge_batch"] = self.mergeChk.isChecked()
+        self.settings["audit_before_build"] = self.auditChk.isChecked()
+        self.settings["estimate_before_build"] = self.estimateChk.isChecked()
         self.settings["last_output"] = self.outLine.text().strip()
         self.settings["last_icon"] = self.iconLine.text().strip()
         self.settings["last_manifest"] = self.manifestLine.text().strip()
         self.settings["last_entries"] = [self.entryList.item(i).text() for i in range(self.entryList.count())]
-        self.settings["last_files"] = [self.filesList.item(i).text() for i in range(self.filesList.count())]
-        self.settings["last_folders"] = [self.foldersList.item(i).text() for i in range(self.foldersList.count())]
-        self.settings["python_interpreter"] = self.interpCombo.currentText()
+        self.settings["parallel_jobs"] = self.jobsSpin.value()
+        self.settings["stall_timeout"] = self.stallSpin.value()
         self.settings["language"] = self.lang_manager.current_language
-        
-        self.settings["advanced"] = {
+
+        adv = self.settings.setdefault("advanced", {})
+        adv.update({
             "hidden_imports": [s.strip() for s in self.hiddenImportsLine.text().split(",") if s.strip()],
+            "auto_hidden_imports": self.autoHiddenChk.isChecked(),
             "exclude_modules": [s.strip() for s in self.excludeModulesLine.text().split(",") if s.strip()],
             "uac_admin": self.uacChk.isChecked(),
             "key": self.keyLine.text().strip(),
-            "optimize": self.optimizeChk.isChecked(),
-            "strip": self.stripChk.isChecked(),
-            "no_prefer_redirect": self.noPreferRedirectChk.isChecked(),
-            "obfuscate": self.obfuscateChk.isChecked(),
-            "anti_debug": self.antiDebugChk.isChecked(),
-            "packer": self.packerChk.isChecked()
-        }
-        
-        self.settings["version_info"] = {
-            "version": self.versionEdit.text().strip(),
-            "company": self.companyEdit.text().strip(),
-            "copyright": self.copyrightEdit.text().strip(),
-            "description": self.descriptionEdit.text().strip()
-        }
-        
-        self.settings["security"] = {
-            "sign_certificate": self.certFileEdit.text().strip(),
-            "cert_password": self.certPassEdit.text().strip(),
-            "timestamp_server": self.timestampCombo.currentText()
-        }
-        
-        self.settings["build_system"] = self.buildSystemCombo.currentText()
-        self.settings["platform"] = self.platformCombo.currentText()
-        self.settings["virtual_env"] = self.virtualEnvCombo.currentText()
-        self.settings["template"] = self.templateCombo.currentText()
-        self.settings["resource_compression"] = self.compressionCombo.currentText()
-        self.settings["resource_encryption"] = self.encryptionChk.isChecked()
-        
+        })
+
+        if self.__TabBuilt__("advanced"):
+            self.settings["python_interpreter"] = self.interpCombo.currentText()
+            adv.update({
+                "optimize": self.optimizeChk.isChecked(),
+                "strip": self.stripChk.isChecked(),
+                "no_prefer_redirect": self.noPreferRedirectChk.isChecked(),
+            })
+            self.settings.setdefault("version_info", {}).update({
+                "version": self.versionEdit.text().strip(),
+                "company": self.companyEdit.text().strip(),
+                "copyright": self.copyrightEdit.text().strip(),
+                "description": self.descriptionEdit.text().strip()
+            })
+            self.settings["build_system"] = self.buildSystemCombo.currentText()
+            self.settings["platform"] = self.platformCombo.currentText()
+            self.settings["virtual_env"] = self.virtualEnvCombo.currentText()
+            self.settings["template"] = self.templateCombo.currentText()
+
+        if self.__TabBuilt__("security"):
+            adv.update({
+                "obfuscate": self.obfuscateChk.isChecked(),
+                "anti_debug": self.antiDebugChk.isChecked(),
+                "packer": self.packerChk.isChecked()
+            })
+            self.settings["security"] = {
+                "sign_certificate": self.certFileEdit.text().strip(),
+                "cert_password": self.certPassEdit.text().strip(),
+                "timestamp_server": self.timestampCombo.currentText()
+            }
+
+        if self.__TabBuilt__("resources"):
+            self.settings["last_files"] = [self.filesList.item(i).text() for i in range(self.filesList.count())]
+            self.settings["last_folders"] = [self.foldersList.item(i).text() for i in range(self.foldersList.count())]
+            self.settings["resource_compression"] = self.compressionCombo.currentText()
+            self.settings["resource_encryption"] = self.encryptionChk.isChecked()
+
+    def SaveSettings(self):
+        # Debounced: bursts of saves (drops, theme clicks, build starts) become one write.
+        self.__CollectSettings__()
+        if self.store.Dirty():
+            self._save_timer.start()
+
+    def FlushSettings(self):
+        self._save_timer.stop()
         try:
-            with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-                json.dump(self.settings, f, ensure_ascii=False, indent=2)
+            self.store.Flush()
         except Exception as e:
             QMessageBox.warning(self, "حفظ الإعدادات", f"فشل حفظ الإعدادات: {e}")
 
     def __ApplySettingsGUI__(self):
+        # self.settings -> widgets of the Basic tab and the right panel; lazy tabs apply
+        # their part of the model when they are built.
         self.entryList.clear()
         for p in self.settings.get("last_entries", []):
             self.entryList.addItem(p)
             
-        self.filesList.clear()
-        for p in self.settings.get("last_files", []):
-            self.filesList.addItem(p)
-            
-        self.foldersList.clear()
-        for p in self.settings.get("last_folders", []):
-            self.foldersList.addItem(p)
-            
         self.outLine.setText(self.settings.get("last_output", os.path.abspath("output")))
         self.iconLine.setText(self.settings.get("last_icon", ""))
         self.manifestLine.setText(self.settings.get("last_manifest", ""))
@@ -901,18 +1142,31 @@ class MainWindow(QMainWindow):
         self.oneFileChk.setChecked(self.settings.get("onefile", True))
         self.consoleChk.setChecked(not self.settings.get("noconsole", False))
         self.cleanChk.setChecked(self.settings.get("clean", True))
-        
+        self.cacheChk.setChecked(self.settings.get("build_cache", True))
+        self.incrementalChk.setChecked(self.settings.get("incremental", False))
+        self.warmWorkerChk.setChecked(self.settings.get("warm_worker", False))
+        self.mergeChk.setChecked(self.settings.get("merge_batch", False))
+        self.auditChk.setChecked(self.settings.get("audit_before_build", True))
+        self.estimateChk.setChecked(self.settings.get("estimate_before_build", True))
+        self.jobsSpin.setValue(self.settings.get("parallel_jobs", 0))
+        self.stallSpin.setValue(self.settings.get("stall_timeout", 0))
+
         adv = self.settings.get("advanced", {})
         self.hiddenImportsLine.setText(", ".join(adv.get("hidden_imports", [])))
+        self.autoHiddenChk.setChecked(adv.get("auto_hidden_imports", True))
         self.excludeModulesLine.setText(", ".join(adv.get("exclude_modules", [])))
         self.uacChk.setChecked(adv.get("uac_admin", False))
         self.keyLine.setText(adv.get("key", ""))
+
+        for name, apply in (("advanced", self.__ApplyAdvancedSettings__), ("security", self.__ApplySecuritySettings__), ("resources", self.__ApplyResourcesSettings__)):
+            if self.__TabBuilt__(name):
+                apply()
+
+    def __ApplyAdvancedSettings__(self):
+        adv = self.settings.get("advanced", {})
         self.optimizeChk.setChecked(adv.get("optimize", False))
         self.stripChk.setChecked(adv.get("strip", False))
         self.noPreferRedirectChk.setChecked(adv.get("no_prefer_redirect", False))
-        self.obfuscateChk.setChecked(adv.get("obfuscate", False))
-        self.antiDebugChk.setChecked(adv.get("anti_debug", False))
-        self.packerChk.setChecked(adv.get("packer", False))
         
         version_info = self.settings.get("version_info", {})
         self.versionEdit.setText(version_info.get("version", "1.0.0"))
@@ -921,14 +1175,6 @@ class MainWindow(QMainWindow):
         self.copyrightEdit.setText(version_info.get("copyright", ""))
         self.descriptionEdit.setText(version_info.get("description", ""))
         
-        security = self.settings.get("security", {})
-        self.certFileEdit.setText(security.get("sign_certificate", ""))
-        self.certPassEdit.setText(security.get("cert_password", ""))
-        timestamp_server = security.get("timestamp_server", "http://timestamp.digicert.com")
-        index = self.timestampCombo.findText(timestamp_server)
-        if index >= 0:
-            self.timestampCombo.setCurrentIndex(index)
-        
         build_system = self.settings.get("build_system", "PyInstaller")
         index = self.buildSystemCombo.findText(build_system)
         if index >= 0:
@@ -951,68 +1197,182 @@ class MainWindow(QMainWindow):
         index = self.templateCombo.findText(template)
         if index >= 0:
             self.templateCombo.setCurrentIndex(index)
+        
+        python_interpreter = self.settings.get("python_interpreter", "")
+        if python_interpreter:
+            index = self.interpCombo.findText(python_interpreter)
+            if index >= 0:
+                self.interpCombo.setCurrentIndex(index)
+            else:
+                self.interpCombo.setEditText(python_interpreter)
+        # The combos were filled from the cache; refresh it now that someone is looking.
+        self.StartInterpreterDiscovery()
+
+    def __ApplySecuritySettings__(self):
+        adv = self.settings.get("advanced", {})
+        self.obfuscateChk.setChecked(adv.get("obfuscate", False))
+        self.antiDebugChk.setChecked(adv.get("anti_debug", False))
+        self.packerChk.setChecked(adv.get("packer", False))
+
+        security = self.settings.get("security", {})
+        self.certFileEdit.setText(security.get("sign_certificate", ""))
+        self.certPassEdit.setText(security.get("cert_password", ""))
+        timestamp_server = security.get("timestamp_server", "http://timestamp.digicert.com")
+        index = self.timestampCombo.findText(timestamp_server)
+        if index >= 0:
+            self.timestampCombo.setCurrentIndex(index)
+
+    def __ApplyResourcesSettings__(self):
+        self.filesList.clear()
+        for p in self.settings.get("last_files", []):
+            self.filesList.addItem(p)
             
+        self.foldersList.clear()
+        for p in self.settings.get("last_folders", []):
+            self.foldersList.addItem(p)
+
         compression = self.settings.get("resource_compression", "normal")
         index = self.compressionCombo.findText(compression)
         if index >= 0:
             self.compressionCombo.setCurrentIndex(index)
             
         self.encryptionChk.setChecked(self.settings.get("resource_encryption", False))
-        
-        python_interpreter = self.settings.get("python_interpreter", "")
-        if python_interpreter:
-            index = self.interpCombo.findText(python_interpreter)
+
+    def StartInterpreterDiscovery(self, force: bool = False):
+        # Discovery and probing run on a worker thread; the combos are refilled when it finishes.
+        if self._interp_thread is not None:
+            return
+        self._interp_thread = QThread()
+        self._interp_worker = InterpreterWorker(self.settings.get("interpreter_cache_ttl", 86400), force, self.settings.get("venv_scan_depth", 2), self.settings.get("venv_scan_roots", []))
+        self._interp_worker.moveToThread(self._interp_thread)
+        self._interp_thread.started.connect(self._interp_worker.run)
+        self._interp_thread.finished.connect(self._interp_worker.deleteLater)
+        self._interp_thread.finished.connect(self._interp_thread.deleteLater)
+        self._interp_worker.done.connect(self._interpreters_found)
+        if self.__TabBuilt__("advanced"):
+            self.refreshInterpBtn.setEnabled(False)
+        self._interp_thread.start()
+
+    def _interpreters_found(self, interpreters: List[Dict[str, Any]]):
+        if self._interp_thread:
+            self._interp_thread.quit()
+            self._interp_thread.wait()
+        self._interp_thread = None
+        self._interp_worker = None
+        if self.__TabBuilt__("advanced"):
+            self.refreshInterpBtn.setEnabled(True)
+            self.__FillInterpreterCombos__(interpreters)
+
+    def StopInterpreterDiscovery(self):
+        # Blocks until the running probes return; the worker and thread delete themselves.
+        if self._interp_thread is None:
+            return
+        self._interp_worker.stop()
+        self._interp_thread.quit()
+        self._interp_thread.wait()
+        self._interp_thread = None
+        self._interp_worker = None
+
+    def __FillInterpreterCombos__(self, interpreters: List[Dict[str, Any]]):
+        # Interpreters that can run PyInstaller first; the typed or selected text survives a refill.
+        current = self.interpCombo.currentText()
+        self.interpCombo.clear()
+        for item in sorted(interpreters, key=lambda item: not item.get("pyinstaller")):
+            self.interpCombo.addItem(item["path"])
+            if "version" in item:
+                self.interpCombo.setItemData(self.interpCombo.count() - 1, Describe(item), Qt.ToolTipRole)
+        if current:
+            index = self.interpCombo.findText(current)
             if index >= 0:
                 self.interpCombo.setCurrentIndex(index)
             else:
-                self.interpCombo.setEditText(python_interpreter)
+                self.interpCombo.setEditText(current)
+
+        current_env = self.virtualEnvCombo.currentText()
+        self.virtualEnvCombo.clear()
+        for item in interpreters:
+            if item.get("kind") in ("venv", "conda"):
+                self.virtualEnvCombo.addItem(item["path"])
+        self.virtualEnvCombo.insertSeparator(self.virtualEnvCombo.count())
+        self.virtualEnvCombo.addItems(VIRTUAL_ENV_TYPES)
+        if current_env:
+            index = self.virtualEnvCombo.findText(current_env)
+            if index >= 0:
+                self.virtualEnvCombo.setCurrentIndex(index)
+            else:
+                self.virtualEnvCombo.setEditText(current_env)
 
     def ResetSettings(self):
         reply = QMessageBox.question(self, self.lang_manager.tr("reset_settings", "إعادة التعيين"), self.lang_manager.tr("reset_confirm", "هل تريد إعادة الإعدادات إلى الوضع الافتراضي؟"), QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
-            self.settings = DEFAULT_SETTINGS.copy()
-            try:
-                if os.path.isfile(SETTINGS_FILE):
-                    os.remove(SETTINGS_FILE)
-            except Exception:
-                pass
+            self.store.Reset()
             self.__ApplySettingsGUI__()
             QMessageBox.information(self, self.lang_manager.tr("reset_complete", "تم"), self.lang_manager.tr("reset_complete", "تمت إعادة التعيين للإعدادات الافتراضية."))
 
     def __AnalyzeMissingModules__(self):
-        self.extra = PyInstallerExtras()
         script_paths = GetScriptPaths(self)
 
         if not script_paths:
             QMessageBox.warning(self, self.lang_manager.tr("analyze", "تحليل"), self.lang_manager.tr("no_inputs", "رجاءً اختر ملف أو سكربتات أولاً."))
             return
 
-        all_missing = []
+        python_exec = self.CurrentInterpreter()
+        reports = []
+        has_missing = False
         for script in script_paths:
-            missing = self.extra.AnalyzeMissingImports(script)
-            if missing:
-                all_missing.extend(missing)
-
-        if all_missing:
-            QMessageBox.information(
-                self,
-                "نتائج التحليل",
-                f"الموديولات المفقودة:\n{', '.join(set(all_missing))}"
-            )
+            if not os.path.isfile(script):
+                continue
+            try:
+                result = self.extra.AnalyzeImports(script, python_exec)
+            except Exception as e:
+                reports.append(f"{os.path.basename(script)}: [ERROR] {e}")
+                continue
+            has_missing = has_missing or bool(result["missing"])
+            reports.append(FormatReport(result, SharedPackageIndex(python_exec)))
+
+        if has_missing:
+            report = "\n\n".join(reports)
+            self.reportText.setPlainText(report)
+            box = QMessageBox(QMessageBox.Information, self.lang_manager.tr("analyze_results", "نتائج التحليل"), self.lang_manager.tr("missing_modules_found", "تم العثور على موديولات مفقودة، التفاصيل في تبويب التقارير."), QMessageBox.Ok, self)
+            box.setDetailedText(report)
+            box.exec_()
         else:
             QMessageBox.information(self, self.lang_manager.tr("analyze_results", "نتائج التحليل"), self.lang_manager.tr("no_missing_modules", "لم يتم العثور على موديولات مفقودة."))
 
+    def DetectHiddenImports(self):
+        script_paths = [s for s in GetScriptPaths(self) if os.path.isfile(s)]
+        if not script_paths:
+            QMessageBox.warning(self, self.lang_manager.tr("hidden_imports_title", "الاستيرادات المخفية"), self.lang_manager.tr("no_inputs", "رجاءً اختر ملف أو سكربتات أولاً."))
+            return
+
+        current = [s.strip() for s in self.hiddenImportsLine.text().split(",") if s.strip()]
+        try:
+            detected = DetectHiddenImports(script_paths, self.CurrentInterpreter())
+        except Exception as e:
+            QMessageBox.critical(self, self.lang_manager.tr("hidden_imports_title", "الاستيرادات المخفية"), f"{e}")
+            return
+        added = [item for item in detected if item["module"] not in current]
+        if not added:
+            QMessageBox.information(self, self.lang_manager.tr("hidden_imports_title", "الاستيرادات المخفية"), self.lang_manager.tr("no_hidden_imports_found", "لم يتم العثور على استيرادات ديناميكية جديدة."))
+            return
+
+        box = QMessageBox(QMessageBox.Question, self.lang_manager.tr("hidden_imports_title", "الاستيرادات المخفية"), self.lang_manager.tr("hidden_imports_found", "تم العثور على استيرادات ديناميكية، هل تريد إضافتها إلى الاستيرادات المخفية؟") + "\n\n" + ", ".join(item["module"] for item in added), QMessageBox.Yes | QMessageBox.No, self)
+        box.setDetailedText("\n".join(f"{item['module']} ({item['kind']})  <- {' -> '.join(item['chain'])}" for item in added))
+        if box.exec_() == QMessageBox.Yes:
+            self.hiddenImportsLine.setText(", ".join(current + [item["module"] for item in added]))
+            self.SaveSettings()
+
     def AdvancedDependencyAnalysis(self):
-        self.extra = PyInstallerExtras()
         script_paths = GetScriptPaths(self)
 
         if not script_paths:
             QMessageBox.warning(self, self.lang_manager.tr("advanced_analysis", "تحليل"), self.lang_manager.tr("no_inputs", "رجاءً اختر ملف أو سكربتات أولاً."))
             return
 
+        python_exec = self.CurrentInterpreter()
         results = []
         for script in script_paths:
-            analysis = self.extra.AdvancedDependencyAnalysis(script)
+            analysis = self.extra.AdvancedDependencyAnalysis(script, python_exec)
             results.append((script, analysis))
 
         report = "نتائج التحليل المتقدم:\n\n"
@@ -1020,14 +1380,33 @@ class MainWindow(QMainWindow):
             report += f"الملف: {os.path.basename(script)}\n"
             report += f"الموديولات المفقودة: {', '.join(analysis['missing_imports']) if analysis['missing_imports'] else 'لا يوجد'}\n"
             report += f"الملفات الكبيرة: {len(analysis['large_files'])}\n"
-            report += f"الاستيرادات المشبوهة: {', '.join(analysis['suspicious_imports']) if analysis['suspicious_imports'] else 'لا يوجد'}\n"
-            report += f"مشاكل الأداء: {', '.join(analysis['performance_issues']) if analysis['performance_issues'] else 'لا يوجد'}\n"
+            for path, size in analysis["largest_files"][:5]:
+                report += f"    {FormatSize(size):>10}  {os.path.relpath(path, os.path.dirname(os.path.abspath(script)))}\n"
+            if analysis["dir_sizes"]:
+                report += "أكبر المجلدات:\n"
+                for rel, size in analysis["dir_sizes"][:5]:
+                    report += f"    {FormatSize(size):>10}  {rel}\n"
+            report += f"الحزم الخارجية: {FormatSize(analysis['package_bytes'])} ({len(analysis['packages'])})\n"
+            for name, version, size in analysis["packages"][:5]:
+                report += f"    {FormatSize(size):>10}  {name} {version}\n"
+            if analysis["exclude_suggestions"]:
+                report += f"مقترحات الاستبعاد: {', '.join(f'{m} ({FormatSize(size)})' for m, _, size in analysis['exclude_suggestions'])}\n"
+            report += f"الاستيرادات المشبوهة: {len(analysis['suspicious_imports'])}\n"
+            for item in analysis["suspicious_imports"][:5]:
+                report += f"    {item}\n"
+            report += f"مشاكل الأداء: {len(analysis['performance_issues'])}\n"
+            for item in analysis["performance_issues"][:5]:
+                report += f"    {item}\n"
             report += f"التوصيات: {', '.join(analysis['recommendations']) if analysis['recommendations'] else 'لا يوجد'}\n"
             report += "-" * 50 + "\n"
 
-        QMessageBox.information(self, "التحليل المتقدم", report)
+        details = "\n\n".join(FormatAudit(analysis["audit"]) for _, analysis in results if analysis["audit"])
+        box = QMessageBox(QMessageBox.Information, "التحليل المتقدم", report, QMessageBox.Ok, self)
+        if details:
+            box.setDetailedText(details)
+        box.exec_()
 
-    def __GenerateBuildReport__(self, duration: float, output_path: str):
+    def __GenerateBuildReport__(self, duration: float, output_path: str, phases: Optional[Dict[str, Any]] = None):
         report = {
             "build_time": f"{duration:.2f} ثانية",
             "timestamp": time.ctime(),
@@ -1037,21 +1416,20 @@ class MainWindow(QMainWindow):
             "optimizations": []
         }
 
+        scan = None
         try:
             if os.path.exists(output_path):
-                total_size = 0
-                for root, dirs, files in os.walk(output_path):
-                    for file in files:
-                        total_size += os.path.getsize(os.path.join(root, file))
-                report["output_size"] = f"{total_size / 1024 / 1024:.2f} MB"
+                scan = ProjectScanner(ignore=[]).Scan(output_path, top_n=5)
+                report["output_size"] = f"{scan['bytes'] / 1024 / 1024:.2f} MB"
         except Exception:
             pass
 
-        if self.optimizeChk.isChecked():
+        adv = self.settings.get("advanced", {})
+        if adv.get("optimize", False):
             report["optimizations"].append("تحسينات الأداء")
-        if self.stripChk.isChecked():
+        if adv.get("strip", False):
             report["optimizations"].append("إزالة المعلومات غير الضرورية")
-        if self.obfuscateChk.isChecked():
+        if adv.get("obfuscate", False):
             report["optimizations"].append("تشويش الكود")
 
         report_text = f"تقرير البناء\n{'='*30}\n"
@@ -1060,6 +1438,24 @@ class MainWindow(QMainWindow):
         report_text += f"حجم الإخراج: {report['output_size']}\n"
         report_text += f"التحسينات: {', '.join(report['optimizations']) if report['optimizations'] else 'لا يوجد'}\n"
 
+        if scan and scan["largest"]:
+            report_text += f"\nأكبر الملفات\n{'-'*30}\n"
+            for path, size in scan["largest"]:
+                report_text += f"  {FormatSize(size):>10}  {os.path.relpath(path, scan['root'])}\n"
+            if scan["dirs"]:
+                report_text += f"\nأكبر المجلدات\n{'-'*30}\n"
+                for rel, size in scan["dirs"]:
+                    report_text += f"  {FormatSize(size):>10}  {rel}\n"
+
+        if phases:
+            report_text += f"\nمراحل البناء\n{'-'*30}\n"
+            for entry, tracker in phases.items():
+                timings = [(name, seconds) for name, seconds in tracker.timings if name != "Done"]
+                total = sum(seconds for _, seconds in timings) or 1.0
+                report_text += f"{os.path.basename(entry)}:\n"
+                for name, seconds in timings:
+                    report_text += f"  {name:<12}{seconds:>9.2f} s  {seconds / total * 100:5.1f}%\n"
+
         return report_text
 
     def CodeAudit(self):
@@ -1068,149 +1464,154 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, self.lang_manager.tr("code_audit", "التدقيق"), self.lang_manager.tr("no_inputs", "رجاءً اختر ملف أو سكربتات أولاً."))
             return
 
-        audit_results = {
-            "large_files": [],
-            "suspicious_imports": [],
-            "performance_issues": [],
-            "security_issues": []
-        }
+        scripts = [s for s in script_paths if os.path.isfile(s)]
+        python_exec = self.CurrentInterpreter()
+        try:
+            audit = AuditProject(scripts, python_exec, SharedParseCache())
+        except Exception as e:
+            QMessageBox.critical(self, "تدقيق الكود", f"{e}")
+            return
 
-        for script in script_paths:
-            analysis = self.extra.AdvancedDependencyAnalysis(script)
-            audit_results["large_files"].extend(analysis["large_files"])
-            audit_results["suspicious_imports"].extend(analysis["suspicious_imports"])
-            audit_results["performance_issues"].extend(analysis["performance_issues"])
-            audit_results["security_issues"].extend(analysis["suspicious_imports"])
+        large_files = set()
+        for root in {os.path.dirname(os.path.abspath(s)) for s in scripts}:
+            scan = SharedScanner(self.extra.scan_ignore).Scan(root, self.extra.scan_top_n, self.extra.large_bytes)
+            large_files.update(path for path, _ in scan["large_files"])
 
+        counts = audit["counts"]
         report = "نتائج تدقيق الكود:\n\n"
-        report += f"الملفات الكبيرة (>10MB): {len(audit_results['large_files'])}\n"
-        report += f"الاستيرادات المشبوهة: {', '.join(set(audit_results['suspicious_imports'])) if audit_results['suspicious_imports'] else 'لا يوجد'}\n"
-        report += f"مشاكل الأداء: {', '.join(set(audit_results['performance_issues'])) if audit_results['performance_issues'] else 'لا يوجد'}\n"
-        report += f"مشاكل الأمان: {', '.join(set(audit_results['security_issues'])) if audit_results['security_issues'] else 'لا يوجد'}\n"
-
-        QMessageBox.information(self, "تدقيق الكود", report)
+        report += f"الملفات المدققة: {len(audit['files'])}\n"
+        report += f"الملفات الكبيرة (>{self.extra.large_bytes // (1024 * 1024)}MB): {len(large_files)}\n"
+        report += f"مشاكل الأمان: {counts['security']}\n"
+        report += f"مشاكل الأداء: {counts['performance']}\n"
+        report += f"التوصيات: {len({f['rule'] for f in audit['findings'] if f['category'] == 'recommendation'})}\n"
+
+        details = FormatAudit(audit)
+        self.reportText.setPlainText(details)
+        box = QMessageBox(QMessageBox.Information, "تدقيق الكود", report, QMessageBox.Ok, self)
+        box.setDetailedText(details)
+        box.exec_()
 
     def __CreateMenus__(self):
         menubar = self.menuBar()
             
-        fileMenu = menubar.addMenu(self.lang_manager.tr("file_menu", "الملف", "File", "Fichier", "Файл", "文件"))
-        action_new = QAction(self.lang_manager.tr("new_project", "مشروع جديد", "New Project", "Nouveau projet", "Новый проект", "新项目"), self)
+        fileMenu = self.lang_manager.Bind(menubar.addMenu(""), "setTitle", "file_menu", "الملف", "File", "Fichier", "Файл", "文件")
+        action_new = self.lang_manager.Bind(QAction(self), "setText", "new_project", "مشروع جديد", "New Project", "Nouveau projet", "Новый проект", "新项目")
         action_new.setShortcut("Ctrl+N")
         fileMenu.addAction(action_new)
         
-        action_reset = QAction(self.lang_manager.tr("reset_settings", "إعادة تعيين الإعدادات", "Reset Settings", "Réinitialiser les paramètres", "Сброс настроек", "重置设置"), self)
+        action_reset = self.lang_manager.Bind(QAction(self), "setText", "reset_settings", "إعادة تعيين الإعدادات", "Reset Settings", "Réinitialiser les paramètres", "Сброс настроек", "重置设置")
         action_reset.triggered.connect(self.ResetSettings)
         fileMenu.addAction(action_reset)
         
-        action_exit = QAction(self.lang_manager.tr("exit", "خروج", "Exit", "Quitter", "Выход", "退出"), self)
+        action_exit = self.lang_manager.Bind(QAction(self), "setText", "exit", "خروج", "Exit", "Quitter", "Выход", "退出")
         action_exit.setShortcut("Ctrl+Q")
         action_exit.triggered.connect(self.close)
         fileMenu.addAction(action_exit)
 
-        buildMenu = menubar.addMenu(self.lang_manager.tr("build_menu", "البناء", "Build", "Construction", "Сборка", "构建"))
-        action_build = QAction(self.lang_manager.tr("start_build", "بدء البناء", "Start Build", "Démarrer la construction", "Начать сборку", "开始构建"), self)
+        buildMenu = self.lang_manager.Bind(menubar.addMenu(""), "setTitle", "build_menu", "البناء", "Build", "Construction", "Сборка", "构建")
+        action_build = self.lang_manager.Bind(QAction(self), "setText", "start_build", "بدء البناء", "Start Build", "Démarrer la construction", "Начать сборку", "开始构建")
         action_build.setShortcut("Ctrl+B")
         action_build.triggered.connect(self.start_build)
         buildMenu.addAction(action_build)
         
-        action_spec = QAction(self.lang_manager.tr("generate_spec_only", "توليد ملف .spec فقط", "Generate .spec File Only", "Générer uniquement le fichier .spec", "Генерировать только файл .spec", "仅生成 .spec 文件"), self)
+        action_spec = self.lang_manager.Bind(QAction(self), "setText", "generate_spec_only", "توليد ملف .spec فقط", "Generate .spec File Only", "Générer uniquement le fichier .spec", "Генерировать только файл .spec", "仅生成 .spec 文件")
         action_spec.triggered.connect(self.generate_spec_only)
         buildMenu.addAction(action_spec)
 
-        toolsMenu = menubar.addMenu(self.lang_manager.tr("tools_menu", "أدوات", "Tools", "Outils", "Инструменты", "工具"))
-        action_clean = QAction(self.lang_manager.tr("full_clean", "تنظيف كامل (build, dist, spec)", "Full Clean (build, dist, spec)", "Nettoyage complet (build, dist, spec)", "Полная очистка (build, dist, spec)", "完全清理（build、dist、spec）"), self)
+        toolsMenu = self.lang_manager.Bind(menubar.addMenu(""), "setTitle", "tools_menu", "أدوات", "Tools", "Outils", "Инструменты", "工具")
+        action_clean = self.lang_manager.Bind(QAction(self), "setText", "full_clean", "تنظيف كامل (build, dist, spec)", "Full Clean (build, dist, spec)", "Nettoyage complet (build, dist, spec)", "Полная очистка (build, dist, spec)", "完全清理（build、dist、spec）")
         action_clean.triggered.connect(self.full_clean)
         toolsMenu.addAction(action_clean)
 
-        self.action_analyze = QAction(self.lang_manager.tr("analyze_missing", "تحليل الموديولات المفقودة", "Analyze Missing Modules", "Analyser les modules manquants", "Анализ отсутствующих модулей", "分析缺失模块"), self)
+        self.action_analyze = self.lang_manager.Bind(QAction(self), "setText", "analyze_missing", "تحليل الموديولات المفقودة", "Analyze Missing Modules", "Analyser les modules manquants", "Анализ отсутствующих модулей", "分析缺失模块")
         self.action_analyze.triggered.connect(self.__AnalyzeMissingModules__)
         toolsMenu.addAction(self.action_analyze)
         
-        action_advanced_analyze = QAction(self.lang_manager.tr("advanced_analyze", "تحليل متقدم للتبعيات", "Advanced Dependency Analysis", "Analyse avancée des dépendances", "Расширенный анализ зависимостей", "高级依赖分析"), self)
+        action_advanced_analyze = self.lang_manager.Bind(QAction(self), "setText", "advanced_analyze", "تحليل متقدم للتبعيات", "Advanced Dependency Analysis", "Analyse avancée des dépendances", "Расширенный анализ зависимостей", "高级依赖分析")
         action_advanced_analyze.triggered.connect(self.AdvancedDependencyAnalysis)
         toolsMenu.addAction(action_advanced_analyze)
         
-        action_audit = QAction(self.lang_manager.tr("code_audit", "تدقيق الكود", "Code Audit", "Audit de code", "Аудит кода", "代码审计"), self)
+        action_audit = self.lang_manager.Bind(QAction(self), "setText", "code_audit", "تدقيق الكود", "Code Audit", "Audit de code", "Аудит кода", "代码审计")
         action_audit.triggered.connect(self.CodeAudit)
         toolsMenu.addAction(action_audit)
 
-        viewMenu = menubar.addMenu(self.lang_manager.tr("view_menu", "المظهر", "View", "Affichage", "Вид", "视图"))
-        self.action_toggle_theme = QAction(self.lang_manager.tr("toggle_theme", "تبديل الوضع (داكن/فاتح)", "Toggle Theme (Dark/Light)", "Basculer le thème (Sombre/Clair)", "Переключить тему (Темная/Светлая)", "切换主题（深色/浅色）"), self)
+        viewMenu = self.lang_manager.Bind(menubar.addMenu(""), "setTitle", "view_menu", "المظهر", "View", "Affichage", "Вид", "视图")
+        self.action_toggle_theme = self.lang_manager.Bind(QAction(self), "setText", "toggle_theme", "تبديل الوضع (داكن/فاتح)", "Toggle Theme (Dark/Light)", "Basculer le thème (Sombre/Clair)", "Переключить тему (Темная/Светлая)", "切换主题（深色/浅色）")
         self.action_toggle_theme.triggered.connect(self.toggle_theme)
         viewMenu.addAction(self.action_toggle_theme)
         
-        action_dark = QAction(self.lang_manager.tr("dark_theme", "الوضع الداكن", "Dark Theme", "Thème sombre", "Темная тема", "深色主题"), self)
+        action_dark = self.lang_manager.Bind(QAction(self), "setText", "dark_theme", "الوضع الداكن", "Dark Theme", "Thème sombre", "Темная тема", "深色主题")
         action_dark.triggered.connect(lambda: self.set_theme("dark"))
         viewMenu.addAction(action_dark)
         
-        action_light = QAction(self.lang_manager.tr("light_theme", "الوضع الفاتح", "Light Theme", "Thème clair", "Светлая тема", "浅色主题"), self)
+        action_light = self.lang_manager.Bind(QAction(self), "setText", "light_theme", "الوضع الفاتح", "Light Theme", "Thème clair", "Светлая тема", "浅色主题")
         action_light.triggered.connect(lambda: self.set_theme("light"))
         viewMenu.addAction(action_light)
 
-        action_custom = QAction(self.lang_manager.tr("custom_theme", "مظهر مخصص…", "Custom Theme…", "Thème personnalisé…", "Пользовательская тема…", "自定义主题…"), self)
+        action_custom = self.lang_manager.Bind(QAction(self), "setText", "custom_theme", "مظهر مخصص…", "Custom Theme…", "Thème personnalisé…", "Пользовательская тема…", "自定义主题…")
         action_custom.triggered.connect(self.choose_custom_theme)
         viewMenu.addAction(action_custom)
 
 
-        settingsMenu = menubar.addMenu(self.lang_manager.tr("settings_menu", "الإعدادات", "Settings", "Paramètres", "Настройки", "设置"))
-        action_plugins = QAction(self.lang_manager.tr("manage_plugins", "إدارة الإضافات", "Manage Plugins", "Gérer les plugins", "Управление плагинами", "管理插件"), self)
+        settingsMenu = self.lang_manager.Bind(menubar.addMenu(""), "setTitle", "settings_menu", "الإعدادات", "Settings", "Paramètres", "Настройки", "设置")
+        action_plugins = self.lang_manager.Bind(QAction(self), "setText", "manage_plugins", "إدارة الإضافات", "Manage Plugins", "Gérer les plugins", "Управление плагинами", "管理插件")
         action_plugins.triggered.connect(self.manage_plugins)
         settingsMenu.addAction(action_plugins)
         
-        action_templates = QAction(self.lang_manager.tr("manage_templates", "القوالب", "Templates", "Modèles", "Шаблоны", "模板"), self)
+        action_templates = self.lang_manager.Bind(QAction(self), "setText", "manage_templates", "القوالب", "Templates", "Modèles", "Шаблоны", "模板")
         action_templates.triggered.connect(self.manage_templates)
         settingsMenu.addAction(action_templates)
 
-        helpMenu = menubar.addMenu(self.lang_manager.tr("help_menu", "مساعدة", "Help", "Aide", "Помощь", "帮助"))
-        action_check_updates = QAction(self.lang_manager.tr("check_updates", "تحقق من التحديثات", "Check for Updates", "Vérifier les mises à jour", "Проверить обновления", "检查更新"), self)
+        helpMenu = self.lang_manager.Bind(menubar.addMenu(""), "setTitle", "help_menu", "مساعدة", "Help", "Aide", "Помощь", "帮助")
+        action_check_updates = self.lang_manager.Bind(QAction(self), "setText", "check_updates", "تحقق من التحديثات", "Check for Updates", "Vérifier les mises à jour", "Проверить обновления", "检查更新")
         action_check_updates.triggered.connect(self.check_updates)
         helpMenu.addAction(action_check_updates)
         
-        action_docs = QAction(self.lang_manager.tr("documentation", "الوثائق", "Documentation", "Documentation", "Документация", "文档"), self)
+        action_docs = self.lang_manager.Bind(QAction(self), "setText", "documentation", "الوثائق", "Documentation", "Documentation", "Документация", "文档")
         action_docs.triggered.connect(self.show_documentation)
         helpMenu.addAction(action_docs)
 
-        WebDev = QAction(self.lang_manager.tr("visit_website", "زيارة موقعي", "Visit My Website", "Visiter mon site Web", "Посетить мой сайт", "访问我的网站"), self)
+        WebDev = self.lang_manager.Bind(QAction(self), "setText", "visit_website", "زيارة موقعي", "Visit My Website", "Visiter mon site Web", "Посетить мой сайт", "访问我的网站")
         WebDev.triggered.connect(self.VistWebSite)
         helpMenu.addAction(WebDev)
 
-        GoWebProgram = QAction(self.lang_manager.tr("program_website", "موقع البرنامج", "Program Website", "Site du programme", "Веб-сайт программы", "程序网站"), self)
+        GoWebProgram = self.lang_manager.Bind(QAction(self), "setText", "program_website", "موقع البرنامج", "Program Website", "Site du programme", "Веб-сайт программы", "程序网站")
         GoWebProgram.triggered.connect(self.WebSiteProgram)
         helpMenu.addAction(GoWebProgram)
         
-        action_about = QAction(self.lang_manager.tr("about_program", "حول البرنامج", "About Program", "À propos du programme", "О программе", "关于程序"), self)
+        action_about = self.lang_manager.Bind(QAction(self), "setText", "about_program", "حول البرنامج", "About Program", "À propos du programme", "О программе", "关于程序")
         action_about.triggered.connect(self.about_program)
         helpMenu.addAction(action_about)
 
-        Policies = menubar.addMenu(self.lang_manager.tr("policies_menu", "السياسات", "Policies", "Politiques", "Политики", "政策"))
+        Policies = self.lang_manager.Bind(menubar.addMenu(""), "setTitle", "policies_menu", "السياسات", "Policies", "Politiques", "Политики", "政策")
 
-        Privacy_Policy = QAction(self.lang_manager.tr("privacy_policy", "سياسة الخصوصية", "Privacy Policy", "Politique de confidentialité", "Политика конфиденциальности", "隐私政策"), self)
+        Privacy_Policy = self.lang_manager.Bind(QAction(self), "setText", "privacy_policy", "سياسة الخصوصية", "Privacy Policy", "Politique de confidentialité", "Политика конфиденциальности", "隐私政策")
         Privacy_Policy.triggered.connect(self.Privacy_Policy)
         Policies.addAction(Privacy_Policy)
 
-        Terms_of_Use = QAction(self.lang_manager.tr("terms_of_use", "سياسة الأستخدام", "Terms of Use", "Conditions d'utilisation", "Условия использования", "使用条款"), self)
+        Terms_of_Use = self.lang_manager.Bind(QAction(self), "setText", "terms_of_use", "سياسة الأستخدام", "Terms of Use", "Conditions d'utilisation", "Условия использования", "使用条款")
         Terms_of_Use.triggered.connect(self.Terms_of_Use)
         Policies.addAction(Terms_of_Use)
 
-        License_Agreement = QAction(self.lang_manager.tr("license_agreement", "أتفاقية الترخيص", "License Agreement", "Contrat de licence", "Лицензионное соглашение", "许可协议"), self)
+        License_Agreement = self.lang_manager.Bind(QAction(self), "setText", "license_agreement", "أتفاقية الترخيص", "License Agreement", "Contrat de licence", "Лицензионное соглашение", "许可协议")
         License_Agreement.triggered.connect(self.License_Agreement)
         Policies.addAction(License_Agreement)
 
-        Code_of_Conduct = QAction(self.lang_manager.tr("code_of_conduct", "قواعد السلوك", "Code of Conduct", "Code de conduite", "Кодекс поведения", "行为准则"), self)
+        Code_of_Conduct = self.lang_manager.Bind(QAction(self), "setText", "code_of_conduct", "قواعد السلوك", "Code of Conduct", "Code de conduite", "Кодекс поведения", "行为准则")
         Code_of_Conduct.triggered.connect(self.Code_of_Conduct)
         Policies.addAction(Code_of_Conduct)
 
-        Contribution_Policy = QAction(self.lang_manager.tr("contribution_policy", "سياسة المساهمة", "Contribution Policy", "Politique de contribution", "Политика вклада", "贡献政策"), self)
+        Contribution_Policy = self.lang_manager.Bind(QAction(self), "setText", "contribution_policy", "سياسة المساهمة", "Contribution Policy", "Politique de contribution", "Политика вклада", "贡献政策")
         Contribution_Policy.triggered.connect(self.Contribution_Policy)
         Policies.addAction(Contribution_Policy)
         
-        PyInstallerMenu = menubar.addMenu(self.lang_manager.tr("pyinstaller_menu", "PyInstaller قائمة", "Menu PyInstaller", "Menu PyInstaller", "Меню PyInstaller", "PyInstaller 菜单"))
-        action_check_pyinstaller = QAction(self.lang_manager.tr("check_pyinstaller_updates", "التحقق من تحديثات PyInstaller", "Check PyInstaller Updates"), self)
+        PyInstallerMenu = self.lang_manager.Bind(menubar.addMenu(""), "setTitle", "pyinstaller_menu", "PyInstaller قائمة", "Menu PyInstaller", "Menu PyInstaller", "Меню PyInstaller", "PyInstaller 菜单")
+        action_check_pyinstaller = self.lang_manager.Bind(QAction(self), "setText", "check_pyinstaller_updates", "التحقق من تحديثات PyInstaller", "Check PyInstaller Updates")
         action_check_pyinstaller.triggered.connect(self.check_pyinstaller_updates)
         PyInstallerMenu.addAction(action_check_pyinstaller)
         
         
-        languageMenu = menubar.addMenu(self.lang_manager.tr("language_menu", "اللغة", "Language", "Langue", "Язык", "语言"))    
+        languageMenu = self.lang_manager.Bind(menubar.addMenu(""), "setTitle", "language_menu", "اللغة", "Language", "Langue", "Язык", "语言")    
         languages = self.lang_manager.AvailableLanguges()
         lang_names = {
             "ar": "العربية",
@@ -1248,31 +1649,37 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(splitter)
 
     def __SetupLeftPanel__(self, layout):
-        tab_widget = QTabWidget()
-        
-        basic_tab = self.__CreateBasicTAB__()
-        advanced_tab = self.__CreateAdvancedTAB__()
-        security_tab = self.__CreateSecurityTAB__()
-        resources_tab = self.create_resources_tab()
-        options_os_system = self.__CreateOSSystemOptionsTAB__()
-        
-        tab_widget.addTab(basic_tab, self.lang_manager.tr("tab_basic"))
-        tab_widget.addTab(advanced_tab, self.lang_manager.tr("tab_advanced"))
-        tab_widget.addTab(security_tab, self.lang_manager.tr("tab_security"))
-        tab_widget.addTab(resources_tab, self.lang_manager.tr("tab_resources"))
-        tab_widget.addTab(options_os_system, self.lang_manager.tr("options_os_system"))
-        
-        layout.addWidget(tab_widget)
+        # Only the Basic tab is built before the window is shown; the others get an empty
+        # placeholder and are built the first time they are selected (see __EnsureTab__).
+        self.leftTabs = QTabWidget()
+        self.lang_manager.Bind(self.leftTabs, "setTabText", "tab_basic", at=self.leftTabs.addTab(self.__CreateBasicTAB__(), ""))
+        
+        for name, builder, apply, title in (
+            ("advanced", self.__CreateAdvancedTAB__, self.__ApplyAdvancedSettings__, "tab_advanced"),
+            ("security", self.__CreateSecurityTAB__, self.__ApplySecuritySettings__, "tab_security"),
+            ("resources", self.create_resources_tab, self.__ApplyResourcesSettings__, "tab_resources"),
+            ("os_options", self.__CreateOSSystemOptionsTAB__, None, "options_os_system"),
+        ):
+            placeholder = QWidget()
+            QVBoxLayout(placeholder).setContentsMargins(0, 0, 0, 0)
+            index = self.leftTabs.addTab(placeholder, "")
+            self.lang_manager.Bind(self.leftTabs, "setTabText", title, at=index)
+            self._lazy_tabs[name] = (index, builder, apply)
+        self.leftTabs.currentChanged.connect(self._on_left_tab_changed)
+        
+        layout.addWidget(self.leftTabs)
 
     def __CreateBasicTAB__(self):
         widget = QWidget()
         layout = QVBoxLayout(widget)
         
         mode_layout = QHBoxLayout()
-        mode_layout.addWidget(QLabel(self.lang_manager.tr("mode")))
+        mode_layout.addWidget(self.lang_manager.Bind(QLabel(), "setText", "mode"))
         self.modeCombo = QComboBox()
 
-        self.modeCombo.addItems([self.lang_manager.tr("single_file", "ملف واحد"), self.lang_manager.tr("batch_files", "ملفات متعددة")])
+        self.modeCombo.addItems(["", ""])
+        self.lang_manager.Bind(self.modeCombo, "setItemText", "single_file", "ملف واحد", at=0)
+        self.lang_manager.Bind(self.modeCombo, "setItemText", "batch_files", "ملفات متعددة", at=1)
         self.modeCombo.currentIndexChanged.connect(self._on_mode_changed)
         mode_layout.addWidget(self.modeCombo)
         mode_layout.addStretch(1)
@@ -1280,42 +1687,55 @@ class MainWindow(QMainWindow):
         
         entry_layout = QHBoxLayout()
         self.entryLine = QLineEdit()
-        self.entryBtn = QPushButton(self.lang_manager.tr("choose_file", "أختيار ملف…"))
+        self.entryBtn = self.lang_manager.Bind(QPushButton(), "setText", "choose_file", "أختيار ملف…")
         self.entryBtn.clicked.connect(self.pick_entry)
-        entry_layout.addWidget(QLabel(self.lang_manager.tr("main_file", "الملف الرئيسي")))
+        entry_layout.addWidget(self.lang_manager.Bind(QLabel(), "setText", "main_file", "الملف الرئيسي"))
         entry_layout.addWidget(self.entryLine)
         entry_layout.addWidget(self.entryBtn)
-        entryBox = QGroupBox(self.lang_manager.tr("single_input", "المدخل (Single)"))
+        entryBox = self.lang_manager.Bind(QGroupBox(), "setTitle", "single_input", "المدخل (Single)")
         entryBox.setLayout(entry_layout)
         layout.addWidget(entryBox)
         
         self.entryList = QListWidget()
-        self.addEntryBtn = QPushButton(self.lang_manager.tr("add_script", "أضف سكربت"))
+        self.addEntryBtn = self.lang_manager.Bind(QPushButton(), "setText", "add_script", "أضف سكربت")
         self.addEntryBtn.clicked.connect(self.add_entry)
-        self.remEntryBtn = QPushButton(self.lang_manager.tr("remove_selected", "إزالة المحدد"))
+        self.remEntryBtn = self.lang_manager.Bind(QPushButton(), "setText", "remove_selected", "إزالة المحدد")
         self.remEntryBtn.clicked.connect(self.remove_entry)
         elBtns = QHBoxLayout()
         elBtns.addWidget(self.addEntryBtn)
         elBtns.addWidget(self.remEntryBtn)
-        entryListBox = QGroupBox(self.lang_manager.tr("multiple_inputs", "مدخلات متعددة (Batch)"))
+        entryListBox = self.lang_manager.Bind(QGroupBox(), "setTitle", "multiple_inputs", "مدخلات متعددة (Batch)")
         v = QVBoxLayout()
         v.addWidget(self.entryList)
         v.addLayout(elBtns)
         entryListBox.setLayout(v)
         layout.addWidget(entryListBox)
         
-        options_group = QGroupBox(self.lang_manager.tr("basic_options", "الخيارات الأساسية"))
+        options_group = self.lang_manager.Bind(QGroupBox(), "setTitle", "basic_options", "الخيارات الأساسية")
         options_layout = QVBoxLayout()
-        self.oneFileChk = QCheckBox(self.lang_manager.tr("one_file", "بناء ملف واحد -F (موصى به)"))
-        self.consoleChk = QCheckBox(self.lang_manager.tr("show_console", "إظهار الكونسول (Console)"))
-        self.cleanChk = QCheckBox(self.lang_manager.tr("clean_before", "تنظيف قبل البناء --clean"))
+        self.oneFileChk = self.lang_manager.Bind(QCheckBox(), "setText", "one_file", "بناء ملف واحد -F (موصى به)")
+        self.consoleChk = self.lang_manager.Bind(QCheckBox(), "setText", "show_console", "إظهار الكونسول (Console)")
+        self.cleanChk = self.lang_manager.Bind(QCheckBox(), "setText", "clean_before", "تنظيف قبل البناء --clean")
+        self.cacheChk = self.lang_manager.Bind(QCheckBox(), "setText", "build_cache", "تخطي المدخلات غير المتغيرة (ذاكرة البناء المؤقتة)")
         options_layout.addWidget(self.oneFileChk)
         options_layout.addWidget(self.consoleChk)
         options_layout.addWidget(self.cleanChk)
+        self.incrementalChk = self.lang_manager.Bind(QCheckBox(), "setText", "incremental_build", "بناء تزايدي (إعادة استخدام مجلد العمل لكل مدخل)")
+        self.incrementalChk.toggled.connect(lambda checked: self.cleanChk.setEnabled(not checked))
+        options_layout.addWidget(self.cacheChk)
+        self.warmWorkerChk = self.lang_manager.Bind(QCheckBox(), "setText", "warm_worker", "إبقاء PyInstaller محمّلاً بين عمليات البناء")
+        options_layout.addWidget(self.incrementalChk)
+        options_layout.addWidget(self.warmWorkerChk)
+        self.mergeChk = self.lang_manager.Bind(QCheckBox(), "setText", "merge_batch", "وضع Batch: مجلد تشغيل مشترك (ملف spec واحد)")
+        options_layout.addWidget(self.mergeChk)
+        self.auditChk = self.lang_manager.Bind(QCheckBox(), "setText", "audit_before_build", "تدقيق الكود قبل كل بناء")
+        options_layout.addWidget(self.auditChk)
+        self.estimateChk = self.lang_manager.Bind(QCheckBox(), "setText", "estimate_before_build", "تقدير حجم الحزم قبل كل بناء")
+        options_layout.addWidget(self.estimateChk)
         options_group.setLayout(options_layout)
         layout.addWidget(options_group)
         
-        layout.addWidget(QLabel(self.lang_manager.tr("drag_drop_hint", "تستطيع سحب الملفات و أفلاتها على الصيغ المطلوبة منها (.py, .ico, .manifest, .pfx, .p12)")))
+        layout.addWidget(self.lang_manager.Bind(QLabel(), "setText", "drag_drop_hint", "تستطيع سحب الملفات و أفلاتها على الصيغ المطلوبة منها (.py, .ico, .manifest, .pfx, .p12)"))
         layout.addStretch(1)
         
         return widget
@@ -1325,114 +1745,96 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(widget)
         
         build_system_layout = QHBoxLayout()
-        build_system_layout.addWidget(QLabel(self.lang_manager.tr("build_system", "نظام البناء")))
+        build_system_layout.addWidget(self.lang_manager.Bind(QLabel(), "setText", "build_system", "نظام البناء"))
         self.buildSystemCombo = QComboBox()
-        self.buildSystemCombo.addItems(self.lang_manager.tr("build_systems", ["PyInstaller (All)", "cx_Freeze (Traditional)", "Nuitka (C/C++)", "PyOxidizer (Rust)", "Briefcase (Native)"]))
+        self.lang_manager.BindItems(self.buildSystemCombo, "build_systems", ["PyInstaller (All)", "cx_Freeze (Traditional)", "Nuitka (C/C++)", "PyOxidizer (Rust)", "Briefcase (Native)"])
         build_system_layout.addWidget(self.buildSystemCombo)
         layout.addLayout(build_system_layout)
         
         platform_layout = QHBoxLayout()
-        platform_layout.addWidget(QLabel(self.lang_manager.tr("platform", "المنصة")))
+        platform_layout.addWidget(self.lang_manager.Bind(QLabel(), "setText", "platform", "المنصة"))
         self.platformCombo = QComboBox()
         self.platformCombo.addItems(["Windows 32-bit (win32)", "Windows 64-bit (win64)", "Linux", "macOS"])
         platform_layout.addWidget(self.platformCombo)
         layout.addLayout(platform_layout)
         
         template_layout = QHBoxLayout()
-        template_layout.addWidget(QLabel(self.lang_manager.tr("template", "القالب")))
+        template_layout.addWidget(self.lang_manager.Bind(QLabel(), "setText", "template", "القالب"))
         self.templateCombo = QComboBox()
-        templates = self.lang_manager.tr("templates")
-        if isinstance(templates, list):
-            self.templateCombo.addItems(templates)
-        else:
-            fallback_templates = [
-                "تطبيق واجهة رسومية (GUI)",
-                "تطبيق وحدة التحكم (CLI)",
-                "تطبيق خدمة (Service)",
-                "تطبيق ويب (Web)",
-                "مخصص (Custom)"
-            ]
-            self.templateCombo.addItems(fallback_templates)
+        fallback_templates = [
+            "تطبيق واجهة رسومية (GUI)",
+            "تطبيق وحدة التحكم (CLI)",
+            "تطبيق خدمة (Service)",
+            "تطبيق ويب (Web)",
+            "مخصص (Custom)"
+        ]
+        self.lang_manager.BindItems(self.templateCombo, "templates", fallback_templates)
         template_layout.addWidget(self.templateCombo)
         layout.addLayout(template_layout)
         
         interp_layout = QHBoxLayout()
         self.interpCombo = QComboBox()
-        found = FindPythonInterpreters()
-        for p in found:
-            self.interpCombo.addItem(p)
         self.interpCombo.setEditable(True)
-        interp_layout.addWidget(QLabel(self.lang_manager.tr("python_interpreter", "مفسّر Python")))
+        self.refreshInterpBtn = self.lang_manager.Bind(QPushButton(), "setText", "refresh_interpreters", "تحديث")
+        self.refreshInterpBtn.clicked.connect(lambda: self.StartInterpreterDiscovery(force=True))
+        interp_layout.addWidget(self.lang_manager.Bind(QLabel(), "setText", "python_interpreter", "مفسّر Python"))
         interp_layout.addWidget(self.interpCombo)
+        interp_layout.addWidget(self.refreshInterpBtn)
         layout.addLayout(interp_layout)
         
         
         virtual_env_layout = QHBoxLayout()
         self.virtualEnvCombo = QComboBox()
         self.virtualEnvCombo.setEditable(True)
-        virtual_env_types = [
-            "venv (Python built-in)",
-            "virtualenv",
-            "conda",
-            "pipenv",
-            "poetry",
-            "rye",
-            "pyenv",
-            "wsl venv",
-        ]
-        virtual_envs = FindVirtualEnvironments()
-        for env in virtual_envs:
-            self.virtualEnvCombo.addItem(env)
-        self.virtualEnvCombo.insertSeparator(self.virtualEnvCombo.count())
-        self.virtualEnvCombo.addItems(virtual_env_types)
-        virtual_env_layout.addWidget(QLabel(self.lang_manager.tr("virtual_env", "البيئة الافتراضية")))
+        virtual_env_layout.addWidget(self.lang_manager.Bind(QLabel(), "setText", "virtual_env", "البيئة الافتراضية"))
         virtual_env_layout.addWidget(self.virtualEnvCombo)
         layout.addLayout(virtual_env_layout)
+        self.__FillInterpreterCombos__(CachedInterpreters() or [{"path": p, "kind": "system"} for p in dict.fromkeys(filter(None, map(shutil.which, ("python", "python3"))))])
 
         
-        optimization_group = QGroupBox(self.lang_manager.tr("optimization_options", "خيارات التحسين"))
+        optimization_group = self.lang_manager.Bind(QGroupBox(), "setTitle", "optimization_options", "خيارات التحسين")
         optimization_layout = QVBoxLayout()
-        self.optimizeChk = QCheckBox(self.lang_manager.tr("enable_optimizations", "تفعيل تحسينات الأداء --optimize"))
-        self.stripChk = QCheckBox(self.lang_manager.tr("strip_info", "إزالة المعلومات غير الضرورية --strip"))
-        self.noPreferRedirectChk = QCheckBox(self.lang_manager.tr("disable_redirect", "تعطيل إعادة التوجيه --no-prefer-redirect"))
+        self.optimizeChk = self.lang_manager.Bind(QCheckBox(), "setText", "enable_optimizations", "تفعيل تحسينات الأداء --optimize")
+        self.stripChk = self.lang_manager.Bind(QCheckBox(), "setText", "strip_info", "إزالة المعلومات غير الضرورية --strip")
+        self.noPreferRedirectChk = self.lang_manager.Bind(QCheckBox(), "setText", "disable_redirect", "تعطيل إعادة التوجيه --no-prefer-redirect")
         optimization_layout.addWidget(self.optimizeChk)
         optimization_layout.addWidget(self.stripChk)
         optimization_layout.addWidget(self.noPreferRedirectChk)
         optimization_group.setLayout(optimization_layout)
         layout.addWidget(optimization_group)
         
-        version_group = QGroupBox(self.lang_manager.tr("version_info", "معلومات الإصدار"))
+        version_group = self.lang_manager.Bind(QGroupBox(), "setTitle", "version_info", "معلومات الإصدار")
         version_layout = QVBoxLayout()
         version_info_layout = QHBoxLayout()
         self.versionEdit = QLineEdit()
         self.versionEdit.setText("1.0.0")
-        version_info_layout.addWidget(QLabel(self.lang_manager.tr("version", "الإصدار")))
+        version_info_layout.addWidget(self.lang_manager.Bind(QLabel(), "setText", "version", "الإصدار"))
         version_info_layout.addWidget(self.versionEdit)
         version_layout.addLayout(version_info_layout)
         
         company_layout = QHBoxLayout()
         self.companyEdit = QLineEdit()
-        company_layout.addWidget(QLabel(self.lang_manager.tr("company", "الشركة")))
+        company_layout.addWidget(self.lang_manager.Bind(QLabel(), "setText", "company", "الشركة"))
         company_layout.addWidget(self.companyEdit)
         version_layout.addLayout(company_layout)
         
         WebSite_layout = QHBoxLayout()
         self.WebSiteEdit = QLineEdit()
-        self.WebSiteEdit.setPlaceholderText(self.lang_manager.tr("website", "https://example.com"))
-        WebSite_layout.addWidget(QLabel(self.lang_manager.tr("website", "الرابط")))
+        self.lang_manager.Bind(self.WebSiteEdit, "setPlaceholderText", "website", "https://example.com")
+        WebSite_layout.addWidget(self.lang_manager.Bind(QLabel(), "setText", "website", "الرابط"))
         WebSite_layout.addWidget(self.WebSiteEdit)
         version_layout.addLayout(WebSite_layout) 
         
         copyright_layout = QHBoxLayout()
         self.copyrightEdit = QLineEdit()
-        self.copyrightEdit.setPlaceholderText(self.lang_manager.tr("copyright", "Copyright © 2025"))
-        copyright_layout.addWidget(QLabel(self.lang_manager.tr("copyright", "حقوق النشر")))
+        self.lang_manager.Bind(self.copyrightEdit, "setPlaceholderText", "copyright", "Copyright © 2025")
+        copyright_layout.addWidget(self.lang_manager.Bind(QLabel(), "setText", "copyright", "حقوق النشر"))
         copyright_layout.addWidget(self.copyrightEdit)
         version_layout.addLayout(copyright_layout)
         
         description_layout = QHBoxLayout()
         self.descriptionEdit = QLineEdit()
-        description_layout.addWidget(QLabel(self.lang_manager.tr("description", "الوصف")))
+        description_layout.addWidget(self.lang_manager.Bind(QLabel(), "setText", "description", "الوصف"))
         description_layout.addWidget(self.descriptionEdit)
         version_layout.addLayout(description_layout)
         version_group.setLayout(version_layout)
@@ -1445,14 +1847,14 @@ class MainWindow(QMainWindow):
         widget = QWidget()
         layout = QVBoxLayout(widget)
 
-        self.entryLabel = QLabel(self.lang_manager.tr("options_os_system", "خيارات نظام التشغيل"))
+        self.entryLabel = self.lang_manager.Bind(QLabel(), "setText", "options_os_system", "خيارات نظام التشغيل")
         self.entryLabel.setStyleSheet("font-weight: bold; font-size: 12px;")
         layout.addWidget(self.entryLabel)
 
-        disable_traceback_group = QGroupBox(self.lang_manager.tr("disable_windowed_traceback", "تعطيل رسالة الخطأ المنفصلة"))
+        disable_traceback_group = self.lang_manager.Bind(QGroupBox(), "setTitle", "disable_windowed_traceback", "تعطيل رسالة الخطأ المنفصلة")
         disable_traceback_layout = QVBoxLayout()
-        self.disableWindowedTracebackChk = QCheckBox(self.lang_manager.tr("disable_windowed_traceback_checkbox", "--disable-windowed-traceback"))
-        disable_traceback_desc = QLabel(self.lang_manager.tr("disable_windowed_traceback_desc", "عند تفعيله: سيتم عرض رسائل الأخطاء في الكونسول بدلاً من نافذة منفصلة (مفيد للتطبيقات التي تعمل بدون واجهة رسومية)"))
+        self.disableWindowedTracebackChk = self.lang_manager.Bind(QCheckBox(), "setText", "disable_windowed_traceback_checkbox", "--disable-windowed-traceback")
+        disable_traceback_desc = self.lang_manager.Bind(QLabel(), "setText", "disable_windowed_traceback_desc", "عند تفعيله: سيتم عرض رسائل الأخطاء في الكونسول بدلاً من نافذة منفصلة (مفيد للتطبيقات التي تعمل بدون واجهة رسومية)")
         disable_traceback_desc.setWordWrap(True)
         disable_traceback_desc.setStyleSheet("color: gray; font-size: 10px;")
         disable_traceback_layout.addWidget(self.disableWindowedTracebackChk)
@@ -1460,10 +1862,10 @@ class MainWindow(QMainWindow):
         disable_traceback_group.setLayout(disable_traceback_layout)
         layout.addWidget(disable_traceback_group)
 
-        uac_admin_group = QGroupBox(self.lang_manager.tr("uac_admin_option", "صلاحيات المدير"))
+        uac_admin_group = self.lang_manager.Bind(QGroupBox(), "setTitle", "uac_admin_option", "صلاحيات المدير")
         uac_admin_layout = QVBoxLayout()
-        self.uacAdminChk = QCheckBox(self.lang_manager.tr("uac_admin_checkbox", "--uac-admin"))
-        uac_admin_desc = QLabel(self.lang_manager.tr("uac_admin_desc", "عند تفعيله: سيطلب البرنامج صلاحيات المدير (Administrator) عند التشغيل على Windows"))
+        self.uacAdminChk = self.lang_manager.Bind(QCheckBox(), "setText", "uac_admin_checkbox", "--uac-admin")
+        uac_admin_desc = self.lang_manager.Bind(QLabel(), "setText", "uac_admin_desc", "عند تفعيله: سيطلب البرنامج صلاحيات المدير (Administrator) عند التشغيل على Windows")
         uac_admin_desc.setWordWrap(True)
         uac_admin_desc.setStyleSheet("color: gray; font-size: 10px;")
         uac_admin_layout.addWidget(self.uacAdminChk)
@@ -1471,10 +1873,10 @@ class MainWindow(QMainWindow):
         uac_admin_group.setLayout(uac_admin_layout)
         layout.addWidget(uac_admin_group)
 
-        uac_uiaccess_group = QGroupBox(self.lang_manager.tr("uac_uiaccess_option", "وصول واجهة المستخدم"))
+        uac_uiaccess_group = self.lang_manager.Bind(QGroupBox(), "setTitle", "uac_uiaccess_option", "وصول واجهة المستخدم")
         uac_uiaccess_layout = QVBoxLayout()
-        self.uacUIAccessChk = QCheckBox(self.lang_manager.tr("uac_uiaccess_checkbox", "--uac-uiaccess"))
-        uac_uiaccess_desc = QLabel(self.lang_manager.tr("uac_uiaccess_desc", "عند تفعيله: يسمح للبرنامج بالتحكم بنوافذ ذات صلاحيات أعلى على Windows (يتطلب توقيع رقمي)"))
+        self.uacUIAccessChk = self.lang_manager.Bind(QCheckBox(), "setText", "uac_uiaccess_checkbox", "--uac-uiaccess")
+        uac_uiaccess_desc = self.lang_manager.Bind(QLabel(), "setText", "uac_uiaccess_desc", "عند تفعيله: يسمح للبرنامج بالتحكم بنوافذ ذات صلاحيات أعلى على Windows (يتطلب توقيع رقمي)")
         uac_uiaccess_desc.setWordWrap(True)
         uac_uiaccess_desc.setStyleSheet("color: gray; font-size: 10px;")
         uac_uiaccess_layout.addWidget(self.uacUIAccessChk)
@@ -1482,10 +1884,10 @@ class MainWindow(QMainWindow):
         uac_uiaccess_group.setLayout(uac_uiaccess_layout)
         layout.addWidget(uac_uiaccess_group)
 
-        no_upx_group = QGroupBox(self.lang_manager.tr("no_upx_option", "تعطيل ضاغط UPX"))
+        no_upx_group = self.lang_manager.Bind(QGroupBox(), "setTitle", "no_upx_option", "تعطيل ضاغط UPX")
         no_upx_layout = QVBoxLayout()
-        self.noUpxChk = QCheckBox(self.lang_manager.tr("no_upx_checkbox", "--noupx"))
-        no_upx_desc = QLabel(self.lang_manager.tr("no_upx_desc", "عند تفعيله: سيتم عدم استخدام أداة الضغط UPX على الملفات الثنائية (قد يؤدي إلى حجم ملف أكبر لكن أسرع في التشغيل)"))
+        self.noUpxChk = self.lang_manager.Bind(QCheckBox(), "setText", "no_upx_checkbox", "--noupx")
+        no_upx_desc = self.lang_manager.Bind(QLabel(), "setText", "no_upx_desc", "عند تفعيله: سيتم عدم استخدام أداة الضغط UPX على الملفات الثنائية (قد يؤدي إلى حجم ملف أكبر لكن أسرع في التشغيل)")
         no_upx_desc.setWordWrap(True)
         no_upx_desc.setStyleSheet("color: gray; font-size: 10px;")
         no_upx_layout.addWidget(self.noUpxChk)
@@ -1493,10 +1895,10 @@ class MainWindow(QMainWindow):
         no_upx_group.setLayout(no_upx_layout)
         layout.addWidget(no_upx_group)
 
-        strip_group = QGroupBox(self.lang_manager.tr("strip_option", "إزالة رموز التصحيح"))
+        strip_group = self.lang_manager.Bind(QGroupBox(), "setTitle", "strip_option", "إزالة رموز التصحيح")
         strip_layout = QVBoxLayout()
-        self.stripSymbolsChk = QCheckBox(self.lang_manager.tr("strip_checkbox", "--strip"))
-        strip_desc = QLabel(self.lang_manager.tr("strip_desc", "عند تفعيله: سيتم إزالة رموز التصحيح (Debug Symbols) من الملفات الثنائية (يقلل حجم الملف لكن يصعب تصحيح الأخطاء)"))
+        self.stripSymbolsChk = self.lang_manager.Bind(QCheckBox(), "setText", "strip_checkbox", "--strip")
+        strip_desc = self.lang_manager.Bind(QLabel(), "setText", "strip_desc", "عند تفعيله: سيتم إزالة رموز التصحيح (Debug Symbols) من الملفات الثنائية (يقلل حجم الملف لكن يصعب تصحيح الأخطاء)")
         strip_desc.setWordWrap(True)
         strip_desc.setStyleSheet("color: gray; font-size: 10px;")
         strip_layout.addWidget(self.stripSymbolsChk)
@@ -1504,10 +1906,10 @@ class MainWindow(QMainWindow):
         strip_group.setLayout(strip_layout)
         layout.addWidget(strip_group)
 
-        bootloader_group = QGroupBox(self.lang_manager.tr("bootloader_signals_option", "تجاهل الإشارات (Signals)"))
+        bootloader_group = self.lang_manager.Bind(QGroupBox(), "setTitle", "bootloader_signals_option", "تجاهل الإشارات (Signals)")
         bootloader_layout = QVBoxLayout()
-        self.bootloaderIgnoreSignalsChk = QCheckBox(self.lang_manager.tr("bootloader_signals_checkbox", "--bootloader-ignore-signals"))
-        bootloader_desc = QLabel(self.lang_manager.tr("bootloader_signals_desc", "عند تفعيله: سيتم تجاهل إشارات النظام (مثل SIGTERM) في مرحلة التحميل الأولية (مفيد لتجنب إغلاق البرنامج بشكل مفاجئ)"))
+        self.bootloaderIgnoreSignalsChk = self.lang_manager.Bind(QCheckBox(), "setText", "bootloader_signals_checkbox", "--bootloader-ignore-signals")
+        bootloader_desc = self.lang_manager.Bind(QLabel(), "setText", "bootloader_signals_desc", "عند تفعيله: سيتم تجاهل إشارات النظام (مثل SIGTERM) في مرحلة التحميل الأولية (مفيد لتجنب إغلاق البرنامج بشكل مفاجئ)")
         bootloader_desc.setWordWrap(True)
         bootloader_desc.setStyleSheet("color: gray; font-size: 10px;")
         bootloader_layout.addWidget(self.bootloaderIgnoreSignalsChk)
@@ -1523,24 +1925,24 @@ class MainWindow(QMainWindow):
         widget = QWidget()
         layout = QVBoxLayout(widget)
         
-        security_group = QGroupBox(self.lang_manager.tr("security_options", "خيارات الأمان"))
+        security_group = self.lang_manager.Bind(QGroupBox(), "setTitle", "security_options", "خيارات الأمان")
         security_layout = QVBoxLayout()
-        self.obfuscateChk = QCheckBox(self.lang_manager.tr("obfuscation", "تشويش الكود (Obfuscation)"))
-        self.antiDebugChk = QCheckBox(self.lang_manager.tr("anti_debug", "الحماية من التصحيح (Anti-Debug)"))
-        self.packerChk = QCheckBox(self.lang_manager.tr("packer", "استخدام ملفات مضغوطة (Packer)"))
+        self.obfuscateChk = self.lang_manager.Bind(QCheckBox(), "setText", "obfuscation", "تشويش الكود (Obfuscation)")
+        self.antiDebugChk = self.lang_manager.Bind(QCheckBox(), "setText", "anti_debug", "الحماية من التصحيح (Anti-Debug)")
+        self.packerChk = self.lang_manager.Bind(QCheckBox(), "setText", "packer", "استخدام ملفات مضغوطة (Packer)")
         security_layout.addWidget(self.obfuscateChk)
         security_layout.addWidget(self.antiDebugChk)
         security_layout.addWidget(self.packerChk)
         security_group.setLayout(security_layout)
         layout.addWidget(security_group)
         
-        signing_group = QGroupBox(self.lang_manager.tr("digital_signature", "التوقيع الرقمي"))
+        signing_group = self.lang_manager.Bind(QGroupBox(), "setTitle", "digital_signature", "التوقيع الرقمي")
         signing_layout = QVBoxLayout()
         cert_layout = QHBoxLayout()
         self.certFileEdit = QLineEdit()
-        self.certFileBtn = QPushButton(self.lang_manager.tr("choose_certificate", "اختيار..."))
+        self.certFileBtn = self.lang_manager.Bind(QPushButton(), "setText", "choose_certificate", "اختيار...")
         self.certFileBtn.clicked.connect(self.pick_certificate)
-        cert_layout.addWidget(QLabel(self.lang_manager.tr("sign_certificate", "شهادة التوقيع")))
+        cert_layout.addWidget(self.lang_manager.Bind(QLabel(), "setText", "sign_certificate", "شهادة التوقيع"))
         cert_layout.addWidget(self.certFileEdit)
         cert_layout.addWidget(self.certFileBtn)
         signing_layout.addLayout(cert_layout)
@@ -1548,7 +1950,7 @@ class MainWindow(QMainWindow):
         cert_pass_layout = QHBoxLayout()
         self.certPassEdit = QLineEdit()
         self.certPassEdit.setEchoMode(QLineEdit.Password)
-        cert_pass_layout.addWidget(QLabel(self.lang_manager.tr("cert_password", "كلمة مرور الشهادة")))
+        cert_pass_layout.addWidget(self.lang_manager.Bind(QLabel(), "setText", "cert_password", "كلمة مرور الشهادة"))
         cert_pass_layout.addWidget(self.certPassEdit)
         signing_layout.addLayout(cert_pass_layout)
         
@@ -1562,7 +1964,7 @@ class MainWindow(QMainWindow):
             "http://tsa.starfieldtech.com",
             "Nothing"
         ])
-        timestamp_layout.addWidget(QLabel(self.lang_manager.tr("timestamp_server", "خادم الطابع الزمني")))
+        timestamp_layout.addWidget(self.lang_manager.Bind(QLabel(), "setText", "timestamp_server", "خادم الطابع الزمني"))
         timestamp_layout.addWidget(self.timestampCombo)
         signing_layout.addLayout(timestamp_layout)
         signing_group.setLayout(signing_layout)
@@ -1577,15 +1979,15 @@ class MainWindow(QMainWindow):
         widget = QWidget()
         layout = QVBoxLayout(widget)
         
-        files_group = QGroupBox(self.lang_manager.tr("additional_files", "ملفات موارد إضافية (--add-data)"))
+        files_group = self.lang_manager.Bind(QGroupBox(), "setTitle", "additional_files", "ملفات موارد إضافية (--add-data)")
         files_layout = QVBoxLayout()
         self.filesList = QListWidget()
         files_buttons = QHBoxLayout()
-        self.addFileBtn = QPushButton(self.lang_manager.tr("add_file", "إضافة ملف…"))
+        self.addFileBtn = self.lang_manager.Bind(QPushButton(), "setText", "add_file", "إضافة ملف…")
         self.addFileBtn.clicked.connect(self.add_file)
-        self.remFileBtn = QPushButton(self.lang_manager.tr("remove_file", "حذف المحدد"))
+        self.remFileBtn = self.lang_manager.Bind(QPushButton(), "setText", "remove_file", "حذف المحدد")
         self.remFileBtn.clicked.connect(self.remove_file)
-        self.chaning = QPushButton(self.lang_manager.tr("toggle_files_list", "تكبير / تصغير قائمة الملفات"))
+        self.chaning = self.lang_manager.Bind(QPushButton(), "setText", "toggle_files_list", "تكبير / تصغير قائمة الملفات")
         self.chaning.clicked.connect(self.__RestoreMinimize__)
         files_buttons.addWidget(self.chaning)
         files_buttons.addWidget(self.addFileBtn)
@@ -1595,13 +1997,13 @@ class MainWindow(QMainWindow):
         files_group.setLayout(files_layout)
         layout.addWidget(files_group)
         
-        folders_group = QGroupBox(self.lang_manager.tr("additional_folders", "مجلدات موارد إضافية (--add-data)"))
+        folders_group = self.lang_manager.Bind(QGroupBox(), "setTitle", "additional_folders", "مجلدات موارد إضافية (--add-data)")
         folders_layout = QVBoxLayout()
         self.foldersList = QListWidget()
         folders_buttons = QHBoxLayout()
-        self.addFolderBtn = QPushButton(self.lang_manager.tr("add_folder", "إضافة مجلد…"))
+        self.addFolderBtn = self.lang_manager.Bind(QPushButton(), "setText", "add_folder", "إضافة مجلد…")
         self.addFolderBtn.clicked.connect(self.add_folder)
-        self.remFolderBtn = QPushButton(self.lang_manager.tr("remove_folder", "حذف المحدد"))
+        self.remFolderBtn = self.lang_manager.Bind(QPushButton(), "setText", "remove_folder", "حذف المحدد")
         self.remFolderBtn.clicked.connect(self.remove_folder)
         folders_buttons.addWidget(self.addFolderBtn)
         folders_buttons.addWidget(self.remFolderBtn)
@@ -1610,18 +2012,16 @@ class MainWindow(QMainWindow):
         folders_group.setLayout(folders_layout)
         layout.addWidget(folders_group)
         
-        resource_management = QGroupBox(self.lang_manager.tr("resource_management", "إدارة الموارد"))
+        resource_management = self.lang_manager.Bind(QGroupBox(), "setTitle", "resource_management", "إدارة الموارد")
         resource_layout = QVBoxLayout()
         compression_layout = QHBoxLayout()
         self.compressionCombo = QComboBox()
-        self.compressionCombo.addItems([self.lang_manager.tr("compression_levels", ["بدون ضغط", "ضغط عادي", "ضغط عالي"])[0],
-                                        self.lang_manager.tr("compression_levels", ["بدون ضغط", "ضغط عادي", "ضغط عالي"])[1],
-                                        self.lang_manager.tr("compression_levels", ["بدون ضغط", "ضغط عادي", "ضغط عالي"])[2]])
-        compression_layout.addWidget(QLabel(self.lang_manager.tr("resource_compression", "ضغط الموارد")))
+        self.lang_manager.BindItems(self.compressionCombo, "compression_levels", ["بدون ضغط", "ضغط عادي", "ضغط عالي"])
+        compression_layout.addWidget(self.lang_manager.Bind(QLabel(), "setText", "resource_compression", "ضغط الموارد"))
         compression_layout.addWidget(self.compressionCombo)
         resource_layout.addLayout(compression_layout)
         
-        self.encryptionChk = QCheckBox(self.lang_manager.tr("encrypt_resources", "تشفير الموارد"))
+        self.encryptionChk = self.lang_manager.Bind(QCheckBox(), "setText", "encrypt_resources", "تشفير الموارد")
         resource_layout.addWidget(self.encryptionChk)
         resource_management.setLayout(resource_layout)
         layout.addWidget(resource_management)
@@ -1630,53 +2030,58 @@ class MainWindow(QMainWindow):
         return widget
 
     def setup_right_panel(self, layout):
-        output_group = QGroupBox(self.lang_manager.tr("output_group", "الإخراج"))
+        output_group = self.lang_manager.Bind(QGroupBox(), "setTitle", "output_group", "الإخراج")
         output_layout = QVBoxLayout()
         out_path_layout = QHBoxLayout()
         self.outLine = QLineEdit()
-        self.outBtn = QPushButton(self.lang_manager.tr("pick_output", "مكان الإخراج"))
+        self.outBtn = self.lang_manager.Bind(QPushButton(), "setText", "pick_output", "مكان الإخراج")
         self.outBtn.clicked.connect(self.pick_output)
-        out_path_layout.addWidget(QLabel(self.lang_manager.tr("output_folder", "مجلد الإخراج")))
+        out_path_layout.addWidget(self.lang_manager.Bind(QLabel(), "setText", "output_folder", "مجلد الإخراج"))
         out_path_layout.addWidget(self.outLine)
         out_path_layout.addWidget(self.outBtn)
         output_layout.addLayout(out_path_layout)
         
         icon_layout = QHBoxLayout()
         self.iconLine = QLineEdit()
-        self.iconBtn = QPushButton(self.lang_manager.tr("choose_icon", "اختيار أيقونة…"))
+        self.iconBtn = self.lang_manager.Bind(QPushButton(), "setText", "choose_icon", "اختيار أيقونة…")
         self.iconBtn.clicked.connect(self.pick_icon)
-        icon_layout.addWidget(QLabel(self.lang_manager.tr("icon", "الأيقونة")))
+        icon_layout.addWidget(self.lang_manager.Bind(QLabel(), "setText", "icon", "الأيقونة"))
         icon_layout.addWidget(self.iconLine)
         icon_layout.addWidget(self.iconBtn)
         output_layout.addLayout(icon_layout)
         
         manifest_layout = QHBoxLayout()
         self.manifestLine = QLineEdit()
-        self.manifestBtn = QPushButton(self.lang_manager.tr("choose_manifest", "اختيار ملف manifest…"))
+        self.manifestBtn = self.lang_manager.Bind(QPushButton(), "setText", "choose_manifest", "اختيار ملف manifest…")
         self.manifestBtn.clicked.connect(self.pick_manifest)
-        manifest_layout.addWidget(QLabel(self.lang_manager.tr("manifest", "الملف التجسيدي")))
+        manifest_layout.addWidget(self.lang_manager.Bind(QLabel(), "setText", "manifest", "الملف التجسيدي"))
         manifest_layout.addWidget(self.manifestLine)
         manifest_layout.addWidget(self.manifestBtn)
         output_layout.addLayout(manifest_layout)
         output_group.setLayout(output_layout)
         layout.addWidget(output_group)
         
-        imports_group = QGroupBox(self.lang_manager.tr("imports_settings", "الاستيرادات والإعدادات المتقدمة"))
+        imports_group = self.lang_manager.Bind(QGroupBox(), "setTitle", "imports_settings", "الاستيرادات والإعدادات المتقدمة")
         imports_layout = QVBoxLayout()
         hidden_layout = QHBoxLayout()
         self.hiddenImportsLine = QLineEdit()
-        hidden_layout.addWidget(QLabel(self.lang_manager.tr("hidden_imports", "الاستيرادات المخفية (مفصولة بفاصلة)")))
+        hidden_layout.addWidget(self.lang_manager.Bind(QLabel(), "setText", "hidden_imports", "الاستيرادات المخفية (مفصولة بفاصلة)"))
         hidden_layout.addWidget(self.hiddenImportsLine)
+        self.detectHiddenBtn = self.lang_manager.Bind(QPushButton(), "setText", "detect_hidden_imports", "اكتشاف")
+        self.detectHiddenBtn.clicked.connect(self.DetectHiddenImports)
+        hidden_layout.addWidget(self.detectHiddenBtn)
         imports_layout.addLayout(hidden_layout)
+        self.autoHiddenChk = self.lang_manager.Bind(QCheckBox(), "setText", "auto_hidden_imports", "إضافة الاستيرادات الديناميكية تلقائياً قبل البناء")
+        imports_layout.addWidget(self.autoHiddenChk)
         
         exclude_layout = QHBoxLayout()
         self.excludeModulesLine = QLineEdit()
-        exclude_layout.addWidget(QLabel(self.lang_manager.tr("exclude_modules", "الموديولات المستبعدة (مفصولة بفاصلة)")))
+        exclude_layout.addWidget(self.lang_manager.Bind(QLabel(), "setText", "exclude_modules", "الموديولات المستبعدة (مفصولة بفاصلة)"))
         exclude_layout.addWidget(self.excludeModulesLine)
         imports_layout.addLayout(exclude_layout)
         
         uac_layout = QHBoxLayout()
-        self.uacChk = QCheckBox(self.lang_manager.tr("request_admin", "طلب صلاحيات المدير Administrator (--uac-admin)"))
+        self.uacChk = self.lang_manager.Bind(QCheckBox(), "setText", "request_admin", "طلب صلاحيات المدير Administrator (--uac-admin)")
         self.iconAdmin = QIcon(r"icon\Adminisrtator.ico")
         self.uacChk.setIcon(self.iconAdmin)
         uac_layout.addWidget(self.uacChk)
@@ -1685,20 +2090,20 @@ class MainWindow(QMainWindow):
         
         key_layout = QHBoxLayout()
         self.keyLine = QLineEdit()
-        key_layout.addWidget(QLabel(self.lang_manager.tr("encryption_key", "مفتاح التشفير")))
+        key_layout.addWidget(self.lang_manager.Bind(QLabel(), "setText", "encryption_key", "مفتاح التشفير"))
         key_layout.addWidget(self.keyLine)
         imports_layout.addLayout(key_layout)
         imports_group.setLayout(imports_layout)
         layout.addWidget(imports_group)
         
-        build_control = QGroupBox(self.lang_manager.tr("build_control", "التحكم في البناء"))
+        build_control = self.lang_manager.Bind(QGroupBox(), "setTitle", "build_control", "التحكم في البناء")
         build_layout = QVBoxLayout()
         build_buttons = QHBoxLayout()
-        self.buildBtn = QPushButton(self.lang_manager.tr("start_build_button", "بدء البناء"))
+        self.buildBtn = self.lang_manager.Bind(QPushButton(), "setText", "start_build_button", "بدء البناء")
         if self.shield_icon and os.path.isfile(self.shield_icon):
             self.buildBtn.setIcon(QIcon(self.shield_icon))
         self.buildBtn.clicked.connect(self.start_build)
-        self.cancelBtn = QPushButton(self.lang_manager.tr("cancel", "إلغاء"))
+        self.cancelBtn = self.lang_manager.Bind(QPushButton(), "setText", "cancel", "إلغاء")
         self.cancelBtn.setEnabled(False)
         self.cancelBtn.clicked.connect(self.cancel_build)
         build_buttons.addWidget(self.buildBtn)
@@ -1711,9 +2116,23 @@ class MainWindow(QMainWindow):
         
         system_layout = QHBoxLayout()
         self.sysUsageLabel = QLabel("CPU: -%  RAM: -%  Disk: -%  GPU: -%")
-        self.runAfterChk = QCheckBox(self.lang_manager.tr("run_after", "تشغيل الناتج بعد البناء"))
+        self.runAfterChk = self.lang_manager.Bind(QCheckBox(), "setText", "run_after", "تشغيل الناتج بعد البناء")
+        self.jobsLabel = self.lang_manager.Bind(QLabel(), "setText", "parallel_jobs", "المهام المتوازية")
+        self.jobsSpin = QSpinBox()
+        self.jobsSpin.setRange(0, max(64, os.cpu_count() or 1))
+        self.lang_manager.Bind(self.jobsSpin, "setSpecialValueText", "parallel_jobs_auto", "تلقائي")
+        self.stallLabel = self.lang_manager.Bind(QLabel(), "setText", "stall_timeout", "مهلة التوقف")
+        self.stallSpin = QSpinBox()
+        self.stallSpin.setRange(0, 24 * 3600)
+        self.stallSpin.setSingleStep(30)
+        self.stallSpin.setSuffix(" s")
+        self.lang_manager.Bind(self.stallSpin, "setSpecialValueText", "stall_timeout_off", "معطّل")
         system_layout.addWidget(self.sysUsageLabel)
         system_layout.addWidget(self.runAfterChk)
+        system_layout.addWidget(self.jobsLabel)
+        system_layout.addWidget(self.jobsSpin)
+        system_layout.addWidget(self.stallLabel)
+        system_layout.addWidget(self.stallSpin)
         build_layout.addLayout(system_layout)
         build_control.setLayout(build_layout)
         layout.addWidget(build_control)
@@ -1724,32 +2143,34 @@ class MainWindow(QMainWindow):
         cmd_layout = QVBoxLayout(cmd_tab)
         self.cmdPreview = QPlainTextEdit()
         self.cmdPreview.setReadOnly(True)
-        self.cmdPreview.setPlaceholderText(self.lang_manager.tr("command_placeholder", "معاينة أوامر البناء ستظهر هنا…"))
-        cmd_layout.addWidget(QLabel(self.lang_manager.tr("command_preview", "معاينة الأوامر")))
+        self.lang_manager.Bind(self.cmdPreview, "setPlaceholderText", "command_placeholder", "معاينة أوامر البناء ستظهر هنا…")
+        cmd_layout.addWidget(self.lang_manager.Bind(QLabel(), "setText", "command_preview", "معاينة الأوامر"))
         cmd_layout.addWidget(self.cmdPreview)
-        logs_tab.addTab(cmd_tab, self.lang_manager.tr("command_preview", "معاينة الأوامر"))
+        self.lang_manager.Bind(logs_tab, "setTabText", "command_preview", "معاينة الأوامر", at=logs_tab.addTab(cmd_tab, ""))
         
         log_tab = QWidget()
         log_layout = QVBoxLayout(log_tab)
-        self.log = QPlainTextEdit()
-        self.log.setReadOnly(True)
-        self.log.setPlaceholderText(self.lang_manager.tr("log_placeholder", "سجل عملية البناء…"))
-        log_layout.addWidget(QLabel(self.lang_manager.tr("build_log", "سجل البناء")))
+        self.log = LogView(self.settings.get("log_max_lines", 20000))
+        self.lang_manager.Bind(self.log, "setPlaceholderText", "log_placeholder", "سجل عملية البناء…")
+        log_layout.addWidget(self.lang_manager.Bind(QLabel(), "setText", "build_log", "سجل البناء"))
         log_layout.addWidget(self.log)
-        logs_tab.addTab(log_tab, self.lang_manager.tr("build_log", "سجل البناء:"))
+        self.lang_manager.Bind(logs_tab, "setTabText", "build_log", "سجل البناء:", at=logs_tab.addTab(log_tab, ""))
         
         report_tab = QWidget()
         report_layout = QVBoxLayout(report_tab)
         self.reportText = QPlainTextEdit()
         self.reportText.setReadOnly(True)
-        self.reportText.setPlaceholderText(self.lang_manager.tr("report_placeholder", "تقرير البناء سيظهر هنا…"))
-        report_layout.addWidget(QLabel(self.lang_manager.tr("build_report", "تقرير البناء")))
+        self.lang_manager.Bind(self.reportText, "setPlaceholderText", "report_placeholder", "تقرير البناء سيظهر هنا…")
+        report_layout.addWidget(self.lang_manager.Bind(QLabel(), "setText", "build_report", "تقرير البناء"))
         report_layout.addWidget(self.reportText)
-        logs_tab.addTab(report_tab, self.lang_manager.tr("build_report", "التقارير"))
+        self.lang_manager.Bind(logs_tab, "setTabText", "build_report", "التقارير", at=logs_tab.addTab(report_tab, ""))
         
         class SysInfoWidget(QWidget):
             def __init__(self, lang_manager, parent=None, max_points=120, interval_ms=500):
                 super().__init__(parent)
+                # matplotlib (and numpy with it) is only loaded once this tab is first opened.
+                from matplotlib.figure import Figure
+                from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
                 self.lang_manager = lang_manager
                 self.max_points = max_points
@@ -1758,9 +2179,9 @@ class MainWindow(QMainWindow):
                 layout = QVBoxLayout(self)
 
                 ctrl_layout = QHBoxLayout()
-                self.pauseBtn = QPushButton(self.lang_manager.tr("pause", "إيقاف"))
-                self.clearBtn = QPushButton(self.lang_manager.tr("clear", "مسح"))
-                self.toggleViewBtn = QPushButton(self.lang_manager.tr("toggle_view", "تبديل العرض"))
+                self.pauseBtn = self.lang_manager.Bind(QPushButton(), "setText", "pause", "إيقاف")
+                self.clearBtn = self.lang_manager.Bind(QPushButton(), "setText", "clear", "مسح")
+                self.toggleViewBtn = self.lang_manager.Bind(QPushButton(), "setText", "toggle_view", "تبديل العرض")
 
                 ctrl_layout.addWidget(self.pauseBtn)
                 ctrl_layout.addWidget(self.clearBtn)
@@ -1775,7 +2196,7 @@ class MainWindow(QMainWindow):
                 self._text_mode = False
                 self.textView = QPlainTextEdit()
                 self.textView.setReadOnly(True)
-                self.textView.setPlaceholderText(self.lang_manager.tr("text_view_placeholder", "عرض نصي لمؤشرات النظام سيظهر هنا…"))
+                self.lang_manager.Bind(self.textView, "setPlaceholderText", "text_view_placeholder", "عرض نصي لمؤشرات النظام سيظهر هنا…")
                 layout.addWidget(self.textView)
                 self.textView.hide()
 
@@ -1822,9 +2243,9 @@ class MainWindow(QMainWindow):
             def _toggle_running(self):
                 self._running = not self._running
                 if self._running:
-                    self.pauseBtn.setText(self.lang_manager.tr("pause", "إيقاف"))
+                    self.lang_manager.Bind(self.pauseBtn, "setText", "pause", "إيقاف")
                 else:
-                    self.pauseBtn.setText(self.lang_manager.tr("resume", "استئناف"))
+                    self.lang_manager.Bind(self.pauseBtn, "setText", "resume", "استئناف")
 
             def _clear_data(self):
                 self.xdata.clear()
@@ -1842,12 +2263,12 @@ class MainWindow(QMainWindow):
                 if self._text_mode:
                     self.canvas.hide()
                     self.textView.show()
-                    self.toggleViewBtn.setText(self.lang_manager.tr("graph_view", "عرض بياني"))
+                    self.lang_manager.Bind(self.toggleViewBtn, "setText", "graph_view", "عرض بياني")
                     self._update_text_view()
                 else:
                     self.textView.hide()
                     self.canvas.show()
-                    self.toggleViewBtn.setText(self.lang_manager.tr("text_view", "عرض نصي"))
+                    self.lang_manager.Bind(self.toggleViewBtn, "setText", "text_view", "عرض نصي")
                     self._redraw()
 
 
@@ -1881,6 +2302,7 @@ class MainWindow(QMainWindow):
                 except Exception:
                     pass
                 try:
+                    import GPUtil
                     gpus = GPUtil.getGPUs()
                     if gpus:
                         gpu = max((g.load or 0.0) * 100.0 for g in gpus)
@@ -1900,7 +2322,7 @@ class MainWindow(QMainWindow):
                 self.disk_data.append(disk)
                 self.gpu_data.append(gpu)
                 freq = 0.5
-                wave = 50.0 * (1.0 + np.sin(2 * np.pi * freq * t))
+                wave = 50.0 * (1.0 + math.sin(2 * math.pi * freq * t))
                 self.wave_data.append(wave)
                 self._redraw()
 
@@ -2011,18 +2433,26 @@ class MainWindow(QMainWindow):
                 except Exception as e:
                     self.textView.setPlainText(f"Error updating text display: {str(e)}")
                     logs_tab.addTab(SysInfoWidget(self.lang_manager, self), self.lang_manager.tr("sysinfo_tab", "معلومات النظام"))
-        sysinfo_tab = SysInfoWidget(self.lang_manager, self)
-        logs_tab.addTab(sysinfo_tab, self.lang_manager.tr("sysinfo_tab", "معلومات النظام"))
+        sysinfo_tab = QWidget()
+        sysinfo_layout = QVBoxLayout(sysinfo_tab)
+        sysinfo_layout.setContentsMargins(0, 0, 0, 0)
+        sysinfo_index = logs_tab.addTab(sysinfo_tab, "")
+        self.lang_manager.Bind(logs_tab, "setTabText", "sysinfo_tab", "معلومات النظام", at=sysinfo_index)
+
+        def load_sysinfo(index):
+            if index == sysinfo_index and sysinfo_layout.count() == 0:
+                sysinfo_layout.addWidget(SysInfoWidget(self.lang_manager, self))
+        logs_tab.currentChanged.connect(load_sysinfo)
         layout.addWidget(logs_tab)
 
         action_buttons = QHBoxLayout()
-        self.saveLogBtn = QPushButton(self.lang_manager.tr("save_log", "حفظ السجل"))
+        self.saveLogBtn = self.lang_manager.Bind(QPushButton(), "setText", "save_log", "حفظ السجل")
         self.saveLogBtn.clicked.connect(self.save_log_to_file)
-        self.openDistBtn = QPushButton(self.lang_manager.tr("open_output_folder", "فتح مجلد الإخراج"))
+        self.openDistBtn = self.lang_manager.Bind(QPushButton(), "setText", "open_output_folder", "فتح مجلد الإخراج")
         self.openDistBtn.clicked.connect(self.open_output_folder)
-        self.openBuildBtn = QPushButton(self.lang_manager.tr("open_build_folder", "فتح مجلد build"))
+        self.openBuildBtn = self.lang_manager.Bind(QPushButton(), "setText", "open_build_folder", "فتح مجلد build")
         self.openBuildBtn.clicked.connect(self.open_build_folder)
-        self.testOutputBtn = QPushButton(self.lang_manager.tr("test_output", "اختبار الناتج"))
+        self.testOutputBtn = self.lang_manager.Bind(QPushButton(), "setText", "test_output", "اختبار الناتج")
         self.testOutputBtn.clicked.connect(self.test_output)
         action_buttons.addWidget(self.saveLogBtn)
         action_buttons.addWidget(self.openDistBtn)
@@ -2067,7 +2497,7 @@ class MainWindow(QMainWindow):
                 subprocess.Popen([exe_path])
             self._append_log(f"[TEST] تم تشغيل الملف للاختبار: {exe_path}")
         except Exception as e:
-            QMessageBox.warning(self, self.lang_manager.tr("test_output", "اختبار"), self.lang_manager.tr("failed_to_run_file", f"فشل تشغيل الملف: {e}"))
+            QMessageBox.warning(self, self.lang_manager.tr("test_output", "اختبار"), self.lang_manager.trf("failed_to_run_file", "فشل تشغيل الملف: {}", e))
 
     def manage_plugins(self):
         QMessageBox.information(self, self.lang_manager.tr("plugins", "الإضافات"), self.lang_manager.tr("plugins_info", "نظام الإضافات مفعل. ضع ملفات الإضافات في مجلد 'plugins'"))
@@ -2125,16 +2555,8 @@ class MainWindow(QMainWindow):
                               self.lang_manager.tr("failed_to_check_pyinstaller", f"تعذّر التحقق من تحديثات PyInstaller:\n{e}"))
             return
 
-        try:
-            result = subprocess.check_output(["pip", "show", "pyinstaller"], stderr=subprocess.DEVNULL)
-            for line in result.decode("utf-8").splitlines():
-                if line.startswith("Version:"):
-                    local_ver = line.split(":", 1)[1].strip()
-                    break
-            else:
-                local_ver = "0.0.0"
-        except Exception:
-            local_ver = "0.0.0"
+        python_exec = self.CurrentInterpreter()
+        local_ver = SharedPackageIndex(python_exec).Version("pyinstaller") or "0.0.0"
 
         def parse_version(v: str):
             parts = re.findall(r"\d+", v)
@@ -2153,15 +2575,15 @@ class MainWindow(QMainWindow):
             if QMessageBox.question(self, self.lang_manager.tr("update_available", "تحديث متاح"), msg, 
                                    QMessageBox.Yes | QMessageBox.No) == QMessageBox.Yes:
                 try:
-                    subprocess.check_call(["pip", "install", "--upgrade", "pyinstaller"])
+                    subprocess.check_call([python_exec, "-m", "pip", "install", "--upgrade", "pyinstaller"] if python_exec else ["pip", "install", "--upgrade", "pyinstaller"])
                     QMessageBox.information(self, self.lang_manager.tr("done", "تم"), 
-                                          self.lang_manager.tr("pyinstaller_updated", "تم تحديث PyInstaller بنجاح"))
+                                          self.lang_manager.trf("pyinstaller_updated", "تم تحديث PyInstaller إلى الإصدار {}", remote_ver))
                 except Exception as e:
                     QMessageBox.warning(self, self.lang_manager.tr("failed", "فشل"), 
-                                      self.lang_manager.tr("update_failed", f"فشل التحديث: {e}"))
+                                      self.lang_manager.trf("update_failed", "فشل التحديث: {}", e))
         else:
             QMessageBox.information(self, self.lang_manager.tr("check_updates", "تحقق من التحديثات"), 
-                                  self.lang_manager.tr("pyinstaller_up_to_date", f"PyInstaller محدث: {local_ver}"))
+                                  self.lang_manager.trf("pyinstaller_up_to_date", "PyInstaller محدث: {}", local_ver))
         
 
     def set_theme(self, theme):
@@ -2258,15 +2680,17 @@ class MainWindow(QMainWindow):
         for url in event.mimeData().urls():
             path = url.toLocalFile()
             if os.path.isdir(path):
+                self.__EnsureTab__("resources")
                 self.foldersList.addItem(os.path.abspath(path))
             elif path.lower().endswith(".py"):
                 if self.modeCombo.currentIndex() == 0:
                     self.entryLine.setText(os.path.abspath(path))
                 else:
-                    self.entryList.addItem(os.path.abspath(path))
+                    self.__AddEntry__(path)
             elif path.lower().endswith(".ico"):
                 self.iconLine.setText(os.path.abspath(path))
             elif path.lower().endswith(".pfx") or path.lower().endswith(".p12"):
+                self.__EnsureTab__("security")
                 self.certFileEdit.setText(os.path.abspath(path))
         self.SaveSettings()
 
@@ -2287,7 +2711,12 @@ class MainWindow(QMainWindow):
         paths, _ = QFileDialog.getOpenFileNames(self, self.lang_manager.tr("pick_scripts", "اختيار سكربتات"), "", "Python (*.py)")
         for p in paths:
             if p:
-                self.entryList.addItem(os.path.abspath(p))
+                self.__AddEntry__(p)
+
+    def __AddEntry__(self, path: str):
+        path = os.path.abspath(path)
+        if not self.entryList.findItems(path, Qt.MatchExactly):
+            self.entryList.addItem(path)
 
     def remove_entry(self):
         for item in self.entryList.selectedItems():
@@ -2303,11 +2732,11 @@ class MainWindow(QMainWindow):
         if self.filesList.maximumHeight() <= 150:
             self.filesList.setMaximumHeight(400) 
             self.filesList.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-            self.chaning.setText(self.lang_manager.tr("shrink_files_list", "تصغير قائمة الملفات"))
+            self.lang_manager.Bind(self.chaning, "setText", "shrink_files_list", "تصغير قائمة الملفات")
         else:
             self.filesList.setMaximumHeight(150)
             self.filesList.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-            self.chaning.setText(self.lang_manager.tr("expand_files_list", "تكبير قائمة الملفات"))
+            self.lang_manager.Bind(self.chaning, "setText", "expand_files_list", "تكبير قائمة الملفات")
     def remove_file(self):
         for item in self.filesList.selectedItems():
             self.filesList.takeItem(self.filesList.row(item))
@@ -2343,86 +2772,53 @@ class MainWindow(QMainWindow):
         else:
             return [self.entryList.item(i).text() for i in range(self.entryList.count())]
 
-    def _build_add_data_args(self) -> List[str]:
-        args = []
-        for i in range(self.filesList.count()):
-            src = self.filesList.item(i).text()
-            dest = os.path.basename(src)
-            spec = f"{src}{PATHSEP}{dest}"
-            args.extend(["--add-data", spec])
-        for i in range(self.foldersList.count()):
-            src = self.foldersList.item(i).text()
-            dest = os.path.basename(os.path.normpath(src))
-            spec = f"{src}{PATHSEP}{dest}"
-            args.extend(["--add-data", spec])
-        return args
+    def _build_options(self) -> Dict[str, Any]:
+        # Options on tabs that were never opened come from the settings model.
+        self.__CollectSettings__()
+        adv = self.settings.get("advanced", {})
+        return {
+            "last_output": self.outLine.text().strip() or os.path.abspath("output"),
+            "clean": self.cleanChk.isChecked(),
+            "onefile": self.oneFileChk.isChecked(),
+            "noconsole": not self.consoleChk.isChecked(),
+            "incremental": self.incrementalChk.isChecked(),
+            "merge_batch": self.mergeChk.isChecked(),
+            "merge_name": self.settings.get("merge_name", "suite"),
+            "last_icon": self.iconLine.text().strip(),
+            "last_manifest": self.manifestLine.text().strip(),
+            "last_files": list(self.settings.get("last_files", [])),
+            "last_folders": list(self.settings.get("last_folders", [])),
+            "advanced": {
+                "hidden_imports": [s.strip() for s in self.hiddenImportsLine.text().split(",") if s.strip()],
+                "exclude_modules": [s.strip() for s in self.excludeModulesLine.text().split(",") if s.strip()],
+                "uac_admin": self.uacChk.isChecked(),
+                "key": self.keyLine.text().strip(),
+                "optimize": adv.get("optimize", False),
+                "strip": adv.get("strip", False),
+                "no_prefer_redirect": adv.get("no_prefer_redirect", False)
+            }
+        }
 
     def _make_commands(self, generate_spec_only=False) -> List[List[str]]:
+        # Builds detect hidden imports in BuildWorker; only spec generation does it here.
+        options = self._build_options()
         entries = self._collect_entries()
-        outdir = self.outLine.text().strip() or os.path.abspath("output")
-        os.makedirs(outdir, exist_ok=True)
-
-        base_args = ["pyinstaller", "--distpath", outdir]
-        if self.cleanChk.isChecked():
-            base_args.append("--clean")
-        if self.oneFileChk.isChecked():
-            base_args.append("-F")
-        if not self.consoleChk.isChecked():
-            base_args.append("--noconsole")
-
-        icon = self.iconLine.text().strip()
-        if icon:
-            base_args.extend(["--icon", icon])
-
-        manifest = self.manifestLine.text().strip()
-        if manifest:
-            base_args.extend(["--manifest", manifest])
-
-        base_args.extend(self._build_add_data_args())
-
-        hidden = [s.strip() for s in self.hiddenImportsLine.text().split(",") if s.strip()]
-        excl = [s.strip() for s in self.excludeModulesLine.text().split(",") if s.strip()]
-        if hidden:
-            for h in hidden:
-                base_args.extend(["--hidden-import", h])
-        if excl:
-            for e in excl:
-                base_args.extend(["--exclude-module", e])
-        if self.uacChk.isChecked():
-            base_args.append("--uac-admin")
-        key = self.keyLine.text().strip()
-        if key:
-            base_args.extend(["--key", key])
-
-        if self.optimizeChk.isChecked():
-            base_args.append("--optimize")
-        if self.stripChk.isChecked():
-            base_args.append("--strip")
-        if self.noPreferRedirectChk.isChecked():
-            base_args.append("--no-prefer-redirect")
-
-        cmds = []
-        for e in entries:
-            if not os.path.isfile(e):
-                continue
-            if generate_spec_only:
-                cmd = ["pyi-makespec"] + base_args[1:] + [e]
-            else:
-                cmd = base_args + [e]
-            cmds.append(cmd)
-        return cmds
+        self._detected_hidden = []
+        if generate_spec_only and self.autoHiddenChk.isChecked():
+            options = WithDetectedHiddenImports(options, entries, self.CurrentInterpreter(), self._detected_hidden.append)
+        return MakeCommands(options, entries, generate_spec_only=generate_spec_only, cwd=os.getcwd())
 
     def start_build(self):
         self.SaveSettings()
 
-        python_exec = self.interpCombo.currentText().strip() or None
+        python_exec = self.CurrentInterpreter()
         if python_exec:
             if not shutil.which(os.path.basename(python_exec)) and not os.path.isfile(python_exec):
                 if QMessageBox.question(self, self.lang_manager.tr("python_interpreter", "مفسّر Python"), f"{self.lang_manager.tr("interpreter_not_found", "المسار المحدد للمفسر غير موجود")}:\n{python_exec}\n\n{self.lang_manager.tr("continue_with_system_interpreter", "هل تريد المتابعة مع مفسر النظام؟")}", QMessageBox.Yes | QMessageBox.No) == QMessageBox.No:
                     return
                 python_exec = None
 
-        if shutil.which("pyinstaller") is None:
+        if not python_exec and shutil.which("pyinstaller") is None:
             QMessageBox.critical(self, self.lang_manager.tr("pyinstaller_not_found", "PyInstaller غير موجود"), self.lang_manager.tr("install_pyinstaller", "تعذر العثور على PyInstaller. ثبّت الحزمة بالأمر:\n\n    pip install pyinstaller\n\nثم أعد المحاولة."))
             return
 
@@ -2445,15 +2841,24 @@ class MainWindow(QMainWindow):
         self.buildBtn.setEnabled(False)
         self.cancelBtn.setEnabled(True)
         self.log.clear()        
+        cache = None
+        if self.cacheChk.isChecked():
+            try:
+                cache = BuildCache(CACHE_DIR, self.settings.get("build_cache_max_mb", 2048))
+            except Exception as e:
+                self._append_log(f"[CACHE] Disabled: {e}")
         self.thread = QThread()
-        self.worker = BuildWorker(commands=cmds, cwd=os.getcwd(), python_exec=python_exec, run_after=self.runAfterChk.isChecked())
+        self.worker = BuildWorker(commands=cmds, cwd=os.getcwd(), python_exec=python_exec, run_after=self.runAfterChk.isChecked(), jobs=self.jobsSpin.value(), cache=cache, incremental=self.incrementalChk.isChecked(), warm=WarmWorkerOptions(self.settings) if self.warmWorkerChk.isChecked() else None, stall_timeout=self.stallSpin.value(), stall_action=self.settings.get("stall_action", "abort"), audit=[e for e in self._collect_entries() if e.endswith(".py")] if self.auditChk.isChecked() else None, estimate=[e for e in self._collect_entries() if e.endswith(".py")] if self.estimateChk.isChecked() else None, excludes=[s.strip() for s in self.excludeModulesLine.text().split(",") if s.strip()], detect=(self._build_options(), self._collect_entries()) if self.autoHiddenChk.isChecked() else None)
         self.worker.moveToThread(self.thread)
         self.thread.started.connect(self.worker.run)
         self.worker.line.connect(self._append_log)
+        self.worker.lines.connect(self._append_lines)
         self.worker.progress.connect(self._set_progress)
         self.worker.cpu_mem.connect(self._on_cpu_mem)
+        self.worker.preview.connect(self.cmdPreview.setPlainText)
         self.worker.done.connect(self._build_finished)
         self.thread.start()        
+        self._build_started = time.time()
         self.progressBar.setRange(0, 0)
         self._indeterminate = True
 
@@ -2468,14 +2873,13 @@ class MainWindow(QMainWindow):
         self._append_log("[INFO] Build cancelled by user.")
 
     def _append_log(self, text: str):
-        self.log.appendPlainText(text)
-        self.log.verticalScrollBar().setValue(self.log.verticalScrollBar().maximum())
+        self._append_lines([text])
+
+    def _append_lines(self, lines: List[str]):
+        self.log.appendLines([l for text in lines for l in text.split("\n")])
         
-        try:
-            with open(LOG_FILE, "a", encoding="utf-8") as f:
-                f.write(f"{time.ctime()} {text}\n")
-        except Exception:
-            pass
+        stamp = time.ctime()
+        AppLog().Write("".join(f"{stamp} {text}\n" for text in lines))
 
     def _set_progress(self, value: int):
         self.progressBar.setRange(0, 100)
@@ -2497,6 +2901,7 @@ class MainWindow(QMainWindow):
 
     def _get_gpu_usage(self) -> float:
         try:
+            import GPUtil
             gpus = GPUtil.getGPUs()
             if not gpus:
                 return 0.0
@@ -2555,6 +2960,13 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
             self.thread = None
+        if self.worker:
+            try:
+                duration = time.time() - getattr(self, "_build_started", time.time())
+                output_path = self.outLine.text().strip() or os.path.abspath("output")
+                self.reportText.setPlainText(self.__GenerateBuildReport__(duration, output_path, self.worker.runner.phases))
+            except Exception:
+                pass
         self.worker = None
         self.buildBtn.setEnabled(True)
         self.cancelBtn.setEnabled(False)
@@ -2603,6 +3015,7 @@ class MainWindow(QMainWindow):
             self._append_log("[SUCCESS] Done building without errors.")
             QMessageBox.information(self, self.lang_manager.tr("done", "تم"), self.lang_manager.tr("build_finished_without_errors", "انتهى البناء بدون أخطاء. الملفات داخل مجلد الإخراج المحدد."))
             try:
+                from plyer import notification
                 notification.notify(
                     icon=r"icon\PyCLI.ico" if os.path.isfile(r"icon\PyCLI.ico") else None,
                     title="From Python to Executable",
@@ -2637,8 +3050,8 @@ class MainWindow(QMainWindow):
             path = default
         try:
             with open(path, "w", encoding="utf-8") as f:
-                f.write(self.log.toPlainText())
-            QMessageBox.information(self, self.lang_manager.tr("save_log", "حفظ السجل"), self.lang_manager.tr("log_saved_to", "تم حفظ السجل في: ") + path)
+                self.log.Export(f)
+            QMessageBox.information(self, self.lang_manager.tr("save_log", "حفظ السجل"), self.lang_manager.trf("log_saved_to", "تم حفظ السجل في: {}", path))
         except Exception as e:
             QMessageBox.warning(self, self.lang_manager.tr("save_log", "حفظ السجل"), self.lang_manager.tr("failed_to_save_log", "فشل حفظ السجل: ") + str(e))
 
@@ -2671,7 +3084,7 @@ class MainWindow(QMainWindow):
     def clean_output_folder(self):
         outdir = self.outLine.text().strip() or os.path.abspath("output")
         if os.path.isdir(outdir):
-            reply = QMessageBox.question(self, self.lang_manager.tr("delete_output_folder", "حذف مجلد الإخراج"), self.lang_manager.tr("confirm_delete_output_folder", f"هل تريد حذف المجلد:\n{outdir} ?"), QMessageBox.Yes | QMessageBox.No)
+            reply = QMessageBox.question(self, self.lang_manager.tr("delete_output_folder", "حذف مجلد الإخراج"), self.lang_manager.trf("confirm_delete_output_folder", "هل تريد حذف المجلد:\n{} ?", outdir), QMessageBox.Yes | QMessageBox.No)
             if reply == QMessageBox.Yes:
                 try:
                     shutil.rmtree(outdir)
@@ -2705,13 +3118,15 @@ class MainWindow(QMainWindow):
             return
         preview = "\n\n".join(" ".join(map(quote, c)) for c in cmds)
         self.cmdPreview.setPlainText(preview)
+        for text in self._detected_hidden:
+            self._append_log(text)
         
         for cmd in cmds:
             try:
                 subprocess.check_call(cmd, cwd=os.getcwd())
                 self._append_log(f"[INFO] .spec generated using: {' '.join(cmd)}")
             except Exception as e:
-                QMessageBox.warning(self, self.lang_manager.tr("generation_failed", "فشل التوليد"), self.lang_manager.tr("generation_failed_details", f"خلال توليد .spec حدث خطأ: {e}"))
+                QMessageBox.warning(self, self.lang_manager.tr("generation_failed", "فشل التوليد"), self.lang_manager.trf("generation_failed_details", "خلال توليد .spec حدث خطأ: {}", e))
                 return
         QMessageBox.information(self, self.lang_manager.tr("done", "تم"), self.lang_manager.tr("spec_files_generated", "تم توليد ملفات .spec بنجاح."))
     def check_updates(self):
@@ -2778,24 +3193,57 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         try:
-            self.SaveSettings()
+            self.__CollectSettings__()
+            self.FlushSettings()
         except Exception:
             pass
+        self.StopInterpreterDiscovery()
         event.accept()
 
+def ReportStartup(window: "MainWindow", shown_ms: float):
+    # Runs on the first event-loop turn after show(), i.e. once the window is on screen.
+    elapsed = ElapsedMs()
+    STARTUP_TRACE.Add("first paint", shown_ms, elapsed)
+    budget = window.settings.get("startup_budget_ms", 1500)
+    heavy = [name for name in HEAVY_MODULES if name in sys.modules]
+    status = "over budget" if elapsed > budget else "ok"
+    AppLog().Write(f"[STARTUP] Window shown after {elapsed:.0f} ms (budget {budget} ms, {status}){' heavy modules loaded: ' + ', '.join(heavy) if heavy else ''}\n")
+    if IMPORT_TIMER:
+        IMPORT_TIMER.Uninstall()
+        report = IMPORT_TIMER.Report(window_ms=elapsed)
+        path = os.path.abspath("startup-importtime.txt")
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(report + "\n")
+        except Exception as e:
+            print(f"[STARTUP] Failed to write {path}: {e}")
+        print(report.split("\n\n", 1)[-1])
+        print(f"[STARTUP] Full report: {path}")
+    if STARTUP_TRACE.enabled:
+        path = os.path.abspath("startup-trace.json")
+        try:
+            STARTUP_TRACE.Write(path)
+        except Exception as e:
+            print(f"[STARTUP] Failed to write {path}: {e}")
+        report = STARTUP_TRACE.Report()
+        AppLog().Write("[STARTUP] Trace\n" + report + "\n")
+        print(report)
+        print(f"[STARTUP] Trace: {path}")
+
 def main():
-    app = QApplication(sys.argv)
+    with STARTUP_TRACE.Span("qapplication"):
+        app = QApplication([arg for arg in sys.argv if arg not in DEBUG_FLAGS])
     window = MainWindow()
-    window.show()
+    with STARTUP_TRACE.Span("show"):
+        window.show()
+    shown = ElapsedMs()
+    QTimer.singleShot(0, lambda: ReportStartup(window, shown))
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     StartTime = time.time()
-    try:
-        with open(LOG_FILE, "a", encoding="utf-8") as log:
-            log.write(f"[START] {time.ctime()}\n")
-    except Exception:
-        pass
+    AppLog().Write(f"[START] {time.ctime()}\n")
 
     try:
         main()
@@ -2804,11 +3252,7 @@ if __name__ == "__main__":
     finally:
         EndTime = time.time()
         duration = EndTime - StartTime
-        try:
-            with open(LOG_FILE, "a", encoding="utf-8") as log:
-                log.write(f"[END] {time.ctime()} - Duration: {duration:.2f} seconds\n\n")
-        except Exception:
-            pass
+        AppLog().Write(f"[END] {time.ctime()} - Duration: {duration:.2f} seconds\n\n")
         try:
             import platform
             text = (
@@ -2830,11 +3274,7 @@ if __name__ == "__main__":
             fp = os.path.join(os.getcwd(), "Report-info-System.txt")
             with open(fp, "w", encoding="utf-8") as fh:
                 fh.write(text)
-            try:
-                with open(LOG_FILE, "a", encoding="utf-8") as log:
-                    log.write(f"[INFO] Saved file in {fp}\n")
-            except Exception:
-                pass
+            AppLog().Write(f"[INFO] Saved file in {fp}\n")
         except Exception:
             pass
         def FileFixingBugs():
@@ -2859,14 +3299,11 @@ if __name__ == "__main__":
                 fp = os.path.join(fix_dir, "FixingBugs.txt")
                 with open(fp, "w", encoding="utf-8") as fh:
                     fh.write(text)
-                try:
-                    with open(LOG_FILE, "a", encoding="utf-8") as log:
-                        log.write(f"Copyright Mohammed Al-Baqer\n\n[INFO] Saved file in {fp}\n")
-                except Exception:
-                    pass
+                AppLog().Write(f"Copyright Mohammed Al-Baqer\n\n[INFO] Saved file in {fp}\n")
             except Exception:
                 pass
         FileFixingBugs()
+        AppLog().Close()
 
 if os.name == "nt":
 
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025
+# Developer : Mohammed Al-Baqer
+
+# settings.json persistence. The store owns the settings dict the GUI edits in place
+# and compares it with a snapshot of what is on disk, so only a real change causes a
+# write (the GUI coalesces those on a timer). Writes go to a temp file that replaces
+# settings.json, and backups are a bounded ring named by content hash, so unchanged
+# settings are never copied again.
+
+import os
+import json
+import time
+import hashlib
+from typing import List, Dict, Any, Optional
+
+
+BACKUP_PREFIX = "settings_backup_"
+
+def _copy(data: Dict[str, Any]) -> Dict[str, Any]:
+    return json.loads(json.dumps(data, ensure_ascii=False))
+
+class SettingsStore:
+    def __init__(self, path: str, backup_dir: str, defaults: Dict[str, Any]):
+        self.path = path
+        self.backup_dir = backup_dir
+        self.defaults = defaults
+        self.data: Dict[str, Any] = {}
+        self._saved: Dict[str, Any] = {}
+        self._raw: Optional[bytes] = None
+
+    def Load(self) -> Dict[str, Any]:
+        # A damaged settings.json falls back to the newest backup that parses, then to the defaults.
+        self.data.clear()
+        for path in [self.path] + self._backups()[::-1]:
+            try:
+                with open(path, "rb") as f:
+                    raw = f.read()
+                data = json.loads(raw.decode("utf-8"))
+                if not isinstance(data, dict):
+                    raise ValueError("not a JSON object")
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                print(f"[Settings] Failed to load {path}: {e}")
+                continue
+            self.data.update(data)
+            self._raw = raw if path == self.path else None
+            self._saved = _copy(self.data) if path == self.path else {}
+            return self.data
+        self.data.update(_copy(self.defaults))
+        self._saved = {}
+        return self.data
+
+    def Dirty(self) -> List[str]:
+        # Top-level keys whose value differs from what was last read or written.
+        keys = [k for k, v in self.data.items() if k not in self._saved or self._saved[k] != v]
+        return keys + [k for k in self._saved if k not in self.data]
+
+    def Flush(self) -> bool:
+        # Raises OSError when the file cannot be written; the snapshot is then left stale.
+        if not self.Dirty() and os.path.isfile(self.path):
+            return False
+        raw = json.dumps(self.data, ensure_ascii=False, indent=2).encode("utf-8")
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        self._raw = raw
+        self._saved = _copy(self.data)
+        return True
+
+    def Reset(self):
+        self.data.clear()
+        self.data.update(_copy(self.defaults))
+        self._saved = {}
+        self._raw = None
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def _backups(self) -> List[str]:
+        # Oldest first, by mtime (names only resolve to the second).
+        try:
+            with os.scandir(self.backup_dir) as it:
+                entries = [(e.stat().st_mtime_ns, e.name) for e in it if e.name.startswith(BACKUP_PREFIX) and e.name.endswith(".json")]
+        except OSError:
+            return []
+        return [os.path.join(self.backup_dir, name) for _, name in sorted(entries)]
+
+    def Backup(self, keep: int = 10) -> Optional[str]:
+        # Copies the settings as loaded unless a backup with the same content hash exists,
+        # then deletes the oldest backups beyond `keep`. No re-read: Load() kept the bytes.
+        if self._raw is None:
+            return None
+        digest = hashlib.sha1(self._raw).hexdigest()[:12]
+        backups = self._backups()
+        created = None
+        if not any(os.path.basename(p).endswith(f"_{digest}.json") for p in backups):
+            created = os.path.join(self.backup_dir, f"{BACKUP_PREFIX}{time.strftime('%Y%m%d_%H%M%S')}_{digest}.json")
+            try:
+                os.makedirs(self.backup_dir, exist_ok=True)
+                with open(created, "wb") as f:
+                    f.write(self._raw)
+                backups.append(created)
+            except OSError as e:
+                print(f"[Settings] Backup failed: {e}")
+                created = None
+        for path in backups[:max(0, len(backups) - max(1, keep))]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        return created
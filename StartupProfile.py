@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025
+# Developer : Mohammed Al-Baqer
+
+# Startup measurements for the GUI. Imported first by PyToExe.py, so PROCESS_START is
+# as close to interpreter start as a frozen build allows. ImportTimer produces an
+# `-X importtime`-style report by wrapping builtins.__import__, which also works in a
+# PyInstaller build where -X options cannot be passed; StartupTrace records one span
+# per startup stage.
+
+import os
+import sys
+import json
+import time
+import builtins
+from contextlib import contextmanager
+from typing import List, Tuple, Optional
+
+PROCESS_START = time.perf_counter()
+
+# Modules that must not be imported before the main window is shown.
+HEAVY_MODULES = ("matplotlib", "numpy", "GPUtil", "plyer")
+
+def ElapsedMs() -> float:
+    return (time.perf_counter() - PROCESS_START) * 1000.0
+
+class ImportTimer:
+    # Records (module, self us, cumulative us, depth) for each first import, in the
+    # order the imports finish, like `python -X importtime`.
+
+    def __init__(self):
+        self.records: List[Tuple[str, int, int, int]] = []
+        self._stack: List[float] = []
+        self._original = None
+
+    def Install(self) -> "ImportTimer":
+        if self._original is None:
+            self._original = builtins.__import__
+            builtins.__import__ = self._import
+        return self
+
+    def Uninstall(self):
+        if self._original is not None:
+            builtins.__import__ = self._original
+            self._original = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules:
+            return self._original(name, globals, locals, fromlist, level)
+        start = time.perf_counter()
+        self._stack.append(0.0)
+        try:
+            return self._original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            self.records.append((name, int((elapsed - children) * 1e6), int(elapsed * 1e6), len(self._stack)))
+
+    def Report(self, top: int = 25, window_ms: Optional[float] = None) -> str:
+        lines = ["import time: self [us] | cumulative | imported package"]
+        for name, self_us, cumulative_us, depth in self.records:
+            lines.append(f"import time: {self_us:>9} | {cumulative_us:>10} | {'  ' * depth}{name}")
+        lines.append("")
+        roots = sorted((r for r in self.records if r[3] == 0), key=lambda r: r[2], reverse=True)
+        total = sum(r[2] for r in roots)
+        lines.append(f"Top-level imports: {total / 1000:.1f} ms")
+        for name, _, cumulative_us, _ in roots[:top]:
+            lines.append(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+        if window_ms is not None:
+            lines.append(f"Window shown after {window_ms:.0f} ms")
+        return "\n".join(lines)
+
+class StartupTrace:
+    # Spans are (name, start ms, end ms) relative to PROCESS_START. Disabled traces
+    # cost one attribute check per stage.
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.spans: List[Tuple[str, float, float]] = []
+
+    def Add(self, name: str, start_ms: float, end_ms: Optional[float] = None):
+        if self.enabled:
+            self.spans.append((name, start_ms, ElapsedMs() if end_ms is None else end_ms))
+
+    @contextmanager
+    def Span(self, name: str):
+        start = ElapsedMs()
+        try:
+            yield
+        finally:
+            self.Add(name, start)
+
+    def Report(self) -> str:
+        lines = [f"{'stage':<16}{'start ms':>10}{'duration ms':>14}"]
+        for name, start, end in self.spans:
+            lines.append(f"{name:<16}{start:>10.1f}{end - start:>14.1f}")
+        if self.spans:
+            lines.append(f"{'total':<16}{'':>10}{max(end for _, _, end in self.spans):>14.1f}")
+        return "\n".join(lines)
+
+    def Write(self, path: str):
+        # Chrome trace event format, so the file opens in chrome://tracing or Perfetto.
+        events = [{"name": name, "ph": "X", "ts": int(start * 1000), "dur": int((end - start) * 1000), "pid": os.getpid(), "tid": 0}
+                  for name, start, end in self.spans]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, indent=1)
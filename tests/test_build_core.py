@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025
+# Developer : Mohammed Al-Baqer
+
+import os
+import sys
+
+from BuildCore import BuildCache, BuildRunner, IncrementalWorkspace, JobName, MakeCommands
+
+
+def _script(path, text="print('ok')\n"):
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+def _command(entry, exit_code=0):
+    # Stands in for a pyinstaller command: the entry is the last argument, like MakeCommands emits.
+    return [sys.executable, "-c", f"import sys; print('building', sys.argv[1]); sys.exit({exit_code})", entry]
+
+def _runner(commands, tmp_path, jobs=1, lines=None):
+    return BuildRunner(commands, str(tmp_path), jobs=jobs, on_line=(lines.append if lines is not None else lambda text: None))
+
+
+def test_runner_reports_success_when_every_entry_builds(tmp_path):
+    entries = [_script(tmp_path / f"app{i}.py") for i in range(3)]
+    for jobs in (1, 2):
+        runner = _runner([_command(e) for e in entries], tmp_path, jobs=jobs)
+        assert runner.run() is True
+        assert runner.results == {e: True for e in entries}
+
+def test_runner_reports_failure_and_summary(tmp_path):
+    good, bad = _script(tmp_path / "good.py"), _script(tmp_path / "bad.py")
+    lines = []
+    runner = _runner([_command(good), _command(bad, exit_code=3)], tmp_path, lines=lines)
+    assert runner.run() is False
+    assert runner.results == {good: True, bad: False}
+    assert f"[FAILED] {bad}" in lines
+    assert "1/2 entries built successfully." in lines
+
+def test_runner_counts_commands_sharing_an_entry_once(tmp_path):
+    entry = _script(tmp_path / "a.py")
+    for jobs in (1, 2):
+        runner = _runner([_command(entry), _command(entry)], tmp_path, jobs=jobs)
+        assert runner.run() is True
+        assert runner.results == {entry: True}
+
+def test_runner_stopped_before_run_builds_nothing(tmp_path):
+    entries = [_script(tmp_path / f"app{i}.py") for i in range(2)]
+    runner = _runner([_command(e) for e in entries], tmp_path, jobs=2)
+    runner.stop()
+    assert runner.run() is False
+    assert runner.results == {}
+
+
+def test_make_commands_single_entry_uses_default_workpath(tmp_path):
+    entry = _script(tmp_path / "app.py")
+    cmds = MakeCommands({"last_output": str(tmp_path / "out")}, [entry, str(tmp_path / "deleted.py")], cwd=str(tmp_path))
+    assert cmds == [["pyinstaller", "--distpath", str(tmp_path / "out"), "--clean", "-F", entry]]
+
+def test_make_commands_drops_duplicate_entries(tmp_path):
+    entry = _script(tmp_path / "app.py")
+    same = os.path.join(str(tmp_path), ".", "app.py")
+    cmds = MakeCommands({"last_output": str(tmp_path / "out")}, [entry, same], cwd=str(tmp_path))
+    assert len(cmds) == 1
+
+def test_make_commands_batch_gets_one_workpath_per_job(tmp_path):
+    entries = [_script(tmp_path / "one.py"), _script(tmp_path / "two.py")]
+    settings = {
+        "last_output": str(tmp_path / "out"),
+        "onefile": False,
+        "noconsole": True,
+        "advanced": {"hidden_imports": ["json"], "exclude_modules": ["tkinter"]},
+    }
+    cmds = MakeCommands(settings, entries, cwd=str(tmp_path))
+    assert [c[-1] for c in cmds] == entries
+    for cmd, entry in zip(cmds, entries):
+        job_dir = os.path.join(str(tmp_path), "build", JobName(entry))
+        assert cmd[cmd.index("--workpath") + 1] == job_dir
+        assert cmd[cmd.index("--specpath") + 1] == job_dir
+        assert "-F" not in cmd and "--noconsole" in cmd
+        assert cmd[cmd.index("--hidden-import") + 1] == "json"
+        assert cmd[cmd.index("--exclude-module") + 1] == "tkinter"
+
+def test_make_commands_incremental_keeps_the_workpath(tmp_path):
+    entry = _script(tmp_path / "app.py")
+    (cmd,) = MakeCommands({"last_output": str(tmp_path / "out"), "incremental": True}, [entry], cwd=str(tmp_path))
+    assert "--clean" not in cmd
+    assert cmd[cmd.index("--workpath") + 1] == os.path.join(str(tmp_path), "build", JobName(entry))
+
+def test_make_commands_merge_batch_writes_one_spec(tmp_path):
+    entries = [_script(tmp_path / "one.py"), _script(tmp_path / "two.py")]
+    settings = {"last_output": str(tmp_path / "out"), "merge_batch": True, "merge_name": "tools"}
+    (cmd,) = MakeCommands(settings, entries, cwd=str(tmp_path))
+    assert cmd[0] == "pyinstaller" and cmd[-1].endswith("tools.spec")
+    with open(cmd[-1], "r", encoding="utf-8") as f:
+        spec = f.read()
+    assert "one.py" in spec and "two.py" in spec
+
+def test_make_commands_generate_spec_only(tmp_path):
+    entry = _script(tmp_path / "app.py")
+    (cmd,) = MakeCommands({"last_output": str(tmp_path / "out"), "incremental": True}, [entry], generate_spec_only=True, cwd=str(tmp_path))
+    assert cmd[0] == "pyi-makespec" and "--workpath" not in cmd and cmd[-1] == entry
+
+
+def test_incremental_workspace_cleans_only_when_the_fingerprint_changes(tmp_path):
+    workspace = IncrementalWorkspace()
+    work = str(tmp_path / "work")
+    cmd = [sys.executable, "--workpath", work, "-F", "app.py"]
+    first = workspace.Prepare(cmd)
+    assert first[1] == "--clean"
+    workspace.Commit(first, True)
+    assert workspace.Prepare(cmd) == cmd
+
+    changed = [sys.executable, "--workpath", work, "--noconsole", "app.py"]
+    assert workspace.Prepare(changed)[1] == "--clean"
+
+    workspace.Commit(cmd, False)
+    assert not os.path.exists(os.path.join(work, IncrementalWorkspace.STAMP_FILE))
+    assert workspace.Prepare(cmd)[1] == "--clean"
+
+def test_incremental_workspace_ignores_commands_without_workpath(tmp_path):
+    cmd = [sys.executable, "-F", "app.py"]
+    assert IncrementalWorkspace().Prepare(cmd) == cmd
+
+
+def _cache_command(tmp_path, entry):
+    return [sys.executable, "--distpath", str(tmp_path / "dist"), "--clean", entry]
+
+def _artifact(tmp_path, name, size=16):
+    folder = tmp_path / "dist" / name
+    folder.mkdir(parents=True, exist_ok=True)
+    (folder / "payload.bin").write_bytes(b"x" * size)
+    return folder
+
+def test_cache_key_follows_entry_and_local_imports(tmp_path):
+    cache = BuildCache(str(tmp_path / "cache"))
+    helper = tmp_path / "helper.py"
+    helper.write_text("VALUE = 1\n", encoding="utf-8")
+    entry = _script(tmp_path / "app.py", "import helper\n")
+    cmd = _cache_command(tmp_path, entry)
+    key = cache.Key(cmd)
+
+    assert cache.Key(cmd) == key
+    assert cache.Key([a for a in cmd if a != "--clean"]) == key
+    assert cache.Key(cmd[:-1] + ["--noconsole", entry]) != key
+
+    helper.write_text("VALUE = 2\n", encoding="utf-8")
+    changed = cache.Key(cmd)
+    assert changed != key
+
+    _script(tmp_path / "app.py", "import helper\nprint(helper.VALUE)\n")
+    assert cache.Key(cmd) != changed
+
+def test_cache_store_and_restore_round_trip(tmp_path):
+    cache = BuildCache(str(tmp_path / "cache"))
+    entry = _script(tmp_path / "app.py")
+    cmd = _cache_command(tmp_path, entry)
+    key = cache.Key(cmd)
+    assert cache.Restore(key, cmd, str(tmp_path)) is False
+
+    artifact = _artifact(tmp_path, "app")
+    assert cache.Store(key, cmd, str(tmp_path)) is True
+    (artifact / "payload.bin").unlink()
+
+    assert cache.Restore(key, cmd, str(tmp_path)) is True
+    assert (artifact / "payload.bin").read_bytes() == b"x" * 16
+
+def test_cache_evicts_least_recently_used_artifacts(tmp_path):
+    cache = BuildCache(str(tmp_path / "cache"), max_mb=1)
+    keys = []
+    for name in ("one", "two"):
+        entry = _script(tmp_path / f"{name}.py")
+        cmd = _cache_command(tmp_path, entry)
+        _artifact(tmp_path, name, size=700 * 1024)
+        keys.append(cache.Key(cmd))
+        assert cache.Store(keys[-1], cmd, str(tmp_path))
+
+    index = cache._load_index()
+    assert list(index) == [keys[1]]
+    assert not os.path.exists(os.path.join(str(tmp_path / "cache"), keys[0]))
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025
+# Developer : Mohammed Al-Baqer
+
+import os
+
+from ImportAnalyzer import AuditProject, ParseCache
+
+
+def _write(path, text):
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+def test_audit_follows_local_imports_and_groups_findings(tmp_path):
+    helper = _write(tmp_path / "helper.py", "import subprocess\n\ndef run(cmd):\n    return subprocess.run(cmd)\n\ndef calc(text):\n    return eval(text)\n")
+    entry = _write(tmp_path / "app.py", "import tkinter\nimport helper\n\nwhile True:\n    helper.calc('1')\n")
+    audit = AuditProject([entry], cache=ParseCache(str(tmp_path / "parse_cache.json")))
+
+    assert audit["entries"] == [os.path.abspath(entry)]
+    assert os.path.abspath(entry) in audit["files"] and os.path.abspath(helper) in audit["files"]
+    found = {(os.path.basename(item["file"]), item["rule"], item["line"]) for item in audit["findings"]}
+    assert ("helper.py", "subprocess", 4) in found
+    assert ("helper.py", "eval", 7) in found
+    assert ("app.py", "while-true", 4) in found
+    assert ("app.py", "gui", 1) in found
+    assert audit["counts"] == {"security": 2, "performance": 1, "recommendation": 1}
+    categories = [item["category"] for item in audit["findings"]]
+    assert categories == sorted(categories, key=("security", "performance", "recommendation").index)
+
+def test_audit_of_a_clean_script_has_no_findings(tmp_path):
+    entry = _write(tmp_path / "app.py", "import json\nprint(json.dumps({}))\n")
+    audit = AuditProject([entry], cache=ParseCache(str(tmp_path / "parse_cache.json")))
+    assert audit["findings"] == []
+    assert audit["errors"] == []
+    assert set(audit["counts"].values()) == {0}
+
+def test_audit_reports_syntax_errors(tmp_path):
+    entry = _write(tmp_path / "app.py", "def broken(:\n")
+    audit = AuditProject([entry], cache=ParseCache(str(tmp_path / "parse_cache.json")))
+    assert [os.path.basename(e["file"]) for e in audit["errors"]] == ["app.py"]
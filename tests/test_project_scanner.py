@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025
+# Developer : Mohammed Al-Baqer
+
+import os
+
+from ProjectScanner import ProjectScanner
+
+
+def _tree(tmp_path):
+    root = tmp_path / "project"
+    (root / "pkg").mkdir(parents=True)
+    (root / "node_modules").mkdir()
+    (root / "main.py").write_bytes(b"m" * 100)
+    (root / "pkg" / "data.bin").write_bytes(b"d" * 5000)
+    (root / "pkg" / "util.py").write_bytes(b"u" * 300)
+    (root / "node_modules" / "huge.js").write_bytes(b"n" * 100000)
+    return root
+
+def test_scan_totals_skip_ignored_folders(tmp_path):
+    root = _tree(tmp_path)
+    result = ProjectScanner().Scan(str(root), top_n=2, large_bytes=1000)
+    assert result["files"] == 3
+    assert result["bytes"] == 5400
+    assert result["largest"] == [(str(root / "pkg" / "data.bin"), 5000), (str(root / "pkg" / "util.py"), 300)]
+    assert result["large_files"] == [(str(root / "pkg" / "data.bin"), 5000)]
+    assert result["dirs"] == [("pkg", 5300)]
+
+def test_rescan_sees_files_that_grew_in_place(tmp_path):
+    root = _tree(tmp_path)
+    scanner = ProjectScanner()
+    assert scanner.Scan(str(root))["bytes"] == 5400
+    mtime = os.stat(root / "pkg").st_mtime_ns
+    with open(root / "pkg" / "data.bin", "ab") as f:
+        f.write(b"d" * 20000)
+    assert os.stat(root / "pkg").st_mtime_ns == mtime
+    assert scanner.Scan(str(root))["bytes"] == 25400
+
+def test_rescan_sees_added_and_removed_files(tmp_path):
+    root = _tree(tmp_path)
+    scanner = ProjectScanner()
+    scanner.Scan(str(root))
+    (root / "pkg" / "util.py").unlink()
+    (root / "extra.txt").write_bytes(b"e" * 7)
+    result = scanner.Scan(str(root))
+    assert result["files"] == 3
+    assert result["bytes"] == 5107
+
+def test_scan_of_a_single_file(tmp_path):
+    root = _tree(tmp_path)
+    result = ProjectScanner().Scan(str(root / "main.py"), large_bytes=50)
+    assert result["files"] == 1 and result["bytes"] == 100
+    assert result["large_files"] == [(str(root / "main.py"), 100)]
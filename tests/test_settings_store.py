@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025
+# Developer : Mohammed Al-Baqer
+
+import os
+import json
+
+from SettingsStore import SettingsStore
+
+DEFAULTS = {"language": "en", "advanced": {"hidden_imports": []}}
+
+
+def _store(tmp_path):
+    return SettingsStore(str(tmp_path / "settings.json"), str(tmp_path / "backups"), DEFAULTS)
+
+def _backup(store, keep, stamp):
+    # Pins the mtime so the ring order does not depend on the filesystem's timestamp resolution.
+    created = store.Backup(keep)
+    if created:
+        os.utime(created, ns=(stamp, stamp))
+    return created
+
+def test_missing_file_loads_a_copy_of_the_defaults(tmp_path):
+    store = _store(tmp_path)
+    data = store.Load()
+    assert data == DEFAULTS
+    data["advanced"]["hidden_imports"].append("json")
+    assert DEFAULTS["advanced"]["hidden_imports"] == []
+
+def test_flush_writes_only_when_something_changed(tmp_path):
+    store = _store(tmp_path)
+    store.Load()
+    assert store.Flush() is True
+    assert store.Dirty() == []
+    assert store.Flush() is False
+
+    store.data["language"] = "fr"
+    assert store.Dirty() == ["language"]
+    assert store.Flush() is True
+    with open(store.path, "r", encoding="utf-8") as f:
+        assert json.load(f)["language"] == "fr"
+    assert not os.path.exists(store.path + ".tmp")
+
+def test_backup_ring_is_deduplicated_and_bounded(tmp_path):
+    store = _store(tmp_path)
+    store.Load()
+    created = []
+    for i in range(5):
+        store.data["language"] = f"lang{i}"
+        store.Flush()
+        created.append(_backup(store, keep=3, stamp=(i + 1) * 10**9))
+    assert None not in created
+    assert _backup(store, keep=3, stamp=10 * 10**9) is None
+    assert store._backups() == created[2:]
+
+def test_corrupt_settings_fall_back_to_the_newest_backup(tmp_path):
+    store = _store(tmp_path)
+    store.Load()
+    for i, language in enumerate(("ar", "ru")):
+        store.data["language"] = language
+        store.Flush()
+        _backup(store, keep=10, stamp=(i + 1) * 10**9)
+    with open(store.path, "w", encoding="utf-8") as f:
+        f.write("{ not json")
+
+    recovered = _store(tmp_path)
+    assert recovered.Load()["language"] == "ru"
+    # Loaded from a backup, so the broken file is rewritten on the next flush.
+    assert recovered.Flush() is True
+
+def test_reset_restores_defaults_and_removes_the_file(tmp_path):
+    store = _store(tmp_path)
+    store.Load()
+    store.data["language"] = "zh"
+    store.Flush()
+    store.Reset()
+    assert store.data == DEFAULTS
+    assert not os.path.exists(store.path)